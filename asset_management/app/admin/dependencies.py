@@ -0,0 +1,62 @@
+from dataclasses import dataclass, field
+from typing import Annotated
+
+from fastapi import Depends, HTTPException, status
+from sqlalchemy.orm import Session
+
+from asset_management.app.auth.cache import Principal
+from asset_management.app.auth.dependencies import get_current_principal
+from asset_management.app.club.models import Club
+from asset_management.app.user.models import UserPermission
+from asset_management.database.session import get_session
+
+
+def require_admin(principal: Annotated[Principal, Depends(get_current_principal)]) -> Principal:
+    """관리자 계정만 통과시킵니다."""
+    if not principal.user_values["is_admin"]:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required"
+        )
+    return principal
+
+
+@dataclass
+class AdminContext:
+    """관리자와 관리자가 운영하는 동아리. club은 처음 접근할 때 한 번만 조회합니다."""
+    user_id: str
+    club_id: int
+    session: Session = field(repr=False)
+    _club: Club | None = field(default=None, init=False, repr=False)
+
+    @property
+    def club(self) -> Club:
+        if self._club is None:
+            club = self.session.get(Club, self.club_id)
+            if club is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Club not found"
+                )
+            self._club = club
+        return self._club
+
+
+def get_admin_context(
+    principal: Annotated[Principal, Depends(require_admin)],
+    session: Annotated[Session, Depends(get_session)],
+) -> AdminContext:
+    """관리자 동아리를 principal(캐시)의 동아리 권한에서 찾습니다.
+
+    FastAPI가 요청 안에서 의존성 결과를 재사용하므로 한 요청에 한 번만 만들어집니다.
+    """
+    club_id = next(
+        (club_id for club_id, permission in principal.memberships.items() if permission == UserPermission.ADMIN.value),
+        None,
+    )
+    if club_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Admin club not found"
+        )
+    return AdminContext(user_id=principal.user_id, club_id=club_id, session=session)
@@ -1,5 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Body, UploadFile, File
-from typing import Annotated
+from fastapi import APIRouter, Depends, HTTPException, Query, status, Body, UploadFile, File
+from typing import Annotated, Optional
+from sqlalchemy import delete, func, or_, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 import secrets
 import string
@@ -16,25 +18,66 @@ from asset_management.app.admin.schemas import (
     ClubCodeUpdateRequest,
     ClubCodeUpdateResponse,
     AdminMyClubResponse,
+    BulkApprovalSkipped,
+    BulkUserApprovalRequest,
+    BulkUserApprovalResponse,
 )
+from asset_management.database.pagination import decode_cursor, encode_cursor
 from asset_management.database.session import get_session
 from asset_management.app.auth.utils import hash_password
-from asset_management.app.auth.dependencies import get_current_user
+from asset_management.app.admin.dependencies import AdminContext, get_admin_context, require_admin
+from asset_management.app.auth.cache import Principal
+from asset_management.app.auth.claims import bump_membership_versions
 
 from asset_management.app.assets.schemas import AssetCreateRequest, AssetUpdateRequest
 from asset_management.app.assets.services import AssetService
 from asset_management.app.picture.services import PictureService
-from asset_management.app.picture.schemas import PictureCreateRequest, PictureResponse
+from asset_management.app.picture.schemas import PictureCacheStatsResponse, PictureCreateRequest, PictureResponse
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
 
+CLUB_CODE_ATTEMPTS = 5
+
+
 def generate_club_code(length: int = 6) -> str:
     """Generate random club code (uppercase + digits)"""
     characters = string.ascii_uppercase + string.digits
     return ''.join(secrets.choice(characters) for _ in range(length))
 
 
+def _is_club_code_conflict(error: IntegrityError) -> bool:
+    return "club_code" in str(error.orig)
+
+
+def flush_with_club_code(session: Session, club: Club, club_code: str | None = None) -> None:
+    """club_code를 정해 club을 flush합니다. 중복 여부는 미리 조회하지 않고 unique 제약으로 확인합니다.
+
+    savepoint 안에서 club을 추가/수정하므로 충돌해도 같은 트랜잭션의 다른 변경은 유지되고,
+    club_code를 지정하지 않았으면 새 코드로 다시 시도합니다 (대부분 한 번에 끝남).
+    """
+    attempts = 1 if club_code else CLUB_CODE_ATTEMPTS
+    for _ in range(attempts):
+        try:
+            with session.begin_nested():
+                club.club_code = club_code or generate_club_code()
+                session.add(club)
+                session.flush()
+            return
+        except IntegrityError as error:
+            if not _is_club_code_conflict(error):
+                raise
+    if club_code:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Club code already exists"
+        )
+    raise HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Could not allocate club code"
+    )
+
+
 @router.post(
     "/signup",
     status_code=status.HTTP_201_CREATED,
@@ -58,32 +101,14 @@ def admin_signup(payload: AdminSignupRequest, session: Session = Depends(get_ses
             detail="Club name already exists"
         )
     
-    # Generate or validate unique club code
-    if payload.club_code:
-        existing = session.query(Club).filter(Club.club_code == payload.club_code).first()
-        if existing:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="Club code already exists"
-            )
-        club_code = payload.club_code
-    else:
-        while True:
-            club_code = generate_club_code()
-            existing = session.query(Club).filter(Club.club_code == club_code).first()
-            if not existing:
-                break
-    
-    # Create club
+    # Create club (club_code는 unique 제약으로 중복 확인)
     club = Club(
         name=payload.club_name,
         description=payload.club_description,
-        club_code=club_code,
         location_lat=payload.location_lat,
         location_lng=payload.location_lng,
     )
-    session.add(club)
-    session.flush()  # Get club.id without committing
+    flush_with_club_code(session, club, payload.club_code)  # Get club.id without committing
     
     # Create admin user
     hashed_password = hash_password(payload.password)
@@ -126,52 +151,13 @@ def admin_signup(payload: AdminSignupRequest, session: Session = Depends(get_ses
     summary="Update club code for admin's club",
 )
 def update_club_code(
+    admin: Annotated[AdminContext, Depends(get_admin_context)],
     payload: ClubCodeUpdateRequest = Body(default_factory=ClubCodeUpdateRequest),
-    current_user: User = Depends(get_current_user),
     session: Session = Depends(get_session),
 ):
-    if not current_user.is_admin:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Admin access required"
-        )
+    club = admin.club
 
-    admin_club = session.query(UserClublist).filter(
-        UserClublist.user_id == current_user.id,
-        UserClublist.permission == UserPermission.ADMIN.value
-    ).first()
-
-    if not admin_club:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Admin club not found"
-        )
-
-    club = session.query(Club).filter(Club.id == admin_club.club_id).first()
-    if not club:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Club not found"
-        )
-
-    if payload.club_code:
-        existing = session.query(Club).filter(
-            Club.club_code == payload.club_code,
-            Club.id != club.id
-        ).first()
-        if existing:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="Club code already exists"
-            )
-        club.club_code = payload.club_code
-    else:
-        while True:
-            club_code = generate_club_code()
-            existing = session.query(Club).filter(Club.club_code == club_code).first()
-            if not existing:
-                break
-        club.club_code = club_code
+    flush_with_club_code(session, club, payload.club_code)
     session.commit()
     session.refresh(club)
 
@@ -184,31 +170,9 @@ def update_club_code(
     summary="Get current admin's club",
 )
 def get_my_club(
-    current_user: User = Depends(get_current_user),
-    session: Session = Depends(get_session),
+    admin: Annotated[AdminContext, Depends(get_admin_context)],
 ):
-    if not current_user.is_admin:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Admin access required"
-        )
-
-    admin_club = session.query(UserClublist).filter(
-        UserClublist.user_id == current_user.id,
-        UserClublist.permission == UserPermission.ADMIN.value
-    ).first()
-    if not admin_club:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Admin club not found"
-        )
-
-    club = session.query(Club).filter(Club.id == admin_club.club_id).first()
-    if not club:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Club not found"
-        )
+    club = admin.club
 
     return AdminMyClubResponse(
         club_id=club.id,
@@ -223,36 +187,52 @@ def get_my_club(
     summary="Get pending user applications for admin's club",
 )
 def get_pending_applications(
-    current_user: User = Depends(get_current_user),
+    admin: Annotated[AdminContext, Depends(get_admin_context)],
+    q: Optional[str] = Query(None, min_length=1, max_length=30, description="이름/이메일/학번 앞부분 검색"),
+    cursor: Optional[str] = None,
+    size: int = Query(50, ge=1, le=100),
     session: Session = Depends(get_session)
 ):
-    # Check if user is admin
-    if not current_user.is_admin:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Admin access required"
-        )
-    
-    # Get admin's club
-    admin_club = session.query(UserClublist).filter(
-        UserClublist.user_id == current_user.id,
-        UserClublist.permission == UserPermission.ADMIN.value
-    ).first()
-    
-    if not admin_club:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Admin club not found"
-        )
-    
-    # Get all applicants for this club
-    applicants = session.query(User, UserClublist).join(
-        UserClublist, User.id == UserClublist.user_id
-    ).filter(
-        UserClublist.club_id == admin_club.club_id,
-        UserClublist.permission == UserPermission.APPLICANT.value
+    """가입 신청 목록 (신청 순)
+
+    응답의 next_cursor를 cursor로 넘기면 다음 페이지를 받습니다. total은 검색 조건에 맞는 전체 신청 수입니다."""
+    pending = [
+        UserClublist.club_id == admin.club_id,
+        UserClublist.permission == UserPermission.APPLICANT.value,
+    ]
+    if q:
+        pending.append(or_(
+            User.name.startswith(q, autoescape=True),
+            User.email.startswith(q, autoescape=True),
+            User.student_id.startswith(q, autoescape=True),
+        ))
+
+    after_id = 0
+    if cursor:
+        try:
+            (after_id,) = decode_cursor(cursor)
+            after_id = int(after_id)
+        except (ValueError, TypeError):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor"
+            )
+
+    # (club_id, permission) 인덱스를 따라 신청 id 순으로 size + 1개만 읽는다
+    rows = session.execute(
+        select(User, UserClublist.id)
+        .join(UserClublist, User.id == UserClublist.user_id)
+        .where(*pending, UserClublist.id > after_id)
+        .order_by(UserClublist.id)
+        .limit(size + 1)
     ).all()
-    
+    count = select(func.count()).select_from(UserClublist).where(*pending)
+    if q:
+        count = count.join(User, User.id == UserClublist.user_id)
+    total = session.scalar(count)
+
+    has_next = len(rows) > size
+    rows = rows[:size]
     pending_users = [
         PendingUserDetail(
             id=user.id,
@@ -260,10 +240,71 @@ def get_pending_applications(
             email=user.email,
             student_id=user.student_id,
         )
-        for user, user_club in applicants
+        for user, _ in rows
     ]
     
-    return PendingUsersResponse(users=pending_users)
+    return PendingUsersResponse(
+        users=pending_users,
+        total=total,
+        next_cursor=encode_cursor(rows[-1][1]) if has_next else None,
+    )
+
+
+@router.patch(
+    "/users/approve",
+    response_model=BulkUserApprovalResponse,
+    summary="Approve or reject multiple user applications",
+)
+def bulk_approve_users(
+    payload: BulkUserApprovalRequest,
+    admin: Annotated[AdminContext, Depends(get_admin_context)],
+    session: Session = Depends(get_session)
+):
+    """가입 신청 일괄 승인/거절
+
+    관리자 동아리의 가입대기(APPLICANT) 신청만 대상으로, 승인은 UPDATE 한 번, 거절은 DELETE 한 번으로 반영합니다.
+    해당 동아리에 대기 중인 신청이 없는 id는 skipped에 not_found로 반환됩니다."""
+    approve_ids = list(dict.fromkeys(payload.approved_user_ids))
+    reject_ids = list(dict.fromkeys(payload.rejected_user_ids))
+    pending = (
+        UserClublist.club_id == admin.club_id,
+        UserClublist.permission == UserPermission.APPLICANT.value,
+    )
+
+    # 대상 신청을 잠가서, 동시에 처리된 신청이 결과에 잘못 포함되지 않게 한다
+    found = set(session.scalars(
+        select(UserClublist.user_id)
+        .where(*pending, UserClublist.user_id.in_(approve_ids + reject_ids))
+        .with_for_update()
+    ))
+    approved = [user_id for user_id in approve_ids if user_id in found]
+    rejected = [user_id for user_id in reject_ids if user_id in found]
+
+    if approved:
+        session.execute(
+            update(UserClublist)
+            .where(*pending, UserClublist.user_id.in_(approved))
+            .values(permission=UserPermission.USER.value)
+            .execution_options(synchronize_session=False)
+        )
+    if rejected:
+        session.execute(
+            delete(UserClublist)
+            .where(*pending, UserClublist.user_id.in_(rejected))
+            .execution_options(synchronize_session=False)
+        )
+    bump_membership_versions(session, approved + rejected)
+    session.commit()
+
+    return BulkUserApprovalResponse(
+        approved=approved,
+        rejected=rejected,
+        skipped=[
+            BulkApprovalSkipped(id=user_id, reason="not_found")
+            for user_id in approve_ids + reject_ids
+            if user_id not in found
+        ],
+    )
 
 
 @router.patch(
@@ -274,32 +315,13 @@ def get_pending_applications(
 def approve_user(
     user_id: str,
     payload: UserApprovalRequest,
-    current_user: User = Depends(get_current_user),
+    admin: Annotated[AdminContext, Depends(get_admin_context)],
     session: Session = Depends(get_session)
 ):
-    # Check if user is admin
-    if not current_user.is_admin:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Admin access required"
-        )
-    
-    # Get admin's club
-    admin_club = session.query(UserClublist).filter(
-        UserClublist.user_id == current_user.id,
-        UserClublist.permission == UserPermission.ADMIN.value
-    ).first()
-    
-    if not admin_club:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Admin club not found"
-        )
-    
     # Get user's club application
     user_club = session.query(UserClublist).filter(
         UserClublist.user_id == user_id,
-        UserClublist.club_id == admin_club.club_id
+        UserClublist.club_id == admin.club_id
     ).first()
     
     if not user_club:
@@ -342,93 +364,42 @@ def approve_user(
 @router.post("/assets", status_code=status.HTTP_201_CREATED)
 def add_asset(
     asset: AssetCreateRequest,
-    current_user: Annotated[User, Depends(get_current_user)],
+    admin: Annotated[AdminContext, Depends(get_admin_context)],
     asset_service: Annotated[AssetService, Depends()],
-    session: Session = Depends(get_session)
 ):
-    
-    # Check if user is admin
-    if not current_user.is_admin:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Admin access required"
-        )
-    
-    # Get admin's club
-    admin_club = session.query(UserClublist).filter(
-        UserClublist.user_id == current_user.id,
-        UserClublist.permission == UserPermission.ADMIN.value
-    ).first()
-
-    return asset_service.create_asset_for_admin(admin_club.club_id, asset)
+    return asset_service.create_asset_for_admin(admin.club_id, asset)
     
 
 @router.patch("/assets/{asset_id}", status_code=status.HTTP_200_OK)
 def update_asset(
     asset_id: int,
     asset: AssetUpdateRequest,
-    current_user: Annotated[User, Depends(get_current_user)],
+    admin: Annotated[AdminContext, Depends(get_admin_context)],
     asset_service: Annotated[AssetService, Depends()],
-    session: Session = Depends(get_session)
 ):
-    # Check if user is admin
-    if not current_user.is_admin:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Admin access required"
-        )
-    
-    # Get admin's club
-    admin_club = session.query(UserClublist).filter(
-        UserClublist.user_id == current_user.id,
-        UserClublist.permission == UserPermission.ADMIN.value
-    ).first()
-
-    return asset_service.update_asset_for_admin(admin_club.club_id, asset_id, asset)
+    return asset_service.update_asset_for_admin(admin.club_id, asset_id, asset)
 
 @router.delete("/assets/{asset_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_asset(
     asset_id: int,
-    current_user: Annotated[User, Depends(get_current_user)],
+    admin: Annotated[Principal, Depends(require_admin)],
     asset_service: Annotated[AssetService, Depends()],
 ):
-    # Check if user is admin
-    if not current_user.is_admin:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Admin access required"
-        )
-    
-    
     return asset_service.delete_asset_for_admin(asset_id)
 
 
 @router.post("/assets/{asset_id}/pictures", status_code=status.HTTP_201_CREATED)
 async def add_asset_picture(
     asset_id: int,
-    current_user: Annotated[User, Depends(get_current_user)],
+    admin: Annotated[Principal, Depends(require_admin)],
     picture_service: Annotated[PictureService, Depends()],
-    session: Session = Depends(get_session),
     file: UploadFile = File(...),
     picture_request: PictureCreateRequest = Depends(),
 ):
-    # Check if user is admin
-    if not current_user.is_admin:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Admin access required"
-        )
-    
-    # Get admin's club
-    admin_club = session.query(UserClublist).filter(
-        UserClublist.user_id == current_user.id,
-        UserClublist.permission == UserPermission.ADMIN.value
-    ).first()
-    
     picture_request.asset_id = asset_id
     
     return await picture_service.upload_picture(
-        user_id=current_user.id,
+        user_id=admin.user_id,
         file=file,
         picture_request=picture_request,
     )
@@ -437,32 +408,25 @@ async def add_asset_picture(
 def set_main_asset_picture(
     asset_id: int,
     picture_id: int,
-    current_user: Annotated[User, Depends(get_current_user)],
+    admin: Annotated[Principal, Depends(require_admin)],
     picture_service: Annotated[PictureService, Depends()],
-    session: Session = Depends(get_session),
 ):
-    # Check if user is admin
-    if not current_user.is_admin:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Admin access required"
-        )
-    
     return picture_service.set_main_picture(asset_id, picture_id)
 
 @router.delete("/assets/{asset_id}/pictures/{picture_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_asset_picture(
     asset_id: int,
     picture_id: int,
-    current_user: Annotated[User, Depends(get_current_user)],
+    admin: Annotated[Principal, Depends(require_admin)],
     picture_service: Annotated[PictureService, Depends()],
-    session: Session = Depends(get_session),
 ):
-    # Check if user is admin
-    if not current_user.is_admin:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Admin access required"
-        )
-    
-    return picture_service.delete_picture(picture_id)
\ No newline at end of file
+    return picture_service.delete_picture(picture_id)
+
+
+@router.get("/pictures/cache-stats", status_code=status.HTTP_200_OK)
+def get_picture_cache_stats(
+    admin: Annotated[Principal, Depends(require_admin)],
+    picture_service: Annotated[PictureService, Depends()],
+) -> PictureCacheStatsResponse:
+    """사진 메모리 캐시 적중률과 사용 중인 바이트 (현재 워커 프로세스 기준)"""
+    return picture_service.get_cache_stats()
@@ -1,5 +1,5 @@
 from typing import Optional, List
-from pydantic import BaseModel, Field, EmailStr
+from pydantic import BaseModel, Field, EmailStr, model_validator
 
 
 class AdminSignupRequest(BaseModel):
@@ -48,6 +48,8 @@ class PendingUserDetail(BaseModel):
 
 class PendingUsersResponse(BaseModel):
     users: List[PendingUserDetail]
+    total: int
+    next_cursor: Optional[str] = None
 
 
 class UserApprovalRequest(BaseModel):
@@ -61,6 +63,30 @@ class UserApprovalResponse(BaseModel):
     status: str  # "approved" or "rejected"
 
 
+class BulkUserApprovalRequest(BaseModel):
+    approved_user_ids: List[str] = Field(default_factory=list, max_length=500, description="User ids to approve")
+    rejected_user_ids: List[str] = Field(default_factory=list, max_length=500, description="User ids to reject")
+
+    @model_validator(mode="after")
+    def validate_user_ids(self):
+        if not self.approved_user_ids and not self.rejected_user_ids:
+            raise ValueError("At least one user id is required")
+        if set(self.approved_user_ids) & set(self.rejected_user_ids):
+            raise ValueError("A user cannot be both approved and rejected")
+        return self
+
+
+class BulkApprovalSkipped(BaseModel):
+    id: str
+    reason: str  # not_found
+
+
+class BulkUserApprovalResponse(BaseModel):
+    approved: List[str]
+    rejected: List[str]
+    skipped: List[BulkApprovalSkipped]
+
+
 class ClubCodeUpdateRequest(BaseModel):
     club_code: str = Field(..., min_length=0, max_length=50, description="New club code")
 
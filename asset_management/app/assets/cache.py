@@ -0,0 +1,50 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+
+
+class AvailabilityCache:
+    """동아리 단위 대여 가능 타임라인 캐시 (프로세스 내 메모리).
+
+    동아리별로 (from, to) 조회 결과를 보관하고, 해당 동아리의 스케줄/물품이 바뀌면
+    invalidate(club_id)로 통째로 비웁니다. TTL은 무효화 누락이나 다른 워커 프로세스의
+    변경에 대한 안전장치입니다.
+    """
+
+    def __init__(self, ttl_seconds: float = 60, max_entries_per_club: int = 32) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries_per_club = max_entries_per_club
+        self._entries: dict[int, OrderedDict[Hashable, tuple[float, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, club_id: int, key: Hashable) -> Any | None:
+        with self._lock:
+            entries = self._entries.get(club_id)
+            if not entries or key not in entries:
+                return None
+            expires_at, value = entries[key]
+            if expires_at < time.monotonic():
+                del entries[key]
+                return None
+            entries.move_to_end(key)
+            return value
+
+    def set(self, club_id: int, key: Hashable, value: Any) -> None:
+        with self._lock:
+            entries = self._entries.setdefault(club_id, OrderedDict())
+            entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            entries.move_to_end(key)
+            while len(entries) > self.max_entries_per_club:
+                entries.popitem(last=False)
+
+    def invalidate(self, club_id: int) -> None:
+        with self._lock:
+            self._entries.pop(club_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+AVAILABILITY_CACHE = AvailabilityCache()
@@ -1,10 +1,12 @@
-from sqlalchemy import select
+from sqlalchemy import case, func, select
 from typing import Annotated
 from datetime import datetime
 from fastapi import Depends
 from sqlalchemy.orm import Session
 from asset_management.app.assets.models import Asset
+from asset_management.app.picture.models import Picture
 from asset_management.app.schedule.models import Schedule, Status
+from asset_management.app.schedule.utils import ACTIVE_STATUSES
 from asset_management.database.session import get_session
 
 
@@ -40,6 +42,21 @@ class AssetRepository:
         self.session.delete(asset)
         self.session.commit()
     
+    def get_picture_summaries(self, asset_ids: list[int]) -> dict[int, tuple[int | None, int]]:
+        """물품별 (대표 사진 id, 사진 수)를 (asset_id, is_main) 인덱스만 읽는 GROUP BY 한 번으로 가져옵니다."""
+        if not asset_ids:
+            return {}
+        stmt = (
+            select(
+                Picture.asset_id,
+                func.max(case((Picture.is_main.is_(True), Picture.id))),
+                func.count(Picture.id),
+            )
+            .where(Picture.asset_id.in_(asset_ids))
+            .group_by(Picture.asset_id)
+        )
+        return {asset_id: (main_id, count) for asset_id, main_id, count in self.session.execute(stmt)}
+
     def get_asset_status(self, asset_id: int) -> int:
         """Schedule을 기반으로 물품의 대여 상태 반환 (0: 대여 가능, 1: 대여 중)"""
         active_schedule = self.session.query(Schedule).filter(
@@ -47,3 +64,18 @@ class AssetRepository:
             Schedule.status == Status.IN_USE.value,
         ).first()
         return 1 if active_schedule else 0
+
+    def get_active_intervals(
+        self, start_date: datetime, end_date: datetime, asset_id: int | None = None, club_id: int | None = None
+    ) -> list[tuple[int, datetime, datetime]]:
+        """[start_date, end_date)와 겹치는 활성 예약의 (asset_id, 시작, 끝)을 한 번의 범위 쿼리로 가져옵니다."""
+        query = select(Schedule.asset_id, Schedule.start_date, Schedule.end_date).where(
+            Schedule.status.in_(ACTIVE_STATUSES),
+            Schedule.start_date < end_date,
+            Schedule.end_date > start_date,
+        )
+        if asset_id is not None:
+            query = query.where(Schedule.asset_id == asset_id)
+        if club_id is not None:
+            query = query.where(Schedule.club_id == club_id)
+        return [(row.asset_id, row.start_date, row.end_date) for row in self.session.execute(query)]
@@ -1,8 +1,15 @@
 from datetime import datetime
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Header, status, Response, File, UploadFile
-from asset_management.app.assets.schemas import AssetCreateRequest, AssetResponse, AssetUpdateRequest, ImportResponse
+from fastapi import APIRouter, Depends, HTTPException, Header, Query, status, Response, File, UploadFile
+from asset_management.app.assets.schemas import (
+  AssetAvailabilityResponse,
+  AssetCreateRequest,
+  AssetResponse,
+  AssetUpdateRequest,
+  ClubAvailabilityResponse,
+  ImportResponse,
+)
 from asset_management.app.assets.services import AssetService
 from asset_management.app.picture.services import PictureService
 
@@ -72,4 +79,28 @@ def get_asset_pictures(
 ):
     """특정 asset의 모든 사진 메타데이터 목록을 가져옵니다."""
     pictures = picture_service.list_pictures_by_asset(asset_id)
-    return pictures
\ No newline at end of file
+    return pictures
+
+
+@router.get("/club/{club_id}/availability", status_code=status.HTTP_200_OK)
+def get_club_availability(
+  club_id: int,
+  asset_service: Annotated[AssetService, Depends()],
+  start: datetime | None = Query(None, alias="from"),
+  end: datetime | None = Query(None, alias="to"),
+) -> ClubAvailabilityResponse:
+  """동아리 전체 물품의 대여 가능 수량 타임라인을 조회합니다.
+
+  기본 조회 구간은 오늘 0시부터 14일이며, 결과는 스케줄이 바뀔 때까지 캐시됩니다."""
+  return asset_service.get_club_availability(club_id, start, end)
+
+
+@router.get("/{asset_id}/availability", status_code=status.HTTP_200_OK)
+def get_asset_availability(
+  asset_id: int,
+  asset_service: Annotated[AssetService, Depends()],
+  start: datetime | None = Query(None, alias="from"),
+  end: datetime | None = Query(None, alias="to"),
+) -> AssetAvailabilityResponse:
+  """물품의 대여 가능 수량 타임라인을 조회합니다. (기본 구간: 오늘 0시부터 14일)"""
+  return asset_service.get_asset_availability(asset_id, start, end)
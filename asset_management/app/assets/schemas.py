@@ -24,6 +24,10 @@ class AssetResponse(BaseModel):
     location: Optional[str] = None
     created_at: datetime
 
+    # 물품 목록에서 사진 목록을 따로 조회하지 않도록 함께 내려준다
+    main_picture_id: Optional[int] = None
+    picture_count: int = 0
+
     class Config:
         from_attributes = True
 
@@ -43,3 +47,21 @@ class AssetUpdateRequest(BaseModel):
     quantity: Optional[int] = Field(None, ge=1)
     location: Optional[str] = Field(None, max_length=100)
 
+
+class AvailabilitySlot(BaseModel):
+    start: datetime
+    end: datetime
+    available_quantity: int
+
+
+class AssetAvailabilityResponse(BaseModel):
+    asset_id: int
+    total_quantity: int
+    slots: list[AvailabilitySlot]
+
+
+class ClubAvailabilityResponse(BaseModel):
+    club_id: int
+    start: datetime
+    end: datetime
+    assets: list[AssetAvailabilityResponse]
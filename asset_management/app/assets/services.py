@@ -1,14 +1,44 @@
 import csv
-from datetime import datetime
+from collections import defaultdict
+from datetime import datetime, timedelta
 from io import StringIO, BytesIO
 from typing import Annotated, List
 
-from fastapi import Depends, UploadFile
+from fastapi import Depends, HTTPException, UploadFile
 from openpyxl import Workbook, load_workbook
 from openpyxl.utils import get_column_letter
+from asset_management.app.assets.cache import AVAILABILITY_CACHE
 from asset_management.app.assets.repositories import AssetRepository
-from asset_management.app.assets.schemas import AssetCreateRequest, AssetResponse, AssetUpdateRequest
+from asset_management.app.assets.schemas import (
+    AssetAvailabilityResponse,
+    AssetCreateRequest,
+    AssetResponse,
+    AssetUpdateRequest,
+    AvailabilitySlot,
+    ClubAvailabilityResponse,
+)
 from asset_management.app.assets.models import Asset
+from asset_management.app.schedule.utils import free_timeline
+
+AVAILABILITY_DEFAULT_DAYS = 14
+AVAILABILITY_MAX_DAYS = 92
+
+
+def _resolve_period(start: datetime | None, end: datetime | None) -> tuple[datetime, datetime]:
+    """조회 구간 기본값(오늘 0시부터 14일)을 채우고, 스케줄과 비교할 수 있게 naive local time으로 맞춥니다."""
+    if start is not None and start.tzinfo is not None:
+        start = start.astimezone().replace(tzinfo=None)
+    if end is not None and end.tzinfo is not None:
+        end = end.astimezone().replace(tzinfo=None)
+    if start is None:
+        start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    if end is None:
+        end = start + timedelta(days=AVAILABILITY_DEFAULT_DAYS)
+    if end <= start:
+        raise HTTPException(status_code=400, detail="'to' must be after 'from'")
+    if end - start > timedelta(days=AVAILABILITY_MAX_DAYS):
+        raise HTTPException(status_code=400, detail=f"Period must be at most {AVAILABILITY_MAX_DAYS} days")
+    return start, end
 
 
 class AssetService:
@@ -34,6 +64,7 @@ class AssetService:
         )
 
         self.asset_repository.create_asset(new_asset)
+        AVAILABILITY_CACHE.invalidate(admin_club_id)
 
         return AssetResponse(
             id=new_asset.id,
@@ -67,6 +98,7 @@ class AssetService:
             available_quantity=asset_request.quantity,
             location=asset_request.location,
         )
+        AVAILABILITY_CACHE.invalidate(updated_asset.club_id)
 
         return AssetResponse(
             id=updated_asset.id,
@@ -87,10 +119,13 @@ class AssetService:
         if asset is None:
             raise Exception("ItemNotFoundException")  # Replace with proper exception
         
+        club_id = asset.club_id
         self.asset_repository.delete_asset(asset)
+        AVAILABILITY_CACHE.invalidate(club_id)
 
     def list_assets_for_club(self, club_id: int) -> List[AssetResponse]:
         assets = self.asset_repository.get_all_assets_in_club(club_id)
+        pictures = self.asset_repository.get_picture_summaries([asset.id for asset in assets])
         return [
             AssetResponse(
                 id=asset.id,
@@ -104,10 +139,57 @@ class AssetService:
                 available_quantity=asset.available_quantity,
                 location=asset.location,
                 created_at=asset.created_at,
+                main_picture_id=pictures.get(asset.id, (None, 0))[0],
+                picture_count=pictures.get(asset.id, (None, 0))[1],
             )
             for asset in assets
         ]
     
+    def get_asset_availability(
+        self, asset_id: int, start: datetime | None = None, end: datetime | None = None
+    ) -> AssetAvailabilityResponse:
+        start, end = _resolve_period(start, end)
+        asset = self.asset_repository.get_asset_by_id(asset_id)
+        if asset is None:
+            raise HTTPException(status_code=404, detail="Asset not found")
+
+        intervals = [(s, e) for _, s, e in self.asset_repository.get_active_intervals(start, end, asset_id=asset_id)]
+        return self._to_availability(asset, intervals, start, end)
+
+    def get_club_availability(
+        self, club_id: int, start: datetime | None = None, end: datetime | None = None
+    ) -> ClubAvailabilityResponse:
+        start, end = _resolve_period(start, end)
+        cached = AVAILABILITY_CACHE.get(club_id, (start, end))
+        if cached is not None:
+            return cached
+
+        assets = self.asset_repository.get_all_assets_in_club(club_id)
+        intervals_by_asset = defaultdict(list)
+        for asset_id, s, e in self.asset_repository.get_active_intervals(start, end, club_id=club_id):
+            intervals_by_asset[asset_id].append((s, e))
+
+        response = ClubAvailabilityResponse(
+            club_id=club_id,
+            start=start,
+            end=end,
+            assets=[self._to_availability(asset, intervals_by_asset[asset.id], start, end) for asset in assets],
+        )
+        AVAILABILITY_CACHE.set(club_id, (start, end), response)
+        return response
+
+    def _to_availability(
+        self, asset: Asset, intervals: list[tuple[datetime, datetime]], start: datetime, end: datetime
+    ) -> AssetAvailabilityResponse:
+        return AssetAvailabilityResponse(
+            asset_id=asset.id,
+            total_quantity=asset.total_quantity,
+            slots=[
+                AvailabilitySlot(start=s, end=e, available_quantity=free)
+                for s, e, free in free_timeline(intervals, asset.total_quantity, start, end)
+            ],
+        )
+
     def generate_import_template(self) -> bytes:
         wb = Workbook()
         ws = wb.active
@@ -159,6 +241,8 @@ class AssetService:
                 imported_count += 1
             except Exception as e:
                 failed.append({"row": row_dict if 'row_dict' in locals() else row, "error": str(e)})
+        if imported_count:
+            AVAILABILITY_CACHE.invalidate(club_id)
         return {"imported": imported_count, "failed": failed}
         
         
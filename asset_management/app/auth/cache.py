@@ -0,0 +1,104 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from asset_management.app.user.models import User, UserClublist
+
+_USER_COLUMNS = tuple(column.key for column in User.__table__.columns)
+
+
+@dataclass(frozen=True)
+class Principal:
+    """인증된 사용자 스냅샷. user_values는 User 컬럼 값, memberships는 club_id -> permission."""
+    user_id: str
+    user_values: dict = field(repr=False)
+    memberships: dict[int, int]
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        return cls(
+            user_id=user.id,
+            user_values={key: getattr(user, key) for key in _USER_COLUMNS},
+            memberships={m.club_id: m.permission for m in user.user_clublists},
+        )
+
+
+class PrincipalCache:
+    """get_current_user용 인증 사용자 캐시 (프로세스 내 메모리).
+
+    User / UserClublist가 ORM으로 바뀌면 세션 이벤트에서 해당 사용자를 바로 비웁니다.
+    TTL은 다른 워커 프로세스에서의 변경에 대한 안전장치이므로 짧게 둡니다.
+    """
+
+    def __init__(self, ttl_seconds: float = 30, max_entries: int = 2048) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, Principal]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id: str) -> Principal | None:
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            expires_at, principal = entry
+            if expires_at < time.monotonic():
+                del self._entries[user_id]
+                return None
+            self._entries.move_to_end(user_id)
+            return principal
+
+    def set(self, principal: Principal) -> None:
+        with self._lock:
+            self._entries[principal.user_id] = (time.monotonic() + self.ttl_seconds, principal)
+            self._entries.move_to_end(principal.user_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: str) -> None:
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+PRINCIPAL_CACHE = PrincipalCache()
+
+_PENDING_KEY = "principal_cache_invalidations"
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_principal_changes(session: Session, flush_context) -> None:
+    user_ids = session.info.setdefault(_PENDING_KEY, set())
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(instance, User):
+            user_ids.add(instance.id)
+        elif isinstance(instance, UserClublist):
+            user_ids.add(instance.user_id)
+    # 커밋 전에 다른 요청이 옛 값을 다시 캐시하지 않도록 flush 시점에도 비운다
+    for user_id in user_ids:
+        PRINCIPAL_CACHE.invalidate(user_id)
+
+
+def invalidate_principals_on_commit(session: Session, user_ids) -> None:
+    """bulk UPDATE/DELETE처럼 flush 이벤트를 거치지 않는 변경에 대해 직접 호출합니다."""
+    session.info.setdefault(_PENDING_KEY, set()).update(user_ids)
+    for user_id in user_ids:
+        PRINCIPAL_CACHE.invalidate(user_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_principals(session: Session) -> None:
+    for user_id in session.info.pop(_PENDING_KEY, ()):
+        PRINCIPAL_CACHE.invalidate(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_principal_changes(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
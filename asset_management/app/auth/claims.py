@@ -0,0 +1,114 @@
+from dataclasses import dataclass
+from typing import Annotated
+
+from fastapi import Depends, HTTPException, status
+from sqlalchemy import event, inspect, select, update
+from sqlalchemy.orm import Session
+
+from asset_management.app.auth.cache import invalidate_principals_on_commit
+from asset_management.app.auth.settings import AUTH_SETTINGS
+from asset_management.app.auth.utils import decode_token, get_header_token
+from asset_management.app.user.models import User, UserClublist
+from asset_management.database.session import get_session
+
+
+@event.listens_for(Session, "before_flush")
+def _bump_membership_versions(session: Session, flush_context, instances) -> None:
+    user_ids = set()
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(instance, UserClublist):
+            # relationship으로만 연결된 경우 user_id가 아직 없을 수 있음
+            user_ids.add(instance.user_id or (instance.user.id if instance.user else None))
+        elif isinstance(instance, User) and inspect(instance).attrs.is_admin.history.has_changes():
+            user_ids.add(instance.id)
+
+    with session.no_autoflush:
+        for user_id in user_ids - {None}:
+            user = session.get(User, user_id)
+            if user is None or user in session.deleted or user in session.new:
+                continue
+            user.membership_version = (user.membership_version or 0) + 1
+
+
+def bump_membership_versions(session: Session, user_ids: list[str]) -> None:
+    """bulk UPDATE/DELETE로 동아리 권한을 바꾼 뒤 호출합니다 (before_flush를 거치지 않으므로).
+
+    membership_version을 올리고, 커밋되면 principal 캐시에서도 지워지도록 기록합니다.
+    """
+    if not user_ids:
+        return
+    session.execute(
+        update(User)
+        .where(User.id.in_(user_ids))
+        .values(membership_version=User.membership_version + 1)
+        .execution_options(synchronize_session=False)
+    )
+    invalidate_principals_on_commit(session, user_ids)
+
+
+def build_claims(user: User, memberships: list[tuple[int, int]]) -> dict:
+    """access token에 넣을 권한 claim. adm: 관리자 여부, clb: {club_id: permission}, mv: membership_version"""
+    return {
+        "adm": int(user.is_admin),
+        "clb": {str(club_id): permission for club_id, permission in memberships},
+        "mv": user.membership_version,
+    }
+
+
+@dataclass(frozen=True)
+class AccessClaims:
+    user_id: str
+    is_admin: bool
+    clubs: dict[int, int]
+    membership_version: int
+
+    def club_permission(self, club_id: int) -> int:
+        """동아리 권한 (0: 회원, 1: 관리자, 2: 가입대기).
+
+        Raises:
+            HTTPException(403): 동아리에 속하지 않을 때
+        """
+        permission = self.clubs.get(club_id)
+        if permission is None:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Permission denied")
+        return permission
+
+
+def login_with_claims(
+    token: Annotated[str, Depends(get_header_token)],
+    session: Annotated[Session, Depends(get_session)],
+) -> AccessClaims:
+    """access token의 권한 claim으로 인증/인가 정보를 만듭니다.
+
+    모든 워커가 같이 보는 DB의 membership_version을 PK로 읽어 토큰의 mv와 같을 때만 claim을 믿고,
+    다르거나 claim이 없으면(이전에 발급된 토큰) 동아리 권한을 DB에서 읽습니다.
+    """
+    claims = decode_token(token, AUTH_SETTINGS.ACCESS_TOKEN_SECRET, "access")
+    user_id = claims.get("sub")
+    current = session.execute(
+        select(User.is_admin, User.membership_version).where(User.id == user_id)
+    ).one_or_none()
+    if current is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    if claims.get("mv") is not None and claims["mv"] == current.membership_version:
+        return AccessClaims(
+            user_id=user_id,
+            is_admin=current.is_admin,
+            clubs={int(club_id): permission for club_id, permission in claims.get("clb", {}).items()},
+            membership_version=current.membership_version,
+        )
+
+    memberships = session.execute(
+        select(UserClublist.club_id, UserClublist.permission).where(UserClublist.user_id == user_id)
+    ).all()
+    return AccessClaims(
+        user_id=user_id,
+        is_admin=current.is_admin,
+        clubs={club_id: permission for club_id, permission in memberships},
+        membership_version=current.membership_version,
+    )
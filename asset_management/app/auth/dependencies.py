@@ -1,24 +1,47 @@
 from typing import Annotated
 
 from fastapi import Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, make_transient_to_detached, selectinload
 
+from asset_management.app.auth.cache import PRINCIPAL_CACHE, Principal
 from asset_management.app.auth.settings import AUTH_SETTINGS
 from asset_management.app.auth.utils import get_header_token, verify_token
 from asset_management.app.user.models import User
 from asset_management.database.session import get_session
 
 
-def get_current_user(
+def get_current_principal(
     token: Annotated[str, Depends(get_header_token)],
     session: Annotated[Session, Depends(get_session)],
-) -> User:
+) -> Principal:
+    """인증된 사용자와 동아리별 권한. 캐시에 있으면 DB를 조회하지 않습니다."""
     user_id = verify_token(token, AUTH_SETTINGS.ACCESS_TOKEN_SECRET, "access")
-    user = session.query(User).filter(User.id == user_id).first()
+    principal = PRINCIPAL_CACHE.get(user_id)
+    if principal is not None:
+        return principal
+
+    user = (
+        session.query(User)
+        .options(selectinload(User.user_clublists))
+        .filter(User.id == user_id)
+        .first()
+    )
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    return user
+    principal = Principal.from_user(user)
+    PRINCIPAL_CACHE.set(principal)
+    return principal
+
+
+def get_current_user(
+    principal: Annotated[Principal, Depends(get_current_principal)],
+    session: Annotated[Session, Depends(get_session)],
+) -> User:
+    # 캐시된 값으로 만든 User를 쿼리 없이 세션에 붙인다 (관계는 접근할 때 lazy load)
+    user = User(**principal.user_values)
+    make_transient_to_detached(user)
+    return session.merge(user, load=False)
@@ -0,0 +1,135 @@
+import json
+import re
+import threading
+import time
+import urllib.request
+from abc import ABC, abstractmethod
+from functools import lru_cache
+
+from authlib.jose import JsonWebKey, JsonWebToken, KeySet
+
+from asset_management.app.auth.settings import AUTH_SETTINGS
+
+GOOGLE_ISSUERS = ["accounts.google.com", "https://accounts.google.com"]
+# Google은 RS256으로만 서명함. 기본 jwt는 alg=none 등 모든 알고리즘을 받으므로 따로 제한한다
+_ID_TOKEN_JWT = JsonWebToken(["RS256"])
+_MAX_AGE = re.compile(r"max-age=(\d+)")
+
+
+class KeySource(ABC):
+    """Google ID token 서명 검증용 JWKS 공급원."""
+
+    @abstractmethod
+    def fetch(self) -> tuple[dict, float]:
+        """(JWKS, 캐시해도 되는 초) 를 반환합니다."""
+
+
+class HttpKeySource(KeySource):
+    """JWKS URL에서 키를 받아오며, Cache-Control max-age(에서 Age를 뺀 값)만큼 캐시합니다."""
+
+    def __init__(self, url: str, timeout: float = 5, default_max_age: float = 3600) -> None:
+        self.url = url
+        self.timeout = timeout
+        self.default_max_age = default_max_age
+
+    def fetch(self) -> tuple[dict, float]:
+        with urllib.request.urlopen(self.url, timeout=self.timeout) as response:
+            jwks = json.loads(response.read().decode("utf-8"))
+            match = _MAX_AGE.search(response.headers.get("Cache-Control", ""))
+            age = int(response.headers.get("Age", 0) or 0)
+        max_age = int(match.group(1)) - age if match else self.default_max_age
+        return jwks, max(max_age, 0)
+
+
+class StaticKeySource(KeySource):
+    """고정된 JWKS (테스트나 외부 통신이 없는 환경용)."""
+
+    def __init__(self, jwks: dict, max_age: float = float("inf")) -> None:
+        self.jwks = jwks
+        self.max_age = max_age
+
+    def fetch(self) -> tuple[dict, float]:
+        return self.jwks, self.max_age
+
+
+class GoogleKeyCache:
+    """JWKS 메모리 캐시 (프로세스당 하나).
+
+    만료 전에는 네트워크 없이 키를 돌려주고, 모르는 kid가 오면 키 교체로 보고 다시 받습니다.
+    다시 받기는 min_refresh_seconds에 한 번으로 제한하며, 받기에 실패하면 이전 키를 계속 씁니다.
+    """
+
+    def __init__(self, source: KeySource, min_refresh_seconds: float = 60) -> None:
+        self.source = source
+        self.min_refresh_seconds = min_refresh_seconds
+        self._key_set: KeySet | None = None
+        self._expires_at = 0.0
+        self._fetched_at = float("-inf")
+        self._lock = threading.Lock()
+
+    def get_key(self, kid: str | None):
+        if not kid:
+            raise ValueError("Missing key id")
+        now = time.monotonic()
+        key_set = self._key_set
+        if key_set is None or now >= self._expires_at:
+            key_set = self._refresh(force=key_set is None)
+        key = _find_key(key_set, kid)
+        if key is None and now - self._fetched_at >= self.min_refresh_seconds:
+            key = _find_key(self._refresh(force=True), kid)
+        if key is None:
+            raise ValueError(f"Unknown key id: {kid}")
+        return key
+
+    def _refresh(self, force: bool) -> KeySet:
+        with self._lock:
+            # 다른 스레드가 방금 받아왔으면 그대로 씀
+            if self._key_set is not None and not force and time.monotonic() < self._expires_at:
+                return self._key_set
+            try:
+                jwks, max_age = self.source.fetch()
+            except Exception:
+                if self._key_set is None:
+                    raise
+                return self._key_set
+            now = time.monotonic()
+            self._key_set = JsonWebKey.import_key_set(jwks)
+            self._fetched_at = now
+            self._expires_at = now + max_age
+            return self._key_set
+
+
+def _find_key(key_set: KeySet, kid: str):
+    for key in key_set.keys:
+        if key.kid == kid:
+            return key
+    return None
+
+
+class GoogleIdTokenVerifier:
+    """Google ID token의 서명/발급자/대상/만료를 로컬에서 검증합니다."""
+
+    def __init__(self, keys: GoogleKeyCache, client_id: str, leeway: int = 60) -> None:
+        self.keys = keys
+        self.client_id = client_id
+        self.leeway = leeway
+
+    def verify(self, id_token: str) -> dict:
+        """검증된 claim을 반환합니다. 실패하면 authlib JoseError 또는 ValueError를 던집니다."""
+        claims = _ID_TOKEN_JWT.decode(
+            id_token,
+            lambda header, payload: self.keys.get_key(header.get("kid")),
+            claims_options={
+                "iss": {"essential": True, "values": GOOGLE_ISSUERS},
+                "aud": {"essential": True, "value": self.client_id},
+                "exp": {"essential": True},
+            },
+        )
+        claims.validate(leeway=self.leeway)
+        return dict(claims)
+
+
+@lru_cache
+def get_google_keys() -> GoogleKeyCache:
+    """FastAPI dependency. 테스트에서는 StaticKeySource로 만든 캐시로 바꿔 끼웁니다."""
+    return GoogleKeyCache(HttpKeySource(AUTH_SETTINGS.GOOGLE_JWKS_URL, timeout=AUTH_SETTINGS.GOOGLE_JWKS_TIMEOUT))
@@ -1,5 +1,5 @@
 from typing import TYPE_CHECKING
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime
+from sqlalchemy import Column, Index, Integer, String, ForeignKey, DateTime
 from sqlalchemy.orm import relationship, mapped_column
 from datetime import datetime
 from asset_management.database.common import Base
@@ -10,10 +10,16 @@ if TYPE_CHECKING:
 class RefreshToken(Base):
     __tablename__ = "refresh_tokens"
 
+    __table_args__ = (
+        # 사용자별 유효 토큰 수 제한 (user_id, expires_at 순으로 오래된 것부터 정리)
+        Index("ix_refresh_tokens_user_id_expires_at", "user_id", "expires_at"),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
-    token = Column(String(255), unique=True, index=True) # 토큰 값으로 조회를 많이 하므로 Index 필수
-    expires_at = Column(DateTime, nullable=False) # 만료 시간
-    created_at = Column(DateTime, default=datetime.now())
+    # 토큰 원문 대신 SHA-256 hex를 저장 (DB가 유출돼도 토큰을 쓸 수 없고, 길이가 고정됨)
+    token_hash = Column(String(64), unique=True, index=True, nullable=False)
+    expires_at = Column(DateTime, nullable=False, index=True) # 만료 시간 (purge_tokens에서 사용)
+    created_at = Column(DateTime, default=datetime.now)
     
     # 외래키 설정
     user_id = mapped_column(String(36), ForeignKey("user.id"), nullable=False)
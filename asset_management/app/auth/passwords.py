@@ -0,0 +1,88 @@
+import base64
+import hashlib
+import hmac
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+
+from asset_management.app.auth.settings import AUTH_SETTINGS
+
+_SCHEME = "scrypt"
+_SALT_BYTES = 16
+_KEY_BYTES = 32
+
+
+class PasswordHasher:
+    """scrypt 비밀번호 해시.
+
+    KDF는 크기가 제한된 스레드 풀에서 실행합니다 (hashlib.scrypt는 GIL을 놓음).
+    동시에 도는 KDF 수가 workers로 묶이므로 로그인이 몰려도 메모리(약 128 * n * r 바이트/건)와
+    요청 스레드가 고갈되지 않습니다.
+    저장 형식: scrypt$n$r$p$salt$hash (salt, hash는 base64)
+    """
+
+    def __init__(self, n: int, r: int, p: int, workers: int) -> None:
+        self.n = n
+        self.r = r
+        self.p = p
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+
+    def hash(self, password: str) -> str:
+        salt = os.urandom(_SALT_BYTES)
+        key = self._derive(password, salt, self.n, self.r, self.p)
+        return "$".join((_SCHEME, str(self.n), str(self.r), str(self.p), _b64encode(salt), _b64encode(key)))
+
+    def verify(self, password: str, hashed_password: str | None) -> bool:
+        if not hashed_password:
+            return False
+        if not hashed_password.startswith(_SCHEME + "$"):
+            # 이전 형식: salt 없는 SHA-256 hex
+            legacy = hashlib.sha256(password.encode("utf-8")).hexdigest()
+            return hmac.compare_digest(legacy, hashed_password)
+        try:
+            _, n, r, p, salt, key = hashed_password.split("$")
+            expected = _b64decode(key)
+            derived = self._derive(password, _b64decode(salt), int(n), int(r), int(p))
+        except ValueError:
+            return False
+        return hmac.compare_digest(derived, expected)
+
+    @cached_property
+    def dummy_hash(self) -> str:
+        """없는 계정으로 로그인할 때 대신 검증할 해시 (현재 비용 파라미터로 한 번만 만듦).
+
+        있는 계정과 같은 비용이 들어 계정 존재 여부가 응답 시간으로 드러나지 않습니다.
+        """
+        return self.hash(_b64encode(os.urandom(_SALT_BYTES)))
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """이전 형식이거나 현재 설정과 비용 파라미터가 다르면 True"""
+        return hashed_password.split("$")[:4] != [_SCHEME, str(self.n), str(self.r), str(self.p)]
+
+    def _derive(self, password: str, salt: bytes, n: int, r: int, p: int) -> bytes:
+        return self._executor.submit(
+            hashlib.scrypt,
+            password.encode("utf-8"),
+            salt=salt,
+            n=n,
+            r=r,
+            p=p,
+            maxmem=128 * r * (n + p + 2) + 1024 * 1024,
+            dklen=_KEY_BYTES,
+        ).result()
+
+
+def _b64encode(value: bytes) -> str:
+    return base64.b64encode(value).decode("ascii").rstrip("=")
+
+
+def _b64decode(value: str) -> bytes:
+    return base64.b64decode(value + "=" * (-len(value) % 4))
+
+
+PASSWORD_HASHER = PasswordHasher(
+    AUTH_SETTINGS.PASSWORD_SCRYPT_N,
+    AUTH_SETTINGS.PASSWORD_SCRYPT_R,
+    AUTH_SETTINGS.PASSWORD_SCRYPT_P,
+    AUTH_SETTINGS.PASSWORD_HASH_WORKERS,
+)
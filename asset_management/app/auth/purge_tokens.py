@@ -0,0 +1,45 @@
+"""만료된 refresh token을 지우는 배치 작업
+
+    python -m asset_management.app.auth.purge_tokens [--batch-size N]
+
+expires_at 인덱스를 따라 한 번에 batch_size개씩 지우고 커밋하므로 테이블을 오래 잠그지 않습니다.
+"""
+import argparse
+from datetime import datetime
+
+from sqlalchemy.orm import Session
+
+from asset_management.app.auth.repositories import AuthRepository
+from asset_management.app.auth.settings import AUTH_SETTINGS
+
+
+def purge_expired_refresh_tokens(
+  session: Session,
+  batch_size: int = AUTH_SETTINGS.REFRESH_TOKEN_PURGE_BATCH_SIZE,
+) -> int:
+  """실행 시점에 이미 만료된 refresh token을 모두 지우고 지운 개수를 반환합니다."""
+  repository = AuthRepository(session)
+  before = datetime.now()
+
+  purged = 0
+  while True:
+    count = repository.purge_expired_refresh_tokens(before, batch_size)
+    purged += count
+    if count < batch_size:
+      return purged
+
+
+def main() -> None:
+  from asset_management.database.session import session_scope
+
+  parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+  parser.add_argument("--batch-size", type=int, default=AUTH_SETTINGS.REFRESH_TOKEN_PURGE_BATCH_SIZE)
+  args = parser.parse_args()
+
+  with session_scope() as session:
+    purged = purge_expired_refresh_tokens(session, args.batch_size)
+  print(f"purged {purged} refresh tokens")
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,190 @@
+import json
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from asset_management.app.auth.settings import AUTH_SETTINGS
+
+# 한도가 걸린 요청 본문의 최대 크기 (로그인/가입 JSON은 이보다 작음). 넘으면 413
+_MAX_KEY_BODY_BYTES = 4096
+
+
+@dataclass(frozen=True)
+class Bucket:
+    """capacity개까지 쌓이고 초당 refill_per_second개씩 채워지는 토큰 버킷."""
+    capacity: float
+    refill_per_second: float
+
+    @classmethod
+    def per_minute(cls, burst: int, per_minute: float) -> "Bucket":
+        return cls(burst, per_minute / 60)
+
+
+class RateLimitBackend(ABC):
+    """버킷 상태 저장소. 여러 워커가 한도를 공유하려면 Redis 등으로 구현해 바꿔 끼웁니다."""
+
+    @abstractmethod
+    def take(self, key: str, bucket: Bucket, cost: float = 1) -> float:
+        """토큰을 cost만큼 꺼냅니다. 허용되면 0, 아니면 다시 시도할 수 있을 때까지의 초를 반환합니다."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        ...
+
+
+class MemoryBackend(RateLimitBackend):
+    """프로세스 내 메모리 버킷. 오래 안 쓰인 키부터 max_keys개까지만 유지합니다."""
+
+    def __init__(self, max_keys: int = 100_000) -> None:
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take(self, key: str, bucket: Bucket, cost: float = 1) -> float:
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated_at = self._buckets.get(key, (bucket.capacity, now))
+            tokens = min(bucket.capacity, tokens + (now - updated_at) * bucket.refill_per_second)
+            if tokens >= cost:
+                tokens -= cost
+                retry_after = 0.0
+            else:
+                retry_after = (cost - tokens) / bucket.refill_per_second if bucket.refill_per_second else math.inf
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        return retry_after
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+
+@dataclass(frozen=True)
+class RateLimitRule:
+    """한 엔드포인트의 한도. IP별 버킷과 (본문의 email 기준) 계정별 버킷을 모두 통과해야 합니다."""
+    method: str
+    path: str
+    per_ip: Bucket
+    per_account: Bucket | None = None
+    account_field: str = "email"
+
+
+class RateLimitMiddleware:
+    """토큰 버킷 rate limiter (ASGI 미들웨어).
+
+    라우터/의존성보다 앞에서 동작하므로, 거부된 요청은 DB 세션을 잡거나 비밀번호를 해시하지 않습니다.
+    한도를 넘으면 429와 Retry-After를 반환합니다.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        rules: list[RateLimitRule],
+        backend: RateLimitBackend,
+        trust_forwarded: bool = False,
+    ) -> None:
+        self.app = app
+        self.rules = {(rule.method, rule.path): rule for rule in rules}
+        self.backend = backend
+        self.trust_forwarded = trust_forwarded
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        rule = self.rules.get((scope.get("method"), scope.get("path"))) if scope["type"] == "http" else None
+        if rule is None:
+            await self.app(scope, receive, send)
+            return
+
+        retry_after = self.backend.take(f"ip:{rule.path}:{self._client_ip(scope)}", rule.per_ip)
+        if not retry_after and rule.per_account is not None:
+            body, receive = await _buffer_body(receive)
+            if len(body) > _MAX_KEY_BODY_BYTES:
+                # 본문을 부풀려 계정 한도를 피하지 못하도록, 로그인/가입 본문은 이 크기를 넘을 수 없음
+                await _send_error(send, 413, "Request body too large")
+                return
+            # 계정을 알 수 없는 본문은 모두 한 버킷을 같이 씀
+            account = _account_key(body, rule.account_field) or "<unparsed>"
+            retry_after = self.backend.take(f"account:{rule.path}:{account}", rule.per_account)
+
+        if retry_after:
+            await _too_many_requests(send, retry_after)
+            return
+        await self.app(scope, receive, send)
+
+    def _client_ip(self, scope: Scope) -> str:
+        if self.trust_forwarded:
+            for name, value in scope.get("headers", ()):
+                if name == b"x-forwarded-for":
+                    return value.decode("latin-1").split(",")[0].strip()
+        client = scope.get("client")
+        return client[0] if client else "unknown"
+
+
+async def _buffer_body(receive: Receive) -> tuple[bytes, Receive]:
+    """요청 본문을 (최대 _MAX_KEY_BODY_BYTES까지) 읽고, 읽은 메시지를 다시 흘려주는 receive를 반환합니다."""
+    messages: list[Message] = []
+    size = 0
+    while size <= _MAX_KEY_BODY_BYTES:
+        message = await receive()
+        messages.append(message)
+        if message["type"] != "http.request":
+            break
+        size += len(message.get("body", b""))
+        if not message.get("more_body", False):
+            break
+
+    async def replay() -> Message:
+        if messages:
+            return messages.pop(0)
+        return await receive()
+
+    body = b"".join(m.get("body", b"") for m in messages if m["type"] == "http.request")
+    return body, replay
+
+
+def _account_key(body: bytes, field: str) -> str | None:
+    try:
+        value = json.loads(body).get(field)
+    except (ValueError, AttributeError):
+        return None
+    return value.strip().lower() if isinstance(value, str) and value.strip() else None
+
+
+async def _too_many_requests(send: Send, retry_after: float) -> None:
+    retry_after_header = (b"retry-after", str(max(1, math.ceil(min(retry_after, 86400)))).encode("latin-1"))
+    await _send_error(send, 429, "Too many requests", (retry_after_header,))
+
+
+async def _send_error(send: Send, status: int, detail: str, headers: tuple[tuple[bytes, bytes], ...] = ()) -> None:
+    body = json.dumps({"detail": detail}).encode("utf-8")
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode("latin-1")),
+            *headers,
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+def default_rules() -> list[RateLimitRule]:
+    per_ip = Bucket.per_minute(AUTH_SETTINGS.RATE_LIMIT_IP_BURST, AUTH_SETTINGS.RATE_LIMIT_IP_PER_MINUTE)
+    per_account = Bucket.per_minute(
+        AUTH_SETTINGS.RATE_LIMIT_ACCOUNT_BURST, AUTH_SETTINGS.RATE_LIMIT_ACCOUNT_PER_MINUTE
+    )
+    return [
+        RateLimitRule("POST", "/api/auth/login", per_ip, per_account),
+        RateLimitRule("POST", "/api/users/signup", per_ip, per_account),
+        RateLimitRule("POST", "/api/admin/signup", per_ip, per_account),
+    ]
+
+
+RATE_LIMIT_BACKEND = MemoryBackend()
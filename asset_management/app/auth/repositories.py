@@ -1,5 +1,7 @@
+import hashlib
 from datetime import datetime
 from typing import Annotated
+from sqlalchemy import delete, or_, select
 from sqlalchemy.orm import Session
 from fastapi import Depends
 from asset_management.database.session import get_session
@@ -7,6 +9,10 @@ from asset_management.app.user.models import User, UserClublist
 from asset_management.app.auth.models import RefreshToken
 
 
+def hash_refresh_token(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
 class AuthRepository:
     def __init__(self, db_session: Annotated[Session, Depends(get_session)]):
         self.db_session = db_session
@@ -20,21 +26,61 @@ class AuthRepository:
     def get_user_by_social_email(self, email: str) -> User | None:
         return self.db_session.query(User).filter(User.social_email == email).first()
     
-    def add_refresh_token(self, token: str, user_id: str, expires_at) -> None:
+    def update_password_hash(self, user: User, hashed_password: str) -> None:
+      user.hashed_password = hashed_password
+      self.db_session.commit()
+
+    def add_refresh_token(self, token: str, user_id: str, expires_at, max_tokens: int | None = None) -> None:
+      """refresh token을 저장하고, 사용자의 만료된 토큰과 max_tokens를 넘는 오래된 토큰을 지웁니다."""
       refresh_token = RefreshToken(
-        token=token,
+        token_hash=hash_refresh_token(token),
         user_id=user_id,
         expires_at=expires_at,
       )
       self.db_session.add(refresh_token)
+      self.db_session.flush()
+      stale = RefreshToken.expires_at <= datetime.now()
+      if max_tokens is not None:
+        keep = select(RefreshToken.id).where(RefreshToken.user_id == user_id).order_by(
+          RefreshToken.expires_at.desc(), RefreshToken.id.desc()
+        ).limit(max_tokens)
+        # MySQL은 같은 테이블을 서브쿼리로 IN 비교할 수 없으므로 id를 먼저 읽는다
+        stale = or_(stale, RefreshToken.id.not_in(self.db_session.scalars(keep).all()))
+      self.db_session.execute(
+        delete(RefreshToken)
+        .where(RefreshToken.user_id == user_id, stale)
+        .execution_options(synchronize_session=False)
+      )
       self.db_session.commit()
     
     def delete_token(self, token: str) -> None:
-      self.db_session.query(RefreshToken).filter(RefreshToken.token == token).delete()
+      self.db_session.query(RefreshToken).filter(RefreshToken.token_hash == hash_refresh_token(token)).delete()
       self.db_session.commit()
     
     def verify_refresh_token(self, token: str) -> bool:
-      return self.db_session.query(RefreshToken).filter(RefreshToken.token == token).first() is not None
+      return self.db_session.query(RefreshToken.id).filter(
+        RefreshToken.token_hash == hash_refresh_token(token),
+        RefreshToken.expires_at > datetime.now(),
+      ).first() is not None
+
+    def purge_expired_refresh_tokens(self, before: datetime, batch_size: int) -> int:
+      """만료된 토큰을 최대 batch_size개 지우고 커밋합니다. 지운 행 수를 반환합니다."""
+      ids = self.db_session.scalars(
+        select(RefreshToken.id).where(RefreshToken.expires_at <= before).order_by(RefreshToken.expires_at).limit(batch_size)
+      ).all()
+      if ids:
+        self.db_session.execute(
+          delete(RefreshToken).where(RefreshToken.id.in_(ids)).execution_options(synchronize_session=False)
+        )
+        self.db_session.commit()
+      return len(ids)
     
+    def get_memberships(self, user_id: str) -> list[tuple[int, int]]:
+      return [
+        (club_id, permission)
+        for club_id, permission in self.db_session.query(UserClublist.club_id, UserClublist.permission)
+        .filter(UserClublist.user_id == user_id)
+      ]
+
     def club_permission(self, user_club_id: int, resource_club_id: int) -> UserClublist | None:
       return self.db_session.query(UserClublist).filter(UserClublist.user_id == user_club_id, UserClublist.club_id == resource_club_id).first()
\ No newline at end of file
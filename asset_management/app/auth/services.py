@@ -1,35 +1,49 @@
 from datetime import datetime, timedelta
 from typing import Annotated
-import json
-import urllib.parse
-import urllib.request
+from asset_management.app.auth.claims import build_claims
+from asset_management.app.auth.google import GoogleIdTokenVerifier, GoogleKeyCache, get_google_keys
 from asset_management.app.auth.repositories import AuthRepository
 from asset_management.app.auth.settings import AUTH_SETTINGS
-from asset_management.app.auth.utils import issue_token, verify_password, verify_token
+from asset_management.app.auth.passwords import PASSWORD_HASHER
+from asset_management.app.auth.utils import hash_password, issue_token, verify_password, verify_token
 from fastapi import Depends, HTTPException, Header, status
 from asset_management.app.user.models import User
 
 
 class AuthServices:
-  def __init__(self, auth_repository: Annotated[AuthRepository, Depends()]):
+  def __init__(
+    self,
+    auth_repository: Annotated[AuthRepository, Depends()],
+    google_keys: Annotated[GoogleKeyCache, Depends(get_google_keys)],
+  ):
     self.auth_repository = auth_repository
+    self.google_keys = google_keys
     
   def issue_token(self, user_id: int):
-    tokens = issue_token(user_id)
+    user = self.auth_repository.get_user(user_id)
+    claims = build_claims(user, self.auth_repository.get_memberships(user_id)) if user else None
+    tokens = issue_token(user_id, claims)
     self.auth_repository.add_refresh_token(
       tokens["refresh_token"],
       user_id,
       datetime.now() + timedelta(minutes=AUTH_SETTINGS.LONG_SESSION_LIFESPAN),
+      max_tokens=AUTH_SETTINGS.REFRESH_TOKENS_PER_USER,
     )
     return tokens
   
   def login_user(self, email: str, password: str):
     user = self.auth_repository.get_user_by_email(email)
+    if not user or not user.hashed_password:
+      # 계정이 없어도 같은 시간이 걸리도록 더미 해시를 검증
+      verify_password(password, PASSWORD_HASHER.dummy_hash)
     if not user or not verify_password(password, user.hashed_password):
       raise HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Invalid email or password",
       )
+    # 이전 형식(SHA-256)이나 비용 파라미터가 바뀐 해시는 로그인 성공 시 다시 해시
+    if PASSWORD_HASHER.needs_rehash(user.hashed_password):
+      self.auth_repository.update_password_hash(user, hash_password(password))
     user_name = user.name
     user_type = user.is_admin
     return {"user_name": user_name, "user_type": user_type, "tokens": self.issue_token(user.id)}
@@ -41,22 +55,16 @@ class AuthServices:
         detail="Google client ID not configured",
       )
 
-    tokeninfo_url = "https://oauth2.googleapis.com/tokeninfo"
-    url = f"{tokeninfo_url}?id_token={urllib.parse.quote(id_token)}"
+    # 서명 키는 메모리에 캐시되므로 대부분 네트워크 없이 검증됨
+    verifier = GoogleIdTokenVerifier(self.google_keys, AUTH_SETTINGS.GOOGLE_CLIENT_ID)
     try:
-      with urllib.request.urlopen(url, timeout=5) as response:
-        data = json.loads(response.read().decode("utf-8"))
+      data = verifier.verify(id_token)
     except Exception:
       raise HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Invalid Google ID token",
       )
 
-    if data.get("aud") != AUTH_SETTINGS.GOOGLE_CLIENT_ID:
-      raise HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Invalid Google token audience",
-      )
     if data.get("email_verified") not in ["true", True]:
       raise HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -5,8 +5,30 @@ class AuthSettings(BaseSettings):
     ACCESS_TOKEN_SECRET: str
     REFRESH_TOKEN_SECRET: str
     GOOGLE_CLIENT_ID: str | None = None
+    # Google ID token 서명 키 (Cache-Control에 따라 메모리에 캐시)
+    GOOGLE_JWKS_URL: str = "https://www.googleapis.com/oauth2/v3/certs"
+    GOOGLE_JWKS_TIMEOUT: float = 5
     SHORT_SESSION_LIFESPAN: int = 15
     LONG_SESSION_LIFESPAN: int = 24 * 60
+    CALENDAR_FEED_LIFESPAN: int = 180 * 24 * 60
+    # 사용자당 유지할 refresh token 수 (초과하면 만료가 가까운 것부터 삭제)
+    REFRESH_TOKENS_PER_USER: int = 10
+    # purge_tokens 한 번에 지울 만료 토큰 수
+    REFRESH_TOKEN_PURGE_BATCH_SIZE: int = 1000
+    # 로그인/가입 rate limit (토큰 버킷: burst개까지 몰아서, 이후 분당 per_minute개)
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_IP_BURST: int = 20
+    RATE_LIMIT_IP_PER_MINUTE: float = 10
+    RATE_LIMIT_ACCOUNT_BURST: int = 5
+    RATE_LIMIT_ACCOUNT_PER_MINUTE: float = 2
+    # 프록시(로드밸런서) 뒤에서만 켜기. X-Forwarded-For 첫 값을 클라이언트 IP로 사용
+    RATE_LIMIT_TRUST_FORWARDED: bool = False
+    # scrypt 비용 파라미터 (바꾸면 다음 로그인 때 다시 해시됨)
+    PASSWORD_SCRYPT_N: int = 2 ** 14
+    PASSWORD_SCRYPT_R: int = 8
+    PASSWORD_SCRYPT_P: int = 1
+    # 동시에 실행할 비밀번호 해시 수 (프로세스당)
+    PASSWORD_HASH_WORKERS: int = 4
 
     model_config = SettingsConfigDict(
         case_sensitive=False,
@@ -1,17 +1,23 @@
+from asset_management.app.auth.passwords import PASSWORD_HASHER
 from asset_management.app.auth.repositories import AuthRepository
 from asset_management.app.auth.settings import AUTH_SETTINGS
 from datetime import datetime, timedelta
 from authlib.jose import jwt
 from authlib.jose.errors import JoseError
-from fastapi import Depends, Header, HTTPException, status
+from fastapi import Depends, Header, HTTPException, Query, status
 from typing import Annotated
-import hashlib
+import secrets
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
 
-def issue_token(user_id: int) -> str:
+def issue_token(user_id: int, claims: dict | None = None) -> str:
+  """access/refresh 토큰을 발급합니다.
+
+  claims(권한 claim 등)는 access token에만 넣습니다.
+  """
   header = {"alg": "HS256"}
   payload_acc = {
+    **(claims or {}),
     "sub": user_id,
     "type": "access",
     "exp": datetime.now() + timedelta(minutes=AUTH_SETTINGS.SHORT_SESSION_LIFESPAN),
@@ -19,6 +25,8 @@ def issue_token(user_id: int) -> str:
   payload_ref = {
     "sub": user_id,
     "type": "refresh",
+    # 같은 초에 발급돼도 토큰(과 저장되는 해시)이 겹치지 않도록
+    "jti": secrets.token_urlsafe(16),
     "exp": datetime.now() + timedelta(minutes=AUTH_SETTINGS.LONG_SESSION_LIFESPAN),
   }
   access_token = jwt.encode(header, payload_acc, AUTH_SETTINGS.ACCESS_TOKEN_SECRET)
@@ -32,6 +40,19 @@ def issue_token(user_id: int) -> str:
 
   return {"access_token": access_token, "refresh_token": refresh_token}
 
+def issue_feed_token(user_id: str) -> str:
+  """캘린더 앱 구독 URL에 넣을 장기 토큰을 발급합니다. (Authorization 헤더를 보낼 수 없는 클라이언트용)"""
+  header = {"alg": "HS256"}
+  payload = {
+    "sub": user_id,
+    "type": "feed",
+    "exp": datetime.now() + timedelta(minutes=AUTH_SETTINGS.CALENDAR_FEED_LIFESPAN),
+  }
+  token = jwt.encode(header, payload, AUTH_SETTINGS.ACCESS_TOKEN_SECRET)
+  if isinstance(token, bytes):
+    token = token.decode('utf-8')
+  return token
+
 # Security scheme for Swagger UI
 security = HTTPBearer()
 
@@ -41,7 +62,13 @@ def get_header_token(credentials: HTTPAuthorizationCredentials = Depends(securit
 def login_with_header(token: Annotated[str | None, Depends(get_header_token)] = None):
   return verify_token(token, AUTH_SETTINGS.ACCESS_TOKEN_SECRET, "access")
 
+def login_with_feed_token(token: str = Query(..., description="캘린더 피드 토큰")):
+  return verify_token(token, AUTH_SETTINGS.ACCESS_TOKEN_SECRET, "feed")
+
 def verify_token(token: str, secret: str, expected_type: str) -> str:
+  return decode_token(token, secret, expected_type).get("sub")
+
+def decode_token(token: str, secret: str, expected_type: str) -> dict:
   try:
     claims = jwt.decode(token, secret)
     claims.validate_exp(now=datetime.now().timestamp(), leeway=0)
@@ -51,7 +78,7 @@ def verify_token(token: str, secret: str, expected_type: str) -> str:
         detail="Invalid token type",
         headers={"WWW-Authenticate": "Bearer"},
       )
-    return claims.get("sub")
+    return claims
   except JoseError:
     raise HTTPException(
       status_code=status.HTTP_401_UNAUTHORIZED,
@@ -62,8 +89,8 @@ def verify_token(token: str, secret: str, expected_type: str) -> str:
 def refresh_token(token: Annotated[str | None, Depends(get_header_token)] = None):
   return verify_token(token, AUTH_SETTINGS.REFRESH_TOKEN_SECRET, "refresh")
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-  return hashlib.sha256(plain_password.encode("utf-8")).hexdigest() == hashed_password
+def verify_password(plain_password: str, hashed_password: str | None) -> bool:
+  return PASSWORD_HASHER.verify(plain_password, hashed_password)
 
 def check_club_permission(user_club_id: int, resource_club_id: int, auth_repository: Annotated[AuthRepository, Depends()]) -> int:
   """Check if the user has permission for the club resource.
@@ -89,7 +116,7 @@ def check_club_permission(user_club_id: int, resource_club_id: int, auth_reposit
   return userclubinfo.permission
 
 def hash_password(password: str) -> str:
-  """Hash the password using SHA-256.
+  """Hash the password using scrypt.
   
   Args:
       password (str): The plain text password.
@@ -97,4 +124,4 @@ def hash_password(password: str) -> str:
   Returns:
       str: The hashed password.
   """
-  return hashlib.sha256(password.encode("utf-8")).hexdigest()
+  return PASSWORD_HASHER.hash(password)
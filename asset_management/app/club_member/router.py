@@ -9,7 +9,7 @@ from asset_management.app.club_member.schemas import (
 )
 from asset_management.app.user.models import UserClublist
 from asset_management.app.club_member.services import ClubMemberService
-from asset_management.app.auth.utils import login_with_header
+from asset_management.app.auth.claims import AccessClaims, login_with_claims
 
 router = APIRouter(prefix="/club-members", tags=["club-members"])
 
@@ -23,14 +23,15 @@ def get_club_members(
   page: int = Query(1, ge=1),
   size: int = Query(10, ge=1),
   club_member_service: ClubMemberService = Depends(),
-  my_id=Depends(login_with_header),
+  claims: AccessClaims = Depends(login_with_claims),
 ) -> ClubMemberResponse:
   """동아리원 목록 조회
 
   permission은 일반 회원 0, 관리자 1, 가입대기 2의 값을 가집니다.
   """
+  my_id = claims.user_id
   if club_id is not None:
-    if club_member_service.check_club_permission(my_id, club_id) in [0, 1]:
+    if claims.club_permission(club_id) in [0, 1]:
       return club_member_service.get_club_members(
         id=member_id,
         user_id=user_id,
@@ -58,7 +59,7 @@ def get_club_members(
 def new_club_member(
   request: ClubMemberCreate,
   club_member_service: ClubMemberService = Depends(),
-  user=Depends(login_with_header),
+  claims: AccessClaims = Depends(login_with_claims),
 ) -> ClubMember:
   """동아리원 추가"""
   if request.club_id is None and request.club_code is None:
@@ -85,7 +86,7 @@ def new_club_member(
       club_id_to_check = club.id
     
     # 관리자 권한 체크
-    if not club_member_service.check_club_permission(user, club_id_to_check) == 1:
+    if claims.club_permission(club_id_to_check) != 1:
       raise HTTPException(
         status_code=status.HTTP_403_FORBIDDEN, detail="Permission denied"
       )
@@ -104,7 +105,7 @@ def new_club_member(
 @router.delete("/{member_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_club_member(
   member_id: int,
-  user=Depends(login_with_header),
+  claims: AccessClaims = Depends(login_with_claims),
   club_member_service: ClubMemberService = Depends(),
 ) -> None:
   """동아리원 삭제 (관리자 또는 본인 탈퇴)"""
@@ -118,8 +119,8 @@ def delete_club_member(
   user_id = member.user_id
   
   # 본인이거나 관리자면 삭제 가능
-  is_admin = club_member_service.check_club_permission(user, club_id) == 1
-  is_self = user == user_id
+  is_admin = claims.clubs.get(club_id) == 1
+  is_self = claims.user_id == user_id
   
   if is_admin or is_self:
     club_member_service.delete_club_member(member_id)
@@ -133,7 +134,7 @@ def delete_club_member(
 def update_club_member(
   member_id: int,
   request: ClubMemberUpdate,
-  user=Depends(login_with_header),
+  claims: AccessClaims = Depends(login_with_claims),
   club_member_service: ClubMemberService = Depends(),
 ) -> ClubMember:
   """동아리원 권한 수정"""
@@ -143,7 +144,7 @@ def update_club_member(
       status_code=status.HTTP_404_NOT_FOUND, detail="Member not found"
     )
   club_id = members_response.items[0].club_id
-  if club_member_service.check_club_permission(user, club_id) == 1:
+  if claims.club_permission(club_id) == 1:
     member = club_member_service.edit_club_member(
       member_id, club_id, request.permission
     )
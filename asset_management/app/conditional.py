@@ -0,0 +1,24 @@
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+from fastapi import Request
+
+
+def not_modified(request: Request, etag: str, last_modified: datetime | None) -> bool:
+    """조건부 GET(If-None-Match / If-Modified-Since)에 304로 응답해도 되는지 판단합니다.
+
+    If-None-Match가 있으면 If-Modified-Since는 무시합니다 (RFC 9110).
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # 약한 비교: W/ 접두사는 무시
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return etag in tags or if_none_match.strip() == "*"
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        return last_modified.astimezone(timezone.utc).replace(microsecond=0) <= since
+    return False
@@ -0,0 +1,91 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+
+from asset_management.app.picture.settings import PICTURE_SETTINGS
+
+
+@dataclass(frozen=True)
+class PicturePayload:
+    """사진 응답에 필요한 값. data가 None이면 아직 원본/축소본을 읽지 않은 상태입니다."""
+    asset_id: int
+    digest: str
+    content_type: str
+    last_modified: datetime | None
+    data: bytes | None = None
+
+
+class PictureCache:
+    """자주 조회되는 사진 응답의 바이트 예산 LRU 캐시 (프로세스 내 메모리).
+
+    (picture_id, size) 단위로 content hash와 함께 보관하므로, 적중하면 DB와 저장소를 모두 건너뜁니다.
+    캐시된 값은 대표 사진 여부와 무관하므로 삭제 시에만 invalidate로 비우고, TTL은 다른 워커 프로세스의 삭제에 대한 안전장치입니다.
+    """
+
+    def __init__(self, max_bytes: int, ttl_seconds: float = 600, max_entry_bytes: int | None = None) -> None:
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        # 큰 사진 하나가 캐시 전체를 밀어내지 않도록 항목 크기를 제한
+        self.max_entry_bytes = max_entry_bytes if max_entry_bytes is not None else max_bytes // 8
+        self._entries: OrderedDict[tuple[int, str | None], tuple[float, PicturePayload]] = OrderedDict()
+        self._resident_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, picture_id: int, size: str | None = None) -> PicturePayload | None:
+        key = (picture_id, size)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    self._remove(key)
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+
+    def set(self, picture_id: int, size: str | None, payload: PicturePayload) -> None:
+        if payload.data is None or len(payload.data) > self.max_entry_bytes:
+            return
+        key = (picture_id, size)
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, payload)
+            self._resident_bytes += len(payload.data)
+            while self._resident_bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, picture_id: int) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == picture_id]:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._resident_bytes = 0
+            self._hits = self._misses = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "resident_bytes": self._resident_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": self._hits / lookups if lookups else 0.0,
+            }
+
+    def _remove(self, key: tuple[int, str | None]) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._resident_bytes -= len(entry[1].data)
+
+
+PICTURE_CACHE = PictureCache(PICTURE_SETTINGS.CACHE_MAX_BYTES, PICTURE_SETTINGS.CACHE_TTL_SECONDS)
@@ -0,0 +1,49 @@
+"""picture.data에 남아 있는 기존 사진 원본을 BlobStore로 옮기는 배치 작업
+
+    python -m asset_management.app.picture.migrate_blobs [--batch-size N]
+
+batch_size개씩 저장소에 쓰고 content_hash를 채운 뒤 data를 비우고 커밋합니다.
+중간에 멈춰도 다시 실행하면 남은 사진부터 이어서 옮깁니다.
+"""
+import argparse
+
+from sqlalchemy.orm import Session
+
+from asset_management.app.picture.repositories import PictureRepository
+from asset_management.app.picture.settings import PICTURE_SETTINGS
+from asset_management.app.picture.storage import BlobStore, get_blob_store
+
+
+def migrate_blobs(
+    session: Session,
+    blob_store: BlobStore,
+    batch_size: int = PICTURE_SETTINGS.BLOB_MIGRATION_BATCH_SIZE,
+) -> int:
+    """옮긴 사진 수를 반환합니다."""
+    repository = PictureRepository(session)
+    moved, after_id = 0, 0
+    while True:
+        rows = repository.get_legacy_pictures(after_id, batch_size)
+        if not rows:
+            return moved
+        for picture_id, data in rows:
+            repository.set_content_hash(picture_id, blob_store.put(data))
+        session.commit()
+        moved += len(rows)
+        after_id = rows[-1].id
+
+
+def main() -> None:
+    from asset_management.database.session import session_scope
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batch-size", type=int, default=PICTURE_SETTINGS.BLOB_MIGRATION_BATCH_SIZE)
+    args = parser.parse_args()
+
+    with session_scope() as session:
+        moved = migrate_blobs(session, get_blob_store(), args.batch_size)
+    print(f"moved {moved} pictures to {PICTURE_SETTINGS.BLOB_BACKEND} blob store")
+
+
+if __name__ == "__main__":
+    main()
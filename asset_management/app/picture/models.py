@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
-from sqlalchemy import Integer, DateTime, ForeignKey, String, Boolean, func, LargeBinary
+from sqlalchemy import Integer, DateTime, ForeignKey, Index, String, Boolean, func, LargeBinary
 from sqlalchemy.dialects.mysql import LONGBLOB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import UUID
@@ -15,6 +15,10 @@ if TYPE_CHECKING:
 
 class Picture(Base):
     __tablename__ = "picture"
+    __table_args__ = (
+        # 물품 목록의 대표 사진/사진 수 집계(get_picture_summaries)
+        Index("ix_picture_asset_id_is_main", "asset_id", "is_main"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     date: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=func.now())
@@ -23,7 +27,13 @@ class Picture(Base):
     user_id: Mapped[str] = mapped_column(String(36), ForeignKey("user.id"), nullable=False)
     category_id: Mapped[Optional[int]] = mapped_column(ForeignKey("category.id"), nullable=True)
 
-    data: Mapped[bytes] = mapped_column(LargeBinary().with_variant(LONGBLOB, "mysql"), nullable=False)
+    # 원본은 BlobStore에 SHA-256 해시로 저장한다.
+    # data는 migrate_blobs로 옮기기 전의 기존 사진에만 남아 있다.
+    content_hash: Mapped[Optional[str]] = mapped_column(String(64), nullable=True, index=True)
+    # 메타데이터 조회에서 원본을 끌어오지 않도록 deferred. 읽을 때는 PictureRepository.get_picture_data
+    data: Mapped[Optional[bytes]] = mapped_column(
+        LargeBinary().with_variant(LONGBLOB, "mysql"), nullable=True, deferred=True, deferred_raiseload=True
+    )
     content_type: Mapped[str] = mapped_column(String(50), nullable=False)
     filename: Mapped[str] = mapped_column(String(255), nullable=False)
     size: Mapped[int] = mapped_column(Integer, nullable=False)
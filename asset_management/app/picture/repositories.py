@@ -1,4 +1,4 @@
-from sqlalchemy import select
+from sqlalchemy import func, select, update
 from typing import Annotated
 from fastapi import Depends
 from sqlalchemy.orm import Session
@@ -18,8 +18,8 @@ class PictureRepository:
         return picture
     
     def get_picture_by_id(self, picture_id: int) -> Picture | None:
-        pictureLoc = select(Picture).where(Picture.id == picture_id)
-        return self.session.scalar(pictureLoc)
+        # 같은 요청에서 이미 읽은 사진은 identity map에서 바로 돌려준다
+        return self.session.get(Picture, picture_id)
     
     def get_pictures_by_asset(self, asset_id: int) -> list[Picture]:
         picturesLoc = select(Picture).where(Picture.asset_id == asset_id)
@@ -38,4 +38,26 @@ class PictureRepository:
     
     def delete_picture(self, picture: Picture) -> None:
         self.session.delete(picture)
-        self.session.commit()
\ No newline at end of file
+        self.session.commit()
+
+    def get_picture_data(self, picture_id: int) -> bytes | None:
+        """원본 컬럼(data)만 따로 읽습니다. 저장소로 옮기기 전의 사진에만 쓰입니다."""
+        return self.session.scalar(select(Picture.data).where(Picture.id == picture_id))
+
+    def count_pictures_by_hash(self, content_hash: str) -> int:
+        return self.session.scalar(select(func.count(Picture.id)).where(Picture.content_hash == content_hash))
+
+    def get_legacy_pictures(self, after_id: int, limit: int) -> list:
+        """아직 BlobStore로 옮기지 않은 사진의 (id, data)를 id 순으로 가져옵니다."""
+        stmt = (
+            select(Picture.id, Picture.data)
+            .where(Picture.id > after_id, Picture.content_hash.is_(None))
+            .order_by(Picture.id)
+            .limit(limit)
+        )
+        return self.session.execute(stmt).all()
+
+    def set_content_hash(self, picture_id: int, content_hash: str) -> None:
+        self.session.execute(
+            update(Picture).where(Picture.id == picture_id).values(content_hash=content_hash, data=None)
+        )
@@ -1,22 +1,96 @@
-from typing import Annotated
+from datetime import timezone
+from email.utils import format_datetime
+from typing import Annotated, Literal
 
-from fastapi import APIRouter, Depends, HTTPException, Header, status, Response, File, UploadFile
+from fastapi import APIRouter, Depends, HTTPException, Header, status, Request, Response, File, UploadFile
 from asset_management.app.picture.services import PictureService
+from asset_management.app.conditional import not_modified
 
 router = APIRouter(prefix="/pictures", tags=["pictures"])
 
+
+def _parse_range(header: str, size: int) -> tuple[int, int] | None:
+    """단일 bytes 범위를 (start, end) (end 포함)로 해석합니다.
+
+    지원하지 않는 형식(다른 단위, 여러 범위)은 None을 반환해 전체 응답으로 처리하고,
+    파일 범위를 벗어난 요청은 416을 발생시킵니다.
+    """
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    first, sep, last = spec.strip().partition("-")
+    if not sep:
+        return None
+    try:
+        if first == "":
+            # bytes=-N : 마지막 N바이트
+            length = int(last)
+            if length <= 0:
+                raise ValueError
+            start, end = max(size - length, 0), size - 1
+        else:
+            start = int(first)
+            end = min(int(last), size - 1) if last else size - 1
+            if start < 0 or (last and int(last) < start):
+                return None
+    except ValueError:
+        return None
+    if start >= size:
+        raise HTTPException(
+            status_code=status.HTTP_416_RANGE_NOT_SATISFIABLE,
+            detail="Requested range not satisfiable",
+            headers={"Content-Range": f"bytes */{size}"},
+        )
+    return start, end
+
+
 @router.get("/{picture_id}", status_code=status.HTTP_200_OK)
 def get_picture(
     picture_id: int,
+    request: Request,
     picture_service: Annotated[PictureService, Depends()],
+    size: Literal["thumb", "medium"] | None = None,
 ) -> Response:
-    
-    """특정 사진을 가져옵니다."""
-    picture = picture_service.get_picture_model(picture_id)
+
+    """특정 사진을 가져옵니다.
+
+    size=thumb(128px), medium(640px)을 주면 업로드 시 미리 만들어 둔 WebP 축소본을 반환합니다.
+    content hash 기반 ETag와 Last-Modified를 제공하므로 변경이 없으면 원본을 읽지 않고 304를 반환하며,
+    Range 헤더(단일 bytes 범위)를 주면 206으로 일부만 반환합니다."""
+    payload = picture_service.get_picture_payload(picture_id, size)
+
+    etag = f'"{payload.digest}"' if size is None else f'"{payload.digest}-{size}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "public, max-age=86400",
+        "Accept-Ranges": "bytes",
+    }
+    if payload.last_modified is not None:
+        headers["Last-Modified"] = format_datetime(payload.last_modified.astimezone(timezone.utc), usegmt=True)
+
+    if not_modified(request, etag, payload.last_modified):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    payload = picture_service.load_picture_payload(picture_id, size, payload)
+    data, media_type = payload.data, payload.content_type
+
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    # If-Range가 현재 ETag와 다르면 Range를 무시하고 전체를 보낸다
+    if range_header and (if_range is None or if_range.strip() == etag):
+        byte_range = _parse_range(range_header, len(data))
+        if byte_range is not None:
+            start, end = byte_range
+            headers["Content-Range"] = f"bytes {start}-{end}/{len(data)}"
+            return Response(
+                content=data[start:end + 1],
+                status_code=status.HTTP_206_PARTIAL_CONTENT,
+                media_type=media_type,
+                headers=headers,
+            )
+
     return Response(
-        content=picture.data,
-        media_type=picture.content_type,
-        headers={
-            "Cache-Control": "public, max-age=86400"
-        }
-    )
\ No newline at end of file
+        content=data,
+        media_type=media_type,
+        headers=headers,
+    )
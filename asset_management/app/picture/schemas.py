@@ -19,4 +19,12 @@ class PictureResponse(BaseModel):
 
 class PictureCreateRequest(BaseModel):
     asset_id: int
-    is_main: Optional[bool] = False
\ No newline at end of file
+    is_main: Optional[bool] = False
+
+class PictureCacheStatsResponse(BaseModel):
+    entries: int
+    resident_bytes: int
+    max_bytes: int
+    hits: int
+    misses: int
+    hit_ratio: float
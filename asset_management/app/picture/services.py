@@ -1,29 +1,34 @@
+import hashlib
+from dataclasses import replace
 from typing import Annotated, List
 
 from fastapi import Depends, UploadFile, HTTPException
 from asset_management.app.picture.repositories import PictureRepository
-from asset_management.app.picture.schemas import PictureResponse, PictureCreateRequest
+from asset_management.app.picture.schemas import PictureCacheStatsResponse, PictureResponse, PictureCreateRequest
 from asset_management.app.picture.models import Picture
+from asset_management.app.picture.cache import PICTURE_CACHE, PicturePayload
+from asset_management.app.picture.storage import BlobStore, content_hash, get_blob_store
+from asset_management.app.picture.utils import MAX_UPLOAD_BYTES, UPLOAD_CHUNK_BYTES, sniff_image_type
+from asset_management.app.picture.thumbnails import RENDITION_CONTENT_TYPE, RENDITION_PIPELINE, RENDITIONS, render
 
 
 class PictureService:
     def __init__(
         self,
         picture_repository: Annotated[PictureRepository, Depends()],
+        blob_store: Annotated[BlobStore, Depends(get_blob_store)],
     ) -> None:
         self.picture_repository = picture_repository
+        self.blob_store = blob_store
 
     async def upload_picture(
         self, user_id: int, file: UploadFile, picture_request: PictureCreateRequest
     ) -> PictureResponse:
         
-        data = await file.read()
+        data, digest, content_type = await self._read_upload(file)
 
-        if file.content_type not in {"image/jpeg", "image/png", "image/webp"}:
-            raise HTTPException(status_code=400, detail="Unsupported image type")
-
-        if len(data) > 5 * 1024 * 1024:
-            raise HTTPException(status_code=400, detail="File too large")
+        # 같은 내용의 파일은 저장소에 한 번만 저장된다
+        self.blob_store.put(data, digest=digest)
 
         if picture_request.is_main:
             self.picture_repository.clear_main_picture_by_asset(picture_request.asset_id)
@@ -32,13 +37,18 @@ class PictureService:
             asset_id=picture_request.asset_id,
             is_main=picture_request.is_main,
             user_id=user_id,
-            data=data,
-            content_type=file.content_type,
+            content_hash=digest,
+            content_type=content_type,
             filename=file.filename or "upload",
             size=len(data)            
         )
 
         self.picture_repository.create_picture(new_picture)
+        # 같은 원본의 마지막 사진이 동시에 지워졌다면 put이 건너뛴 원본이 사라졌을 수 있다
+        if not self.blob_store.exists(digest):
+            self.blob_store.put(data, digest=digest)
+        # 썸네일은 응답을 막지 않도록 워커 풀에서 만든다
+        RENDITION_PIPELINE.submit(self.blob_store, digest)
 
         return PictureResponse(
             id=new_picture.id,
@@ -51,6 +61,35 @@ class PictureService:
             size=new_picture.size,
         )
 
+    async def _read_upload(self, file: UploadFile) -> tuple[bytes, str, str]:
+        """업로드를 청크 단위로 읽으면서 크기 제한, 형식 확인, 해시 계산을 함께 합니다.
+
+        클라이언트가 보낸 content type 대신 첫 청크의 매직 바이트로 형식을 판별하고,
+        제한을 넘는 순간 더 읽지 않고 거절합니다.
+
+        Returns:
+            (data, SHA-256 hex digest, 판별한 content type)
+        """
+        if file.size is not None and file.size > MAX_UPLOAD_BYTES:
+            raise HTTPException(status_code=400, detail="File too large")
+
+        buffer = bytearray()
+        hasher = hashlib.sha256()
+        content_type = None
+        while chunk := await file.read(UPLOAD_CHUNK_BYTES):
+            if content_type is None:
+                content_type = sniff_image_type(chunk)
+                if content_type is None:
+                    raise HTTPException(status_code=400, detail="Unsupported image type")
+            if len(buffer) + len(chunk) > MAX_UPLOAD_BYTES:
+                raise HTTPException(status_code=400, detail="File too large")
+            hasher.update(chunk)
+            buffer += chunk
+
+        if content_type is None:
+            raise HTTPException(status_code=400, detail="Unsupported image type")
+        return bytes(buffer), hasher.hexdigest(), content_type
+
     def get_picture(self, picture_id: int) -> PictureResponse:
         picture = self.picture_repository.get_picture_by_id(picture_id)
         if picture is None:
@@ -73,6 +112,70 @@ class PictureService:
             raise HTTPException(status_code=404, detail="Picture not found")
         return picture
 
+    def get_picture_data(self, picture: Picture) -> bytes:
+        # 아직 저장소로 옮기지 않은 기존 사진은 DB의 data를 그대로 쓴다
+        if picture.content_hash is None:
+            return self.picture_repository.get_picture_data(picture.id)
+        try:
+            return self.blob_store.get(picture.content_hash)
+        except FileNotFoundError:
+            raise HTTPException(status_code=404, detail="Picture data not found")
+
+    def get_rendition_data(self, picture: Picture, digest: str, size: str) -> tuple[bytes, str]:
+        """축소본과 그 content type을 반환합니다.
+
+        아직 만들어지지 않았으면(업로드 직후, 기존 사진) 그 자리에서 만들어 저장하고,
+        이미지로 해석할 수 없는 파일이면 원본을 그대로 반환합니다.
+        """
+        try:
+            return self.blob_store.get_rendition(digest, size), RENDITION_CONTENT_TYPE
+        except FileNotFoundError:
+            pass
+
+        data = self.get_picture_data(picture)
+        try:
+            rendition = render(data, RENDITIONS[size])
+        except ValueError:
+            return data, picture.content_type
+        self.blob_store.put_rendition(digest, size, rendition)
+        return rendition, RENDITION_CONTENT_TYPE
+
+    def get_picture_payload(self, picture_id: int, size: str | None = None) -> PicturePayload:
+        """응답 헤더(ETag, Last-Modified)를 만들 수 있는 payload를 반환합니다.
+
+        캐시에 있으면 원본까지 채워진 payload를 DB 조회 없이 돌려주고,
+        없으면 메타데이터만 채워 돌려주므로 304 응답에는 원본을 읽지 않습니다.
+        """
+        cached = PICTURE_CACHE.get(picture_id, size)
+        if cached is not None:
+            return cached
+
+        picture = self.get_picture_model(picture_id)
+        data = None
+        digest = picture.content_hash
+        if digest is None:
+            # 저장소로 옮기기 전의 사진은 원본을 읽어 해시를 계산한다
+            data = self.get_picture_data(picture)
+            digest = content_hash(data)
+        return PicturePayload(
+            asset_id=picture.asset_id,
+            digest=digest,
+            content_type=picture.content_type,
+            last_modified=picture.date,
+            data=data if size is None else None,
+        )
+
+    def load_picture_payload(self, picture_id: int, size: str | None, payload: PicturePayload) -> PicturePayload:
+        """payload에 원본(또는 축소본)을 채우고 캐시에 넣습니다."""
+        if payload.data is None:
+            picture = self.get_picture_model(picture_id)
+            if size is None:
+                payload = replace(payload, data=self.get_picture_data(picture))
+            else:
+                data, content_type = self.get_rendition_data(picture, payload.digest, size)
+                payload = replace(payload, data=data, content_type=content_type)
+        PICTURE_CACHE.set(picture_id, size, payload)
+        return payload
 
     def delete_picture(self, picture_id: int) -> None:
 
@@ -80,7 +183,34 @@ class PictureService:
         if picture is None:
             raise HTTPException(status_code=404, detail="Picture not found")
         
+        digest = picture.content_hash
+        if digest is None:
+            # 저장소로 옮기기 전의 사진도 축소본은 원본 해시로 저장소에 저장된다 (get_rendition_data)
+            digest = content_hash(self.get_picture_data(picture))
         self.picture_repository.delete_picture(picture)
+        PICTURE_CACHE.invalidate(picture_id)
+
+        # 같은 원본을 참조하는 사진이 더 없을 때만 원본(과 축소본)을 지운다
+        if self.picture_repository.count_pictures_by_hash(digest) == 0:
+            self._delete_blob(digest)
+
+    def _delete_blob(self, digest: str) -> None:
+        """참조가 없는 원본을 지웁니다.
+
+        세고 지우는 사이에 같은 내용이 업로드되면 (저장소에 이미 있어 쓰기를 건너뛰므로) 원본 없는 사진이 생깁니다.
+        지운 뒤 다시 세어 참조가 생겼으면 원본을 되돌려 놓습니다.
+        """
+        try:
+            data = self.blob_store.get(digest)
+        except FileNotFoundError:
+            # 원본이 저장소에 없는 사진(옮기기 전)은 축소본만 지움. 축소본은 조회할 때 다시 만들 수 있다
+            self.blob_store.delete_renditions(digest)
+            return
+        self.blob_store.delete(digest)
+        # 새 트랜잭션에서 다시 세야 그 사이에 커밋된 사진이 보인다 (REPEATABLE READ)
+        self.picture_repository.session.commit()
+        if self.picture_repository.count_pictures_by_hash(digest) > 0:
+            self.blob_store.put(data, digest=digest)
 
     def list_pictures_by_asset(self, asset_id: int) -> List[PictureResponse]:
         pictures = self.picture_repository.get_pictures_by_asset(asset_id)
@@ -108,4 +238,7 @@ class PictureService:
         picture.is_main = True
         self.picture_repository.session.commit()
 
-    
\ No newline at end of file
+    
+
+    def get_cache_stats(self) -> PictureCacheStatsResponse:
+        return PictureCacheStatsResponse(**PICTURE_CACHE.stats())
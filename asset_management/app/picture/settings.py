@@ -0,0 +1,24 @@
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from asset_management.settings import SETTINGS
+
+class PictureSettings(BaseSettings):
+    # 사진 원본 저장소 (현재는 local만 지원)
+    BLOB_BACKEND: str = "local"
+    BLOB_ROOT: str = "./data/blobs"
+    # migrate_blobs 한 번에 옮길 사진 수
+    BLOB_MIGRATION_BATCH_SIZE: int = 100
+    # 썸네일 생성 워커 수
+    RENDITION_WORKERS: int = 2
+    # 대기할 수 있는 썸네일 작업 수 (넘치면 건너뛰고 조회할 때 만듦)
+    RENDITION_MAX_PENDING: int = 64
+    # 사진 응답 메모리 캐시 (프로세스당)
+    CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    CACHE_TTL_SECONDS: int = 600
+
+    model_config = SettingsConfigDict(
+        case_sensitive=False,
+        env_file=SETTINGS.env_file,
+        extra='ignore'
+    )
+
+PICTURE_SETTINGS = PictureSettings()
@@ -0,0 +1,139 @@
+import hashlib
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from pathlib import Path
+
+from asset_management.app.picture.settings import PICTURE_SETTINGS
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class BlobStore(ABC):
+    """SHA-256 해시로 주소를 정하는 사진 원본 저장소
+
+    같은 내용은 같은 키에 저장되므로 동일한 파일을 여러 번 올려도 한 번만 저장됩니다.
+    """
+
+    @abstractmethod
+    def put(self, data: bytes, digest: str | None = None) -> str:
+        """data를 저장하고 SHA-256 hex digest를 반환합니다. 이미 있으면 다시 쓰지 않습니다.
+
+        업로드 중에 이미 계산한 digest를 넘기면 다시 해시하지 않습니다.
+        """
+
+    @abstractmethod
+    def get(self, digest: str) -> bytes:
+        """저장된 원본을 반환합니다.
+
+        Raises:
+            FileNotFoundError: digest에 해당하는 원본이 없을 때
+        """
+
+    @abstractmethod
+    def exists(self, digest: str) -> bool: ...
+
+    @abstractmethod
+    def delete(self, digest: str) -> None:
+        """원본과 그 축소본을 지웁니다. 없으면 아무 일도 하지 않습니다."""
+
+    @abstractmethod
+    def delete_renditions(self, digest: str) -> None:
+        """원본은 두고 축소본만 지웁니다 (저장소로 옮기기 전의 사진은 축소본만 저장소에 있음)."""
+
+    @abstractmethod
+    def put_rendition(self, digest: str, name: str, data: bytes) -> None:
+        """원본 digest의 축소본(name)을 원본 옆에 저장합니다."""
+
+    @abstractmethod
+    def get_rendition(self, digest: str, name: str) -> bytes:
+        """저장된 축소본을 반환합니다.
+
+        Raises:
+            FileNotFoundError: 아직 만들어지지 않았을 때
+        """
+
+    @abstractmethod
+    def rendition_exists(self, digest: str, name: str) -> bool: ...
+
+
+class LocalBlobStore(BlobStore):
+    """로컬 파일시스템 저장소. root/ab/cd/abcd... 형태로 두 단계 디렉터리에 나눠 저장합니다."""
+
+    def __init__(self, root: str | os.PathLike) -> None:
+        self.root = Path(root)
+
+    def _path(self, digest: str) -> Path:
+        if len(digest) != 64 or any(c not in "0123456789abcdef" for c in digest):
+            raise ValueError("Invalid digest")
+        return self.root / digest[:2] / digest[2:4] / digest
+
+    def _rendition_path(self, digest: str, name: str) -> Path:
+        if not name.isalnum():
+            raise ValueError("Invalid rendition name")
+        path = self._path(digest)
+        return path.with_name(f"{path.name}.{name}")
+
+    def _write(self, path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # 쓰는 도중의 파일이 읽히지 않도록 임시 파일에 쓴 뒤 rename
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.remove(tmp)
+            except FileNotFoundError:
+                pass
+            raise
+
+    def put(self, data: bytes, digest: str | None = None) -> str:
+        if digest is None:
+            digest = content_hash(data)
+        path = self._path(digest)
+        if not path.exists():
+            self._write(path, data)
+        return digest
+
+    def get(self, digest: str) -> bytes:
+        return self._path(digest).read_bytes()
+
+    def exists(self, digest: str) -> bool:
+        return self._path(digest).exists()
+
+    def delete(self, digest: str) -> None:
+        try:
+            self._path(digest).unlink()
+        except FileNotFoundError:
+            pass
+        self.delete_renditions(digest)
+
+    def delete_renditions(self, digest: str) -> None:
+        path = self._path(digest)
+        for target in path.parent.glob(f"{digest}.*"):
+            try:
+                target.unlink()
+            except FileNotFoundError:
+                pass
+
+    def put_rendition(self, digest: str, name: str, data: bytes) -> None:
+        self._write(self._rendition_path(digest, name), data)
+
+    def get_rendition(self, digest: str, name: str) -> bytes:
+        return self._rendition_path(digest, name).read_bytes()
+
+    def rendition_exists(self, digest: str, name: str) -> bool:
+        return self._rendition_path(digest, name).exists()
+
+
+@lru_cache
+def get_blob_store() -> BlobStore:
+    """FastAPI dependency. 설정된 backend의 저장소를 프로세스당 하나만 만듭니다."""
+    if PICTURE_SETTINGS.BLOB_BACKEND == "local":
+        return LocalBlobStore(PICTURE_SETTINGS.BLOB_ROOT)
+    raise ValueError(f"Unsupported blob backend: {PICTURE_SETTINGS.BLOB_BACKEND}")
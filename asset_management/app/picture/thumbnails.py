@@ -0,0 +1,100 @@
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from io import BytesIO
+
+from PIL import Image, ImageOps, UnidentifiedImageError, features
+
+from asset_management.app.picture.settings import PICTURE_SETTINGS
+from asset_management.app.picture.storage import BlobStore
+
+logger = logging.getLogger(__name__)
+
+# 이름 -> 긴 변의 최대 픽셀
+RENDITIONS = {
+    "thumb": 128,
+    "medium": 640,
+}
+
+# WebP 인코더가 없는 Pillow 빌드에서는 JPEG로 만든다
+if features.check("webp"):
+    RENDITION_FORMAT, RENDITION_CONTENT_TYPE = "WEBP", "image/webp"
+else:
+    RENDITION_FORMAT, RENDITION_CONTENT_TYPE = "JPEG", "image/jpeg"
+
+
+def render(data: bytes, max_side: int) -> bytes:
+    """원본을 긴 변이 max_side 이하가 되도록 줄여 인코딩합니다. 원본보다 키우지는 않습니다.
+
+    Raises:
+        ValueError: 이미지로 해석할 수 없을 때
+    """
+    try:
+        with Image.open(BytesIO(data)) as image:
+            image = ImageOps.exif_transpose(image)
+            image.thumbnail((max_side, max_side))
+            if image.mode not in ("RGB", "RGBA") or (RENDITION_FORMAT == "JPEG" and image.mode == "RGBA"):
+                image = image.convert("RGB")
+            out = BytesIO()
+            image.save(out, RENDITION_FORMAT, quality=80)
+            return out.getvalue()
+    except (UnidentifiedImageError, OSError, Image.DecompressionBombError) as e:
+        raise ValueError("Cannot decode image") from e
+
+
+def create_renditions(blob_store: BlobStore, digest: str) -> list[str]:
+    """RENDITIONS 전부를 만들어 원본 옆에 저장하고 만든 이름을 반환합니다. 원본은 저장소에서 읽습니다."""
+    missing = [
+        (name, max_side) for name, max_side in RENDITIONS.items() if not blob_store.rendition_exists(digest, name)
+    ]
+    if not missing:
+        return []
+    try:
+        data = blob_store.get(digest)
+    except FileNotFoundError:
+        # 작업이 큐에서 기다리는 동안 사진이 지워진 경우
+        return []
+
+    created = []
+    for name, max_side in missing:
+        try:
+            blob_store.put_rendition(digest, name, render(data, max_side))
+        except ValueError:
+            logger.warning("skip renditions for undecodable picture %s", digest)
+            break
+        created.append(name)
+    return created
+
+
+class RenditionPipeline:
+    """업로드 응답을 막지 않도록 썸네일 생성을 워커 풀에서 처리합니다.
+
+    Pillow는 리사이즈/인코딩 중에 GIL을 놓으므로 스레드 풀로 충분합니다.
+    작업에는 digest만 넘기고 원본은 워커가 저장소에서 읽으며, 대기 중인 작업이 max_pending개를
+    넘으면 새 작업은 건너뜁니다 (축소본은 조회할 때 없으면 그 자리에서 만들어짐).
+    """
+
+    def __init__(self, max_workers: int, max_pending: int) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="rendition")
+        self._slots = threading.BoundedSemaphore(max_workers + max_pending)
+
+    def submit(self, blob_store: BlobStore, digest: str) -> Future | None:
+        """작업을 넣고 Future를 반환합니다. 큐가 가득 차 있으면 None을 반환합니다."""
+        if not self._slots.acquire(blocking=False):
+            logger.warning("rendition queue full, skip %s", digest)
+            return None
+        try:
+            future = self._executor.submit(create_renditions, blob_store, digest)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(self._done)
+        return future
+
+    def _done(self, future: Future) -> None:
+        self._slots.release()
+        if not future.cancelled() and future.exception() is not None:
+            logger.error("rendition job failed", exc_info=future.exception())
+
+
+RENDITION_PIPELINE = RenditionPipeline(PICTURE_SETTINGS.RENDITION_WORKERS, PICTURE_SETTINGS.RENDITION_MAX_PENDING)
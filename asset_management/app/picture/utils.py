@@ -0,0 +1,17 @@
+MAX_UPLOAD_BYTES = 5 * 1024 * 1024
+UPLOAD_CHUNK_BYTES = 64 * 1024
+
+# (오프셋, 매직 바이트) 목록 -> content type
+_SIGNATURES = (
+    (((0, b"\xFF\xD8\xFF"),), "image/jpeg"),
+    (((0, b"\x89PNG\r\n\x1a\n"),), "image/png"),
+    (((0, b"RIFF"), (8, b"WEBP")), "image/webp"),
+)
+
+
+def sniff_image_type(head: bytes) -> str | None:
+    """파일 앞부분의 매직 바이트로 지원하는 이미지 형식을 판별합니다. 지원하지 않으면 None."""
+    for signature, content_type in _SIGNATURES:
+        if all(head[offset:offset + len(magic)] == magic for offset, magic in signature):
+            return content_type
+    return None
@@ -4,6 +4,7 @@ from datetime import datetime, date
 from fastapi import Depends, HTTPException, status
 from asset_management.app.schedule.repositories import ScheduleRepository
 from asset_management.app.schedule.models import Schedule, Status
+from asset_management.app.assets.cache import AVAILABILITY_CACHE
 from asset_management.app.assets.repositories import AssetRepository
 from asset_management.app.club.models import Club
 from asset_management.app.assets.models import Asset
@@ -91,6 +92,7 @@ class RentalService:
         
         self.db_session.commit()
         self.db_session.refresh(schedule)
+        AVAILABILITY_CACHE.invalidate(schedule.club_id)
 
         return self._schedule_to_rental(schedule)
 
@@ -182,5 +184,6 @@ class RentalService:
         
         self.db_session.commit()
         schedule = self.db_session.query(Schedule).filter(Schedule.id == rental_id).first()
+        AVAILABILITY_CACHE.invalidate(schedule.club_id)
 
         return self._schedule_to_rental(schedule)
@@ -0,0 +1,52 @@
+"""반납/취소된 오래된 스케줄을 schedule_archive로 옮기는 배치 작업
+
+    python -m asset_management.app.schedule.archive [--retention-days N] [--batch-size N]
+
+한 번에 batch_size개씩 옮기고 커밋하므로 운영 테이블을 오래 잠그지 않습니다.
+옮긴 스케줄도 대여이력 조회(GET /api/schedules/{club_id})에는 그대로 나타납니다.
+"""
+import argparse
+from datetime import datetime, timedelta
+
+from sqlalchemy.orm import Session
+
+from asset_management.app.schedule.models import Status
+from asset_management.app.schedule.repositories import ScheduleRepository
+from asset_management.app.schedule.settings import SCHEDULE_SETTINGS
+
+ARCHIVABLE_STATUSES = (Status.RETURNED.value, Status.CANCELLED.value)
+
+
+def archive_closed_schedules(
+  session: Session,
+  retention_days: int = SCHEDULE_SETTINGS.ARCHIVE_RETENTION_DAYS,
+  batch_size: int = SCHEDULE_SETTINGS.ARCHIVE_BATCH_SIZE,
+) -> int:
+  """end_date가 retention_days보다 오래된 반납/취소 스케줄을 보관 테이블로 옮기고 옮긴 개수를 반환합니다."""
+  repository = ScheduleRepository(session)
+  before = datetime.now() - timedelta(days=retention_days)
+  # 작업 중에 새로 생기는 스케줄은 건드리지 않도록 시작 시점의 최대 id까지만 훑는다
+  max_id = repository.get_max_schedule_id()
+
+  moved, after_id = 0, 0
+  while after_id is not None:
+    count, after_id = repository.archive_closed_schedules(before, ARCHIVABLE_STATUSES, after_id, max_id, batch_size)
+    moved += count
+  return moved
+
+
+def main() -> None:
+  from asset_management.database.session import session_scope
+
+  parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+  parser.add_argument("--retention-days", type=int, default=SCHEDULE_SETTINGS.ARCHIVE_RETENTION_DAYS)
+  parser.add_argument("--batch-size", type=int, default=SCHEDULE_SETTINGS.ARCHIVE_BATCH_SIZE)
+  args = parser.parse_args()
+
+  with session_scope() as session:
+    moved = archive_closed_schedules(session, args.retention_days, args.batch_size)
+  print(f"archived {moved} schedules")
+
+
+if __name__ == "__main__":
+  main()
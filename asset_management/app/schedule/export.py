@@ -0,0 +1,52 @@
+import csv
+import io
+from typing import Iterable, Iterator
+
+_ROWS_PER_CHUNK = 500
+
+HEADER = ("id", "asset_id", "asset_name", "user_id", "user_name", "start_date", "end_date", "status", "updated_at")
+
+# 스프레드시트가 수식으로 해석하는 첫 글자
+_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def _isoformat(value) -> str:
+    return value.isoformat() if value is not None else ""
+
+
+def _text(value: str | None) -> str:
+    """사용자가 입력한 값. 수식으로 실행되지 않도록 ' 를 앞에 붙인다 (CSV injection)."""
+    if not value:
+        return ""
+    return "'" + value if value.startswith(_FORMULA_PREFIXES) else value
+
+
+def iter_csv(rows: Iterable) -> Iterator[bytes]:
+    """이력 행을 받아 CSV를 _ROWS_PER_CHUNK 행 단위 조각으로 생성합니다.
+
+    엑셀에서 한글이 깨지지 않도록 UTF-8 BOM을 앞에 붙인다.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    buffer.write("\ufeff")
+    writer.writerow(HEADER)
+
+    count = 0
+    for row in rows:
+        writer.writerow((
+            row.id,
+            row.asset_id,
+            _text(row.asset_name),
+            _text(row.user_id),
+            _text(row.user_name),
+            _isoformat(row.start_date),
+            _isoformat(row.end_date),
+            row.status,
+            _isoformat(row.updated_at),
+        ))
+        count += 1
+        if count % _ROWS_PER_CHUNK == 0:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode("utf-8")
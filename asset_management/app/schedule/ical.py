@@ -0,0 +1,112 @@
+from datetime import datetime, timezone
+from typing import Iterable, Iterator
+
+from asset_management.app.schedule.models import Status
+
+PRODID = "-//wafflestudio//asset-management//KO"
+_EVENTS_PER_CHUNK = 64
+
+# 스케줄 상태 -> iCalendar VEVENT STATUS
+_EVENT_STATUS = {
+    Status.PENDING.value: "TENTATIVE",
+    Status.APPROVED.value: "CONFIRMED",
+    Status.IN_USE.value: "CONFIRMED",
+    Status.RETURNED.value: "CONFIRMED",
+    Status.CANCELLED.value: "CANCELLED",
+}
+
+_STATUS_LABEL = {
+    Status.PENDING.value: "승인 대기",
+    Status.APPROVED.value: "승인됨",
+    Status.IN_USE.value: "사용 중",
+    Status.RETURNED.value: "반납 완료",
+    Status.CANCELLED.value: "취소됨",
+}
+
+
+def _utc(value: datetime) -> str:
+    # 스케줄 시각은 서버 로컬 시간(naive)으로 저장된다.
+    return value.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def _escape(text: str) -> str:
+    return (
+        text.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def _fold(line: str) -> str:
+    """RFC 5545 3.1: 75 octet을 넘는 줄은 CRLF + 공백으로 접는다 (UTF-8 문자 중간에서 자르지 않음)."""
+    encoded = line.encode("utf-8")
+    if len(encoded) <= 75:
+        return line + "\r\n"
+    parts, current, size = [], "", 0
+    for char in line:
+        width = len(char.encode("utf-8"))
+        # 첫 줄 이후에는 앞의 공백 1 octet을 포함해 75 octet
+        limit = 75 if not parts else 74
+        if size + width > limit:
+            parts.append(current)
+            current, size = "", 0
+        current += char
+        size += width
+    parts.append(current)
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def calendar_header(name: str) -> str:
+    return "".join(
+        _fold(line)
+        for line in (
+            "BEGIN:VCALENDAR",
+            "VERSION:2.0",
+            f"PRODID:{PRODID}",
+            "CALSCALE:GREGORIAN",
+            "METHOD:PUBLISH",
+            f"X-WR-CALNAME:{_escape(name)}",
+        )
+    )
+
+
+def calendar_footer() -> str:
+    return _fold("END:VCALENDAR")
+
+
+def render_event(
+    schedule_id: int,
+    asset_name: str,
+    start_date: datetime,
+    end_date: datetime,
+    status: str,
+    updated_at: datetime,
+) -> str:
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:schedule-{schedule_id}@asset-management",
+        f"DTSTAMP:{_utc(updated_at)}",
+        f"LAST-MODIFIED:{_utc(updated_at)}",
+        f"DTSTART:{_utc(start_date)}",
+        f"DTEND:{_utc(end_date)}",
+        f"SUMMARY:{_escape(asset_name)} 대여",
+        f"DESCRIPTION:{_escape(_STATUS_LABEL.get(status, status))}",
+        f"STATUS:{_EVENT_STATUS.get(status, 'CONFIRMED')}",
+        "END:VEVENT",
+    ]
+    return "".join(_fold(line) for line in lines)
+
+
+def iter_calendar(name: str, rows: Iterable) -> Iterator[bytes]:
+    """(id, asset_name, start_date, end_date, status, updated_at) 행을 받아 VCALENDAR를 조각 단위로 생성합니다."""
+    yield calendar_header(name).encode("utf-8")
+    buffer = []
+    for row in rows:
+        buffer.append(render_event(row.id, row.asset_name, row.start_date, row.end_date, row.status, row.updated_at))
+        if len(buffer) >= _EVENTS_PER_CHUNK:
+            yield "".join(buffer).encode("utf-8")
+            buffer = []
+    buffer.append(calendar_footer())
+    yield "".join(buffer).encode("utf-8")
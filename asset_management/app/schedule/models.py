@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
-from sqlalchemy import Integer, DateTime, ForeignKey, String
+from sqlalchemy import Integer, DateTime, ForeignKey, String, Index, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from asset_management.database.common import Base
 
@@ -20,6 +20,19 @@ class Status(Enum):
 
 class Schedule(Base):
     __tablename__ = "schedule"
+    __table_args__ = (
+        # 대여이력 조회(get_schedules): club_id 필터 + (start_date, id) 정렬
+        Index("ix_schedule_club_id_start_date", "club_id", "start_date"),
+        # 일반 사용자의 본인 대여이력 조회
+        Index("ix_schedule_club_id_user_id_start_date", "club_id", "user_id", "start_date"),
+        # 상태별 대여이력 조회
+        Index("ix_schedule_club_id_status_start_date", "club_id", "status", "start_date"),
+        # get_asset_status, 물품별 통계/이력, 예약 구간 겹침 검사
+        Index("ix_schedule_asset_id_status_start_date", "asset_id", "status", "start_date", "end_date"),
+        # 캘린더 피드의 ETag 계산
+        Index("ix_schedule_club_id_updated_at", "club_id", "updated_at"),
+        Index("ix_schedule_user_id_updated_at", "user_id", "updated_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     start_date: Mapped[datetime] = mapped_column(DateTime, nullable=False)
@@ -28,8 +41,37 @@ class Schedule(Base):
     user_id: Mapped[str] = mapped_column(String(36), ForeignKey("user.id"), nullable=False)
     club_id: Mapped[int] = mapped_column(ForeignKey("club.id"), nullable=False)
     status: Mapped[str] = mapped_column(String(20), nullable=False, default=Status.PENDING.value) 
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=datetime.now, onupdate=datetime.now, server_default=func.now()
+    )
 
     # Relationships
     asset: Mapped["Asset"] = relationship(back_populates="schedules")
     user: Mapped["User"] = relationship(back_populates="schedules")
-    club: Mapped["Club"] = relationship(back_populates="schedules")
\ No newline at end of file
+    club: Mapped["Club"] = relationship(back_populates="schedules")
+
+
+class ScheduleArchive(Base):
+    """보관 기간이 지난 반납/취소 스케줄 (cold storage).
+
+    schedule 테이블과 같은 컬럼을 가지며 id도 그대로 옮겨 옵니다. 이력 조회만 하므로
+    외래키와 관계 없이 이력 조회용 인덱스만 둡니다.
+    """
+    __tablename__ = "schedule_archive"
+    __table_args__ = (
+        Index("ix_schedule_archive_club_id_start_date", "club_id", "start_date"),
+        Index("ix_schedule_archive_club_id_user_id_start_date", "club_id", "user_id", "start_date"),
+        # 상태별 대여이력 조회 (운영 테이블의 ix_schedule_club_id_status_start_date와 짝)
+        Index("ix_schedule_archive_club_id_status_start_date", "club_id", "status", "start_date"),
+        Index("ix_schedule_archive_asset_id_start_date", "asset_id", "start_date"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    start_date: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    end_date: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    asset_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    user_id: Mapped[str] = mapped_column(String(36), nullable=False)
+    club_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    status: Mapped[str] = mapped_column(String(20), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    archived_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.now)
@@ -1,27 +1,133 @@
 from datetime import datetime
 from typing import Annotated
 from fastapi import Depends
+from typing import Iterator
+from sqlalchemy import DateTime, and_, case, delete, func, insert, literal, or_, select, union_all, update
 from sqlalchemy.orm import Session
+from asset_management.app.assets.models import Asset
 from asset_management.app.user.models import User
 from asset_management.database.session import get_session
-from asset_management.app.schedule.models import Schedule
+from asset_management.app.schedule.models import Schedule, ScheduleArchive
 from sqlalchemy_pagination import paginate, Page
 
+# 이력 조회에서 운영/보관 테이블을 합칠 때 쓰는 공통 컬럼
+HISTORY_COLUMNS = ("id", "start_date", "end_date", "asset_id", "user_id", "club_id", "status", "updated_at")
+
+
 class ScheduleRepository:
     def __init__(self, db_session: Annotated[Session, Depends(get_session)]):
         self.db_session = db_session
 
-    def get_schedules(self, page: int, size: int, start_date: datetime = None, end_date: datetime = None, **filters) -> Page:
-        query = self.db_session.query(Schedule)
+    def _history_branch(
+        self,
+        model,
+        start_date: datetime = None,
+        end_date: datetime = None,
+        after: tuple[datetime, int] | None = None,
+        limit: int | None = None,
+        **filters,
+    ):
+        stmt = select(*[getattr(model, column) for column in HISTORY_COLUMNS])
         for attr, value in filters.items():
             if value is not None:
-                query = query.filter(getattr(Schedule, attr) == value)
+                stmt = stmt.where(getattr(model, attr) == value)
         if start_date is not None:
-            query = query.filter(Schedule.start_date >= start_date)
+            stmt = stmt.where(model.start_date >= start_date)
         if end_date is not None:
-            query = query.filter(Schedule.end_date <= end_date)
+            stmt = stmt.where(model.end_date <= end_date)
+        if after is not None:
+            after_start, after_id = after
+            stmt = stmt.where(
+                or_(
+                    model.start_date > after_start,
+                    and_(model.start_date == after_start, model.id > after_id),
+                )
+            )
+        if limit is not None:
+            # 각 테이블에서 인덱스 순서대로 limit개만 읽고 합친다
+            stmt = select(stmt.order_by(model.start_date, model.id).limit(limit).subquery())
+        return stmt
+
+    def _history(self, **kwargs):
+        """운영 테이블(schedule)과 보관 테이블(schedule_archive)의 이력을 UNION ALL 한 서브쿼리.
+
+        필터는 각 테이블 쿼리 안에 넣어 양쪽 모두 인덱스를 타게 합니다.
+        """
+        return union_all(
+            self._history_branch(Schedule, **kwargs),
+            self._history_branch(ScheduleArchive, **kwargs),
+        ).subquery("schedule_history")
+
+    def get_schedules(self, page: int, size: int, start_date: datetime = None, end_date: datetime = None, **filters) -> Page:
+        history = self._history(start_date=start_date, end_date=end_date, **filters)
+        query = self.db_session.query(history).order_by(history.c.start_date, history.c.id)
         return paginate(query, page, size)
 
+    def get_schedules_after(
+        self,
+        size: int,
+        after: tuple[datetime, int] | None = None,
+        with_total: bool = False,
+        start_date: datetime = None,
+        end_date: datetime = None,
+        **filters,
+    ) -> tuple[list, bool, int | None]:
+        """(start_date, id) 순 keyset 페이지네이션. OFFSET 없이 마지막 행 다음부터 size개를 가져옵니다.
+
+        Returns:
+            (schedules, has_next, total) — total은 with_total일 때만 COUNT 결과, 아니면 None
+        """
+        total = None
+        if with_total:
+            total = self.db_session.query(self._history(start_date=start_date, end_date=end_date, **filters)).count()
+        history = self._history(start_date=start_date, end_date=end_date, after=after, limit=size + 1, **filters)
+        rows = (
+            self.db_session.query(history)
+            .order_by(history.c.start_date, history.c.id)
+            .limit(size + 1)
+            .all()
+        )
+        return rows[:size], len(rows) > size, total
+
+    def archive_closed_schedules(self, before: datetime, statuses: tuple[str, ...], after_id: int, max_id: int, batch_size: int) -> tuple[int, int | None]:
+        """id > after_id 부터 PK 순서로 훑으며 보관 대상 스케줄을 최대 batch_size개 옮기고 커밋합니다.
+
+        Returns:
+            (옮긴 행 수, 다음 배치를 시작할 id — 더 없으면 None)
+        """
+        ids = self.db_session.scalars(
+            select(Schedule.id)
+            .where(
+                Schedule.id > after_id,
+                Schedule.id <= max_id,
+                Schedule.status.in_(statuses),
+                Schedule.end_date < before,
+            )
+            .order_by(Schedule.id)
+            .limit(batch_size)
+        ).all()
+        if not ids:
+            return 0, None
+
+        archived_at = datetime.now()
+        self.db_session.execute(
+            insert(ScheduleArchive).from_select(
+                [*HISTORY_COLUMNS, "archived_at"],
+                select(
+                    *[getattr(Schedule, column) for column in HISTORY_COLUMNS],
+                    literal(archived_at, DateTime),
+                ).where(Schedule.id.in_(ids)),
+            )
+        )
+        self.db_session.execute(
+            delete(Schedule).where(Schedule.id.in_(ids)).execution_options(synchronize_session=False)
+        )
+        self.db_session.commit()
+        return len(ids), ids[-1]
+
+    def get_max_schedule_id(self) -> int:
+        return self.db_session.scalar(select(func.max(Schedule.id))) or 0
+
     def add_schedule(self, schedule: Schedule) -> Schedule:
         self.db_session.add(schedule)
         self.db_session.commit()
@@ -49,5 +155,131 @@ class ScheduleRepository:
         self.db_session.commit()
         return True
     
+    def get_asset_for_update(self, asset_id: int) -> Asset | None:
+        """물품 행을 잠가 같은 물품에 대한 동시 예약 생성을 직렬화합니다."""
+        return self.db_session.query(Asset).filter(Asset.id == asset_id).with_for_update().first()
+
+    def get_overlapping_intervals(
+        self,
+        asset_id: int,
+        start_date: datetime,
+        end_date: datetime,
+        statuses: tuple[str, ...],
+        exclude_id: int | None = None,
+    ) -> list[tuple[datetime, datetime]]:
+        """[start_date, end_date)와 겹치는 예약 구간만 가져옵니다. exclude_id는 수정 중인 예약 자신.
+
+        ix_schedule_asset_id_status_start_date 인덱스만으로 처리되며, 물품의 전체 이력을 읽지 않습니다.
+        """
+        query = self.db_session.query(Schedule.start_date, Schedule.end_date).filter(
+            Schedule.asset_id == asset_id,
+            Schedule.status.in_(statuses),
+            Schedule.start_date < end_date,
+            Schedule.end_date > start_date,
+        )
+        if exclude_id is not None:
+            query = query.filter(Schedule.id != exclude_id)
+        rows = query.all()
+        return [(row.start_date, row.end_date) for row in rows]
+
+    def get_feed_version(self, club_id: int | None = None, user_id: str | None = None) -> tuple[int, int | None, datetime | None]:
+        """피드 캐시 검증용 (행 수, 최대 id, 최근 수정 시각). 삭제는 행 수로, 수정은 updated_at으로 잡힙니다."""
+        query = self.db_session.query(func.count(Schedule.id), func.max(Schedule.id), func.max(Schedule.updated_at))
+        if club_id is not None:
+            query = query.filter(Schedule.club_id == club_id)
+        if user_id is not None:
+            query = query.filter(Schedule.user_id == user_id)
+        count, max_id, last_modified = query.one()
+        return count, max_id, last_modified
+
+    def iter_feed_rows(
+        self, since: datetime, club_id: int | None = None, user_id: str | None = None, batch_size: int = 500
+    ) -> Iterator:
+        """캘린더 피드용 행을 서버 사이드 커서로 batch_size씩 흘려보냅니다."""
+        query = (
+            self.db_session.query(
+                Schedule.id,
+                Asset.name.label("asset_name"),
+                Schedule.start_date,
+                Schedule.end_date,
+                Schedule.status,
+                Schedule.updated_at,
+            )
+            .join(Asset, Asset.id == Schedule.asset_id)
+            .filter(Schedule.end_date >= since)
+        )
+        if club_id is not None:
+            query = query.filter(Schedule.club_id == club_id)
+        if user_id is not None:
+            query = query.filter(Schedule.user_id == user_id)
+        return iter(query.order_by(Schedule.start_date, Schedule.id).yield_per(batch_size))
+
+    def iter_history_rows(self, batch_size: int = 500, **kwargs) -> Iterator:
+        """내보내기용 이력 행(보관분 포함)을 서버 사이드 커서로 batch_size씩 흘려보냅니다.
+
+        물품/사용자가 삭제된 보관 이력도 빠지지 않도록 이름은 outer join으로 붙입니다.
+        """
+        history = self._history(**kwargs)
+        query = (
+            self.db_session.query(
+                history,
+                Asset.name.label("asset_name"),
+                User.name.label("user_name"),
+            )
+            .outerjoin(Asset, Asset.id == history.c.asset_id)
+            .outerjoin(User, User.id == history.c.user_id)
+            .order_by(history.c.start_date, history.c.id)
+        )
+        return iter(query.yield_per(batch_size))
+
+    def lock_schedules(self, club_id: int, schedule_ids: list[int]) -> list:
+        """동아리의 스케줄 (id, asset_id, status)를 한 번에 잠가 가져옵니다."""
+        return (
+            self.db_session.query(Schedule.id, Schedule.asset_id, Schedule.status)
+            .filter(Schedule.id.in_(schedule_ids), Schedule.club_id == club_id)
+            .with_for_update()
+            .all()
+        )
+
+    def lock_available_quantities(self, asset_ids: list[int]) -> dict[int, int]:
+        rows = (
+            self.db_session.query(Asset.id, Asset.available_quantity)
+            .filter(Asset.id.in_(asset_ids))
+            .with_for_update()
+            .all()
+        )
+        return {row.id: row.available_quantity for row in rows}
+
+    def adjust_available_quantities(self, deltas: dict[int, int]) -> None:
+        """물품별 available_quantity 증감을 UPDATE 한 번으로 반영합니다."""
+        if not deltas:
+            return
+        self.db_session.execute(
+            update(Asset)
+            .where(Asset.id.in_(list(deltas)))
+            .values(available_quantity=Asset.available_quantity + case(deltas, value=Asset.id, else_=0))
+            .execution_options(synchronize_session=False)
+        )
+
+    def bulk_update_status(
+        self, schedule_ids: list[int], from_statuses: tuple[str, ...], **values
+    ) -> int:
+        """UPDATE ... WHERE id IN (...) AND status IN (...). 커밋은 호출하는 쪽에서 합니다."""
+        if not schedule_ids:
+            return 0
+        result = self.db_session.execute(
+            update(Schedule)
+            .where(Schedule.id.in_(schedule_ids), Schedule.status.in_(from_statuses))
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
+    def commit(self) -> None:
+        self.db_session.commit()
+
+    def rollback(self) -> None:
+        self.db_session.rollback()
+
     def is_admin(self, user_id: str) -> bool:
         return self.db_session.query(User).filter(User.id == user_id).first().is_admin
\ No newline at end of file
@@ -1,10 +1,18 @@
 from datetime import datetime
 from typing import Annotated
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
+from asset_management.app.club_member.services import ClubMemberService
 from asset_management.app.schedule.models import Status
 from asset_management.app.schedule.services import ScheduleService
-from asset_management.app.auth.utils import login_with_header
+from asset_management.app.auth.claims import AccessClaims, login_with_claims
+from asset_management.app.auth.utils import issue_feed_token, login_with_feed_token, login_with_header
+from asset_management.app.conditional import not_modified
 from asset_management.app.schedule.schemas import (
+  CalendarFeedTokenResponse,
+  ScheduleBulkStatusRequest,
+  ScheduleBulkStatusResponse,
+  ScheduleCursorResponse,
   ScheduleListResponse,
   ScheduleResponse,
   ScheduleUpdate,
@@ -14,6 +22,62 @@ from asset_management.app.schedule.schemas import (
 router = APIRouter(prefix="/schedules", tags=["schedules"])
 
 
+def _calendar_response(
+  request: Request,
+  schedule_service: ScheduleService,
+  name: str,
+  club_id: int | None = None,
+  user_id: str | None = None,
+) -> Response:
+  # 삭제나 90일 기간 이동은 updated_at으로 드러나지 않으므로 Last-Modified 없이 ETag로만 재검증
+  etag = schedule_service.get_feed_etag(club_id=club_id, user_id=user_id)
+  headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+  if not_modified(request, etag, None):
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+  return StreamingResponse(
+    schedule_service.iter_calendar_feed(name, club_id=club_id, user_id=user_id),
+    media_type="text/calendar; charset=utf-8",
+    headers=headers,
+  )
+
+
+@router.get("/calendar/token")
+def get_calendar_feed_token(my_id=Depends(login_with_header)) -> CalendarFeedTokenResponse:
+  """캘린더 구독용 토큰 발급
+
+  캘린더 앱은 Authorization 헤더를 보낼 수 없으므로, 피드 URL의 token 쿼리로 인증합니다."""
+  token = issue_feed_token(my_id)
+  return CalendarFeedTokenResponse(token=token, user_feed_url=f"/api/schedules/calendar/me.ics?token={token}")
+
+
+@router.get("/calendar/me.ics")
+def get_my_calendar_feed(
+  request: Request,
+  schedule_service: Annotated[ScheduleService, Depends()],
+  my_id=Depends(login_with_feed_token),
+) -> Response:
+  """내 대여 일정 iCalendar 피드
+
+  ETag를 제공하므로 변경이 없으면 304를 반환합니다."""
+  return _calendar_response(request, schedule_service, "내 대여 일정", user_id=my_id)
+
+
+@router.get("/calendar/club/{club_id}.ics")
+def get_club_calendar_feed(
+  club_id: int,
+  request: Request,
+  schedule_service: Annotated[ScheduleService, Depends()],
+  club_member_service: Annotated[ClubMemberService, Depends()],
+  my_id=Depends(login_with_feed_token),
+) -> Response:
+  """동아리 대여 일정 iCalendar 피드 (동아리원 전용)"""
+  if club_member_service.check_club_permission(my_id, club_id) not in [0, 1]:
+    raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Permission denied")
+  return _calendar_response(request, schedule_service, "동아리 대여 일정", club_id=club_id)
+
+
 @router.get("/{club_id}")
 def get_schedules(
   schedule_service: Annotated[ScheduleService, Depends()] ,
@@ -25,14 +89,33 @@ def get_schedules(
   end_date: datetime | None = None,
   page: int = 1,
   size: int = 10,
-  my_id=Depends(login_with_header),
-) -> ScheduleListResponse:
+  cursor: str | None = None,
+  with_total: bool = False,
+  claims: AccessClaims = Depends(login_with_claims),
+) -> ScheduleListResponse | ScheduleCursorResponse:
   """대여이력 조회
 
-  일반 사용자는 자신의 대여이력, 관리자는 모든 사용자의 대여이력을 조회할 수 있습니다."""
-  if schedule_service.is_admin(my_id) is False:
-    user_id = my_id
-  
+  일반 사용자는 자신의 대여이력, 관리자는 모든 사용자의 대여이력을 조회할 수 있습니다.
+
+  cursor 파라미터를 주면 (start_date, id) 순 커서 페이지네이션으로 동작합니다.
+  첫 페이지는 `cursor=`(빈 값)로 요청하고, 이후 응답의 next_cursor를 그대로 넘기면 됩니다.
+  커서 모드에서 total은 with_total=true일 때만 계산됩니다."""
+  if not claims.is_admin:
+    user_id = claims.user_id
+
+  if cursor is not None:
+    return schedule_service.get_schedule_by_cursor(
+      club_id=club_id,
+      cursor=cursor,
+      with_total=with_total,
+      status=status,
+      user_id=user_id,
+      asset_id=asset_id,
+      start_date=start_date,
+      end_date=end_date,
+      size=size,
+    )
+
   return schedule_service.get_schedule(
     club_id=club_id,
     status=status,
@@ -45,6 +128,39 @@ def get_schedules(
   )
 
 
+@router.get("/{club_id}/export")
+def export_schedules(
+  schedule_service: Annotated[ScheduleService, Depends()],
+  club_id: int,
+  status: str | None = None,
+  user_id: str | None = None,
+  asset_id: int | None = None,
+  start_date: datetime | None = None,
+  end_date: datetime | None = None,
+  claims: AccessClaims = Depends(login_with_claims),
+) -> StreamingResponse:
+  """대여이력 CSV 내보내기
+
+  대여이력 조회와 같은 필터를 받으며, 페이지 구분 없이 조건에 맞는 이력 전체를 (start_date, id) 순으로 스트리밍합니다.
+  일반 사용자는 자신의 대여이력만 내보낼 수 있습니다."""
+  if not claims.is_admin:
+    user_id = claims.user_id
+
+  filename = f"schedules-{club_id}-{datetime.now():%Y%m%d}.csv"
+  return StreamingResponse(
+    schedule_service.export_csv(
+      club_id=club_id,
+      status=status,
+      user_id=user_id,
+      asset_id=asset_id,
+      start_date=start_date,
+      end_date=end_date,
+    ),
+    media_type="text/csv; charset=utf-8",
+    headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+  )
+
+
 @router.post("/{club_id}", status_code=201)
 def new_schedule(
   request: ScheduleCreate,
@@ -56,6 +172,22 @@ def new_schedule(
   return schedule_service.create_schedule(club_id, request)
 
 
+@router.patch("/{club_id}/status")
+def bulk_update_schedule_status(
+  club_id: int,
+  request: ScheduleBulkStatusRequest,
+  schedule_service: Annotated[ScheduleService, Depends()],
+  claims: Annotated[AccessClaims, Depends(login_with_claims)],
+) -> ScheduleBulkStatusResponse:
+  """대여이력 상태 일괄 변경 (관리자 전용)
+
+  허용되는 전이만 반영합니다: pending→approved/cancelled, approved→in_use/cancelled, in_use→returned.
+  반영되지 않은 id는 skipped에 사유(not_found, invalid_transition, insufficient_quantity)와 함께 반환됩니다."""
+  if claims.club_permission(club_id) != 1:
+    raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Permission denied")
+  return schedule_service.bulk_update_status(club_id, request)
+
+
 @router.put("/{schedule_id}")
 def update_schedule(
   schedule_id: int,
@@ -1,5 +1,5 @@
 from fastapi import HTTPException
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, Field, field_validator
 from datetime import datetime
 from asset_management.app.schedule.models import Status
 
@@ -47,4 +47,33 @@ class ScheduleListResponse(BaseModel):
   total: int
   page: int
   size: int
-  pages: int
\ No newline at end of file
+  pages: int
+
+class ScheduleCursorResponse(BaseModel):
+  schedules: list[ScheduleResponse]
+  size: int
+  next_cursor: str | None = None
+  total: int | None = None
+
+class CalendarFeedTokenResponse(BaseModel):
+  token: str
+  user_feed_url: str
+
+class ScheduleBulkStatusRequest(BaseModel):
+  schedule_ids: list[int] = Field(..., min_length=1, max_length=500)
+  status: str
+
+  @field_validator("status")
+  def validate_status(cls, value):
+    if value not in map(lambda x: x.value, Status):
+      raise HTTPException(status_code=400, detail="Invalid status value")
+    return value
+
+class ScheduleBulkSkipped(BaseModel):
+  id: int
+  reason: str  # not_found, invalid_transition, insufficient_quantity
+
+class ScheduleBulkStatusResponse(BaseModel):
+  status: str
+  updated: list[int]
+  skipped: list[ScheduleBulkSkipped]
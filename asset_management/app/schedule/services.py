@@ -1,15 +1,29 @@
-from datetime import datetime
-from typing import Annotated
+import hashlib
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Annotated, Iterator
 from fastapi import Depends, HTTPException
+from asset_management.app.assets.cache import AVAILABILITY_CACHE
 from asset_management.app.schedule.models import Schedule, Status
 from asset_management.app.schedule.repositories import ScheduleRepository
+from asset_management.app.schedule.export import iter_csv
+from asset_management.app.schedule.ical import iter_calendar
+from asset_management.app.schedule.utils import ACTIVE_STATUSES, ALLOWED_TRANSITIONS, max_concurrent_use
+from asset_management.database.pagination import decode_cursor, encode_cursor
 from asset_management.app.schedule.schemas import (
+  ScheduleBulkSkipped,
+  ScheduleBulkStatusRequest,
+  ScheduleBulkStatusResponse,
   ScheduleCreate,
+  ScheduleCursorResponse,
   ScheduleListResponse,
   ScheduleResponse,
   ScheduleUpdate,
 )
 
+# 캘린더 피드에 포함할 과거 이력 기간
+FEED_HISTORY_DAYS = 90
+
 
 class ScheduleService:
   def __init__(self, repository: Annotated[ScheduleRepository, Depends()]):
@@ -55,13 +69,73 @@ class ScheduleService:
       pages=schedules.pages,
     )
 
+  def get_schedule_by_cursor(
+    self,
+    club_id: int,
+    cursor: str | None = None,
+    with_total: bool = False,
+    status: str = None,
+    user_id: str = None,
+    asset_id: int = None,
+    start_date: datetime = None,
+    end_date: datetime = None,
+    size: int = 10,
+  ) -> ScheduleCursorResponse:
+    after = None
+    if cursor:
+      try:
+        after_start, after_id = decode_cursor(cursor)
+        after = (datetime.fromisoformat(after_start), int(after_id))
+      except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    schedules, has_next, total = self.repository.get_schedules_after(
+      size=size,
+      after=after,
+      with_total=with_total,
+      club_id=club_id,
+      status=status,
+      user_id=user_id,
+      asset_id=asset_id,
+      start_date=start_date,
+      end_date=end_date,
+    )
+
+    next_cursor = None
+    if has_next and schedules:
+      last = schedules[-1]
+      next_cursor = encode_cursor(last.start_date.isoformat(), last.id)
+
+    return ScheduleCursorResponse(
+      schedules=[
+        ScheduleResponse(
+          id=s.id,
+          start_date=s.start_date,
+          end_date=s.end_date,
+          asset_id=s.asset_id,
+          user_id=s.user_id,
+          club_id=s.club_id,
+          status=s.status,
+        ) for s in schedules
+      ],
+      size=size,
+      next_cursor=next_cursor,
+      total=total,
+    )
+
   def create_schedule(
     self, club_id: int, schedule_data: ScheduleCreate
   ) -> ScheduleResponse:
-    # 중복 스케줄 체크 (선택적)
+    if schedule_data.end_date <= schedule_data.start_date:
+      raise HTTPException(status_code=400, detail="end_date must be after start_date")
+
+    self._reserve_quantity(
+      schedule_data.asset_id, schedule_data.start_date, schedule_data.end_date, schedule_data.status
+    )
     schedule = self.repository.add_schedule(
       Schedule(club_id=club_id, **schedule_data.model_dump())
     )
+    AVAILABILITY_CACHE.invalidate(schedule.club_id)
     return ScheduleResponse(
       id=schedule.id,
       start_date=schedule.start_date,
@@ -72,12 +146,47 @@ class ScheduleService:
       status=schedule.status,
     )
 
+  def _reserve_quantity(
+    self, asset_id: int, start_date: datetime, end_date: datetime, status: str, exclude_id: int | None = None
+  ) -> None:
+    """물품 행을 잠그고, 수량을 점유하는 상태라면 겹치는 예약 수가 총 수량을 넘지 않는지 체크합니다.
+
+    잠금은 커밋/롤백까지 유지되므로 같은 물품의 예약 생성/수정이 직렬화됩니다.
+    exclude_id는 수정 중인 예약 자신 (자기 자신과 겹치는 것으로 세지 않음).
+    """
+    asset = self.repository.get_asset_for_update(asset_id)
+    if asset is None:
+      self.repository.rollback()
+      raise HTTPException(status_code=404, detail="Asset not found")
+    if status in ACTIVE_STATUSES:
+      overlapping = self.repository.get_overlapping_intervals(
+        asset.id, start_date, end_date, ACTIVE_STATUSES, exclude_id=exclude_id
+      )
+      if max_concurrent_use(overlapping, start_date, end_date) + 1 > asset.total_quantity:
+        self.repository.rollback()
+        raise HTTPException(status_code=409, detail="Asset is fully booked for the requested period")
+
   def update_schedule(self, schedule_id: int, schedule_data: ScheduleUpdate) -> ScheduleResponse:
     # 업데이트할 필드만 추출
     update_dict = {k: v for k, v in schedule_data.model_dump().items() if v is not None}
+    schedule = self.repository.get_schedule_by_id(schedule_id)
+    if not schedule:
+      raise HTTPException(status_code=404, detail="Schedule not found")
+
+    # 수정 후 상태가 수량을 점유하면 생성과 같은 기준으로 다시 체크 (날짜/물품 변경, 취소 → 대기 등)
+    asset_id = update_dict.get("asset_id", schedule.asset_id)
+    start_date = update_dict.get("start_date", schedule.start_date)
+    end_date = update_dict.get("end_date", schedule.end_date)
+    status = update_dict.get("status", schedule.status)
+    if end_date <= start_date:
+      raise HTTPException(status_code=400, detail="end_date must be after start_date")
+    if status in ACTIVE_STATUSES:
+      self._reserve_quantity(asset_id, start_date, end_date, status, exclude_id=schedule_id)
+
     updated_schedule = self.repository.update_schedule(schedule_id, **update_dict)
     if not updated_schedule:
       raise HTTPException(status_code=404, detail="Schedule not found")
+    AVAILABILITY_CACHE.invalidate(updated_schedule.club_id)
     return ScheduleResponse(
       id=updated_schedule.id,
       start_date=updated_schedule.start_date,
@@ -88,6 +197,65 @@ class ScheduleService:
       status=updated_schedule.status,
     )
 
+  def bulk_update_status(self, club_id: int, request: ScheduleBulkStatusRequest) -> ScheduleBulkStatusResponse:
+    """여러 스케줄의 상태를 한 번에 바꿉니다.
+
+    대상 스케줄과 물품 행을 잠근 뒤 허용된 전이만 골라 UPDATE ... WHERE id IN (...) AND status IN (...)
+    한 번으로 반영하고, 사용 중(in_use)으로 들어가거나 나오는 만큼 물품별 available_quantity를 합산해 조정합니다.
+    사용 중으로 바꿀 때 물품 수량이 모자라면 요청 순서대로 남은 수량만큼만 반영합니다.
+    """
+    target = request.status
+    allowed_from = ALLOWED_TRANSITIONS[target]
+    requested = list(dict.fromkeys(request.schedule_ids))
+
+    rows = self.repository.lock_schedules(club_id, requested)
+    found = {row.id: row for row in rows}
+    skipped = [ScheduleBulkSkipped(id=i, reason="not_found") for i in requested if i not in found]
+    eligible = []
+    for schedule_id in requested:
+      row = found.get(schedule_id)
+      if row is None:
+        continue
+      if row.status in allowed_from:
+        eligible.append(row)
+      else:
+        skipped.append(ScheduleBulkSkipped(id=schedule_id, reason="invalid_transition"))
+
+    per_asset = Counter(row.asset_id for row in eligible)
+    deltas: dict[int, int] = {}
+    if target == Status.IN_USE.value:
+      # 수량이 모자라면 요청 순서대로 남은 수량만큼만 반영
+      available = self.repository.lock_available_quantities(list(per_asset))
+      fits = []
+      for row in eligible:
+        if available.get(row.asset_id, 0) > 0:
+          available[row.asset_id] -= 1
+          deltas[row.asset_id] = deltas.get(row.asset_id, 0) - 1
+          fits.append(row)
+        else:
+          skipped.append(ScheduleBulkSkipped(id=row.id, reason="insufficient_quantity"))
+      eligible = fits
+    elif target == Status.RETURNED.value:
+      deltas = dict(per_asset)
+
+    values = {"status": target}
+    if target == Status.RETURNED.value:
+      values["end_date"] = datetime.now()
+    updated_ids = [row.id for row in eligible]
+    try:
+      # 대상 행을 잠가 두었으므로 모두 바뀌어야 함. 아니면 수량 조정이 어긋나므로 되돌림
+      if self.repository.bulk_update_status(updated_ids, allowed_from, **values) != len(updated_ids):
+        raise HTTPException(status_code=409, detail="Schedules changed during the update")
+      self.repository.adjust_available_quantities(deltas)
+      self.repository.commit()
+    except Exception:
+      self.repository.rollback()
+      raise
+    if updated_ids:
+      AVAILABILITY_CACHE.invalidate(club_id)
+
+    return ScheduleBulkStatusResponse(status=target, updated=updated_ids, skipped=skipped)
+
   def delete_schedule(self, schedule_id: int, user_id: str) -> None:
     schedule = self.repository.get_schedule_by_id(schedule_id)
     if not schedule:
@@ -95,6 +263,45 @@ class ScheduleService:
     if schedule.user_id != user_id and not self.is_admin(user_id):
       raise HTTPException(status_code=403, detail="Not authorized to delete this schedule")
     self.repository.delete_schedule(schedule_id)
+    AVAILABILITY_CACHE.invalidate(schedule.club_id)
+
+  def _feed_since(self) -> datetime:
+    # 하루 단위로 고정해 같은 날에는 같은 ETag가 나오도록 한다
+    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    return today - timedelta(days=FEED_HISTORY_DAYS)
+
+  def get_feed_etag(self, club_id: int | None = None, user_id: str | None = None) -> str:
+    """캘린더 피드의 ETag. 피드 본문을 만들지 않고 집계 쿼리 한 번으로 계산합니다.
+
+    삭제는 행 수/최대 id로, 수정은 updated_at으로, 기간 이동은 날짜로 바뀝니다.
+    """
+    count, max_id, last_modified = self.repository.get_feed_version(club_id=club_id, user_id=user_id)
+    scope = f"club:{club_id}" if club_id is not None else f"user:{user_id}"
+    raw = f"{scope}:{count}:{max_id}:{last_modified}:{self._feed_since().date()}"
+    return '"' + hashlib.sha1(raw.encode("utf-8")).hexdigest() + '"'
+
+  def iter_calendar_feed(self, name: str, club_id: int | None = None, user_id: str | None = None) -> Iterator[bytes]:
+    rows = self.repository.iter_feed_rows(self._feed_since(), club_id=club_id, user_id=user_id)
+    return iter_calendar(name, rows)
+
+  def export_csv(
+    self,
+    club_id: int,
+    status: str = None,
+    user_id: str = None,
+    asset_id: int = None,
+    start_date: datetime = None,
+    end_date: datetime = None,
+  ) -> Iterator[bytes]:
+    rows = self.repository.iter_history_rows(
+      club_id=club_id,
+      status=status,
+      user_id=user_id,
+      asset_id=asset_id,
+      start_date=start_date,
+      end_date=end_date,
+    )
+    return iter_csv(rows)
 
   def is_admin(self, user_id: str) -> bool:
     return self.repository.is_admin(user_id)
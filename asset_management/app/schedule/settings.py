@@ -0,0 +1,15 @@
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from asset_management.settings import SETTINGS
+
+class ScheduleSettings(BaseSettings):
+    # 반납/취소 후 이 기간(일)이 지난 스케줄은 schedule_archive로 옮긴다
+    ARCHIVE_RETENTION_DAYS: int = 180
+    ARCHIVE_BATCH_SIZE: int = 1000
+
+    model_config = SettingsConfigDict(
+        case_sensitive=False,
+        env_file=SETTINGS.env_file,
+        extra='ignore'
+    )
+
+SCHEDULE_SETTINGS = ScheduleSettings()
@@ -0,0 +1,76 @@
+from datetime import datetime
+from typing import Iterable
+
+from asset_management.app.schedule.models import Status
+
+# 물품 수량을 점유하는 상태 (반납/취소는 제외)
+ACTIVE_STATUSES = (Status.PENDING.value, Status.APPROVED.value, Status.IN_USE.value)
+
+# 목표 상태 -> 그 상태로 바꿀 수 있는 현재 상태
+ALLOWED_TRANSITIONS = {
+    Status.PENDING.value: (),
+    Status.APPROVED.value: (Status.PENDING.value,),
+    Status.IN_USE.value: (Status.APPROVED.value,),
+    Status.RETURNED.value: (Status.IN_USE.value,),
+    Status.CANCELLED.value: (Status.PENDING.value, Status.APPROVED.value),
+}
+
+
+def max_concurrent_use(
+    intervals: Iterable[tuple[datetime, datetime]], start: datetime, end: datetime
+) -> int:
+    """[start, end) 구간에서 동시에 겹치는 구간 수의 최댓값을 sweep-line으로 계산합니다.
+
+    구간은 반열린 구간 [s, e)로 취급하므로, 한 예약이 끝나는 시각에 시작하는 예약은 겹치지 않습니다.
+    """
+    events = []
+    for s, e in intervals:
+        s, e = max(s, start), min(e, end)
+        if s < e:
+            events.append((s, 1))
+            events.append((e, -1))
+    # 같은 시각이면 종료(-1)를 먼저 처리
+    events.sort()
+
+    current = peak = 0
+    for _, delta in events:
+        current += delta
+        peak = max(peak, current)
+    return peak
+
+
+def free_timeline(
+    intervals: Iterable[tuple[datetime, datetime]], total: int, start: datetime, end: datetime
+) -> list[tuple[datetime, datetime, int]]:
+    """[start, end) 구간을 남은 수량이 일정한 구간들로 나눕니다.
+
+    시작/종료 이벤트를 시간순으로 sweep 하면서 사용 중인 수량이 바뀌는 지점마다 구간을 끊고,
+    남은 수량이 같은 인접 구간은 하나로 합칩니다.
+
+    Returns:
+        (구간 시작, 구간 끝, 남은 수량) 목록. 남은 수량은 0 미만으로 내려가지 않습니다.
+    """
+    deltas: dict[datetime, int] = {}
+    for s, e in intervals:
+        s, e = max(s, start), min(e, end)
+        if s < e:
+            deltas[s] = deltas.get(s, 0) + 1
+            deltas[e] = deltas.get(e, 0) - 1
+
+    timeline: list[tuple[datetime, datetime, int]] = []
+    cursor, in_use = start, 0
+    for at in sorted(deltas):
+        if at > cursor:
+            _append_slot(timeline, cursor, at, max(total - in_use, 0))
+            cursor = at
+        in_use += deltas[at]
+    if cursor < end:
+        _append_slot(timeline, cursor, end, max(total - in_use, 0))
+    return timeline
+
+
+def _append_slot(timeline: list, start: datetime, end: datetime, free: int) -> None:
+    if timeline and timeline[-1][2] == free and timeline[-1][1] == start:
+        timeline[-1] = (timeline[-1][0], end, free)
+    else:
+        timeline.append((start, end, free))
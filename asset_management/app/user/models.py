@@ -1,6 +1,6 @@
 import uuid
 from typing import List, Optional, TYPE_CHECKING
-from sqlalchemy import String, Integer, ForeignKey
+from sqlalchemy import String, Integer, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from asset_management.database.common import Base
 
@@ -24,10 +24,12 @@ class User(Base):
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     name: Mapped[str] = mapped_column(String(30), nullable=False)
     email: Mapped[Optional[str]] = mapped_column(String(30), nullable=True)
-    hashed_password: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+    hashed_password: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     social_email: Mapped[Optional[str]] = mapped_column(String(30), nullable=True)
     is_admin: Mapped[bool] = mapped_column(nullable=False, default=False)
     student_id: Mapped[Optional[str]] = mapped_column(String(10), nullable=True)
+    # 동아리 권한/관리자 여부가 바뀔 때마다 1씩 증가 (access token의 권한 claim이 최신인지 판단)
+    membership_version: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
 
     # Relationships
     user_clublists: Mapped[List["UserClublist"]] = relationship(back_populates="user")
@@ -39,6 +41,10 @@ class User(Base):
 
 class UserClublist(Base):
     __tablename__ = "user_clublist"
+    __table_args__ = (
+        # 관리자 가입 신청 목록/개수 (club_id, permission=APPLICANT)
+        Index("ix_user_clublist_club_id_permission", "club_id", "permission"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     user_id: Mapped[str] = mapped_column(String(36), ForeignKey("user.id"), nullable=False)
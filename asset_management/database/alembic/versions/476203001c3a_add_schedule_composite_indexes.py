@@ -0,0 +1,38 @@
+"""add schedule composite indexes
+
+Revision ID: 476203001c3a
+Revises: 402464aa8488
+Create Date: 2026-10-19 10:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from asset_management.database.migration_helpers import drop_indexes_keeping_fk_indexes
+
+
+# revision identifiers, used by Alembic.
+revision: str = '476203001c3a'
+down_revision: Union[str, Sequence[str], None] = '402464aa8488'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_schedule_club_id_start_date', 'schedule', ['club_id', 'start_date'], unique=False)
+    op.create_index('ix_schedule_club_id_user_id_start_date', 'schedule', ['club_id', 'user_id', 'start_date'], unique=False)
+    op.create_index('ix_schedule_club_id_status_start_date', 'schedule', ['club_id', 'status', 'start_date'], unique=False)
+    op.create_index('ix_schedule_asset_id_status', 'schedule', ['asset_id', 'status'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    drop_indexes_keeping_fk_indexes('schedule', [
+        'ix_schedule_asset_id_status',
+        'ix_schedule_club_id_status_start_date',
+        'ix_schedule_club_id_user_id_start_date',
+        'ix_schedule_club_id_start_date',
+    ])
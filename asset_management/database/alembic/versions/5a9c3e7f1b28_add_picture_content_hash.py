@@ -0,0 +1,43 @@
+"""add picture content hash
+
+Revision ID: 5a9c3e7f1b28
+Revises: d7e4c19b0a62
+Create Date: 2026-10-19 16:02:31.418502
+
+사진 원본을 BlobStore로 옮기기 위해 content_hash를 추가하고 data를 nullable로 바꿉니다.
+기존 사진은 배포 후 `python -m asset_management.app.picture.migrate_blobs`로 옮깁니다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5a9c3e7f1b28'
+down_revision: Union[str, Sequence[str], None] = 'd7e4c19b0a62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('picture', sa.Column('content_hash', sa.String(length=64), nullable=True))
+    op.create_index(op.f('ix_picture_content_hash'), 'picture', ['content_hash'], unique=False)
+    op.alter_column('picture', 'data',
+               existing_type=sa.LargeBinary().with_variant(mysql.LONGBLOB(), 'mysql'),
+               nullable=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema.
+
+    저장소로 옮긴 사진(data가 NULL)이 남아 있으면 NOT NULL 복원이 실패하므로,
+    원본을 data로 되돌린 뒤에 실행해야 합니다.
+    """
+    op.alter_column('picture', 'data',
+               existing_type=sa.LargeBinary().with_variant(mysql.LONGBLOB(), 'mysql'),
+               nullable=False)
+    op.drop_index(op.f('ix_picture_content_hash'), table_name='picture')
+    op.drop_column('picture', 'content_hash')
@@ -0,0 +1,28 @@
+"""add schedule_archive status index
+
+Revision ID: 6d2f8a41c9e3
+Revises: 9b7e2c4f1a05
+Create Date: 2026-10-19 23:12:40.318205
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6d2f8a41c9e3'
+down_revision: Union[str, Sequence[str], None] = '9b7e2c4f1a05'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_schedule_archive_club_id_status_start_date', 'schedule_archive', ['club_id', 'status', 'start_date'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_schedule_archive_club_id_status_start_date', table_name='schedule_archive')
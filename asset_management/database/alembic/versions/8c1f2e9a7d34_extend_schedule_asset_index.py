@@ -0,0 +1,31 @@
+"""extend schedule asset index for overlap checks
+
+Revision ID: 8c1f2e9a7d34
+Revises: 476203001c3a
+Create Date: 2026-10-19 11:02:17.904512
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c1f2e9a7d34'
+down_revision: Union[str, Sequence[str], None] = '476203001c3a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 새 인덱스를 먼저 만들어야 MySQL에서 asset_id FK가 기존 인덱스에 묶여 drop이 막히지 않는다.
+    op.create_index('ix_schedule_asset_id_status_start_date', 'schedule', ['asset_id', 'status', 'start_date', 'end_date'], unique=False)
+    op.drop_index('ix_schedule_asset_id_status', table_name='schedule')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('ix_schedule_asset_id_status', 'schedule', ['asset_id', 'status'], unique=False)
+    op.drop_index('ix_schedule_asset_id_status_start_date', table_name='schedule')
@@ -0,0 +1,30 @@
+"""add user_clublist club permission index
+
+Revision ID: 9b7e2c4f1a05
+Revises: a8d5e0c3f624
+Create Date: 2026-10-19 21:03:27.614058
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from asset_management.database.migration_helpers import drop_indexes_keeping_fk_indexes
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b7e2c4f1a05'
+down_revision: Union[str, Sequence[str], None] = 'a8d5e0c3f624'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_user_clublist_club_id_permission', 'user_clublist', ['club_id', 'permission'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    drop_indexes_keeping_fk_indexes('user_clublist', ['ix_user_clublist_club_id_permission'])
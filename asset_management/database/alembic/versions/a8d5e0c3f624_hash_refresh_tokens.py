@@ -0,0 +1,74 @@
+"""hash refresh tokens
+
+Revision ID: a8d5e0c3f624
+Revises: f4c2a9b7d813
+Create Date: 2026-10-19 19:48:03.902771
+
+"""
+import hashlib
+from datetime import datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from asset_management.database.migration_helpers import drop_indexes_keeping_fk_indexes
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8d5e0c3f624'
+down_revision: Union[str, Sequence[str], None] = 'f4c2a9b7d813'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    refresh_tokens = sa.table(
+        'refresh_tokens',
+        sa.column('id', sa.Integer),
+        sa.column('token', sa.String),
+        sa.column('token_hash', sa.String),
+        sa.column('expires_at', sa.DateTime),
+    )
+    op.add_column('refresh_tokens', sa.Column('token_hash', sa.String(length=64), nullable=True))
+
+    # 만료되었거나 token이 비어 있는(쓸 수 없는) 행은 지우고, 남은 토큰은 원문의 SHA-256으로 바꾼다
+    bind = op.get_bind()
+    bind.execute(
+        sa.delete(refresh_tokens).where(
+            sa.or_(refresh_tokens.c.expires_at <= datetime.now(), refresh_tokens.c.token.is_(None))
+        )
+    )
+    rows = bind.execute(
+        sa.select(refresh_tokens.c.id, refresh_tokens.c.token).where(refresh_tokens.c.token.is_not(None))
+    ).all()
+    for token_id, token in rows:
+        bind.execute(
+            sa.update(refresh_tokens)
+            .where(refresh_tokens.c.id == token_id)
+            .values(token_hash=hashlib.sha256(token.encode('utf-8')).hexdigest())
+        )
+
+    op.drop_index(op.f('ix_refresh_tokens_token'), table_name='refresh_tokens')
+    op.drop_column('refresh_tokens', 'token')
+    op.alter_column('refresh_tokens', 'token_hash',
+               existing_type=sa.String(length=64),
+               nullable=False)
+    op.create_index(op.f('ix_refresh_tokens_token_hash'), 'refresh_tokens', ['token_hash'], unique=True)
+    op.create_index(op.f('ix_refresh_tokens_expires_at'), 'refresh_tokens', ['expires_at'], unique=False)
+    op.create_index('ix_refresh_tokens_user_id_expires_at', 'refresh_tokens', ['user_id', 'expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # 해시에서 원문을 되돌릴 수 없으므로 저장된 토큰을 모두 지운다 (모든 사용자가 다시 로그인해야 함)
+    op.execute('DELETE FROM refresh_tokens')
+    drop_indexes_keeping_fk_indexes('refresh_tokens', [
+        'ix_refresh_tokens_user_id_expires_at',
+        op.f('ix_refresh_tokens_expires_at'),
+        op.f('ix_refresh_tokens_token_hash'),
+    ])
+    op.drop_column('refresh_tokens', 'token_hash')
+    op.add_column('refresh_tokens', sa.Column('token', sa.String(length=255), nullable=True))
+    op.create_index(op.f('ix_refresh_tokens_token'), 'refresh_tokens', ['token'], unique=True)
@@ -0,0 +1,33 @@
+"""add schedule updated_at
+
+Revision ID: b5d03a6e21f9
+Revises: 8c1f2e9a7d34
+Create Date: 2026-10-19 13:26:51.447120
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from asset_management.database.migration_helpers import drop_indexes_keeping_fk_indexes
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5d03a6e21f9'
+down_revision: Union[str, Sequence[str], None] = '8c1f2e9a7d34'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('schedule', sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False))
+    op.create_index('ix_schedule_club_id_updated_at', 'schedule', ['club_id', 'updated_at'], unique=False)
+    op.create_index('ix_schedule_user_id_updated_at', 'schedule', ['user_id', 'updated_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    drop_indexes_keeping_fk_indexes('schedule', ['ix_schedule_user_id_updated_at', 'ix_schedule_club_id_updated_at'])
+    op.drop_column('schedule', 'updated_at')
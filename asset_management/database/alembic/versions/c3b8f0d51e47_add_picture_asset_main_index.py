@@ -0,0 +1,30 @@
+"""add picture asset main index
+
+Revision ID: c3b8f0d51e47
+Revises: 5a9c3e7f1b28
+Create Date: 2026-10-19 17:21:44.630115
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from asset_management.database.migration_helpers import drop_indexes_keeping_fk_indexes
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3b8f0d51e47'
+down_revision: Union[str, Sequence[str], None] = '5a9c3e7f1b28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_picture_asset_id_is_main', 'picture', ['asset_id', 'is_main'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    drop_indexes_keeping_fk_indexes('picture', ['ix_picture_asset_id_is_main'])
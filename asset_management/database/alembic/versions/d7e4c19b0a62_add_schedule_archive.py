@@ -0,0 +1,62 @@
+"""add schedule archive
+
+Revision ID: d7e4c19b0a62
+Revises: b5d03a6e21f9
+Create Date: 2026-10-19 14:48:09.213775
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7e4c19b0a62'
+down_revision: Union[str, Sequence[str], None] = 'b5d03a6e21f9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('schedule_archive',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('start_date', sa.DateTime(), nullable=False),
+    sa.Column('end_date', sa.DateTime(), nullable=False),
+    sa.Column('asset_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.String(length=36), nullable=False),
+    sa.Column('club_id', sa.Integer(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.Column('archived_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_schedule_archive_club_id_start_date', 'schedule_archive', ['club_id', 'start_date'], unique=False)
+    op.create_index('ix_schedule_archive_club_id_user_id_start_date', 'schedule_archive', ['club_id', 'user_id', 'start_date'], unique=False)
+    op.create_index('ix_schedule_archive_asset_id_start_date', 'schedule_archive', ['asset_id', 'start_date'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # 보관된 이력을 되돌린다 (물품/사용자/동아리가 이미 삭제된 행은 FK 때문에 옮길 수 없어 버린다)
+    columns = ['id', 'start_date', 'end_date', 'asset_id', 'user_id', 'club_id', 'status', 'updated_at']
+    schedule = sa.table('schedule', *[sa.column(c) for c in columns])
+    archive = sa.table('schedule_archive', *[sa.column(c) for c in columns])
+    assets = sa.table('assets', sa.column('id'))
+    user = sa.table('user', sa.column('id'))
+    club = sa.table('club', sa.column('id'))
+    op.execute(
+        schedule.insert().from_select(
+            columns,
+            sa.select(*[archive.c[c] for c in columns]).where(
+                archive.c.asset_id.in_(sa.select(assets.c.id)),
+                archive.c.user_id.in_(sa.select(user.c.id)),
+                archive.c.club_id.in_(sa.select(club.c.id)),
+            ),
+        )
+    )
+    op.drop_index('ix_schedule_archive_asset_id_start_date', table_name='schedule_archive')
+    op.drop_index('ix_schedule_archive_club_id_user_id_start_date', table_name='schedule_archive')
+    op.drop_index('ix_schedule_archive_club_id_start_date', table_name='schedule_archive')
+    op.drop_table('schedule_archive')
@@ -0,0 +1,28 @@
+"""add user membership version
+
+Revision ID: e1a6d4c27f90
+Revises: c3b8f0d51e47
+Create Date: 2026-10-19 18:05:12.337120
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1a6d4c27f90'
+down_revision: Union[str, Sequence[str], None] = 'c3b8f0d51e47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('user', sa.Column('membership_version', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('user', 'membership_version')
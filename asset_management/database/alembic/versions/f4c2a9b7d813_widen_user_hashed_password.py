@@ -0,0 +1,36 @@
+"""widen user hashed_password
+
+Revision ID: f4c2a9b7d813
+Revises: e1a6d4c27f90
+Create Date: 2026-10-19 19:12:40.518203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4c2a9b7d813'
+down_revision: Union[str, Sequence[str], None] = 'e1a6d4c27f90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # scrypt$n$r$p$salt$hash 형식은 SHA-256 hex(64자)보다 김
+    op.alter_column('user', 'hashed_password',
+               existing_type=sa.String(length=64),
+               type_=sa.String(length=255),
+               existing_nullable=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # scrypt 해시가 저장된 행이 있으면 실패하므로, 먼저 해당 사용자의 비밀번호를 초기화해야 함
+    op.alter_column('user', 'hashed_password',
+               existing_type=sa.String(length=255),
+               type_=sa.String(length=64),
+               existing_nullable=True)
@@ -0,0 +1,27 @@
+from alembic import op
+import sqlalchemy as sa
+
+
+def drop_indexes_keeping_fk_indexes(table_name: str, index_names: list[str]) -> None:
+    """alembic 마이그레이션에서 복합 인덱스를 지웁니다. MySQL에서는 FK 인덱스를 먼저 되살립니다.
+
+    MySQL(InnoDB)은 FK 컬럼에 인덱스가 없으면 FK를 만들 때 컬럼 이름으로 인덱스를 자동으로 만들고,
+    나중에 그 컬럼으로 시작하는 인덱스가 생기면 자동 인덱스를 조용히 지웁니다.
+    그래서 복합 인덱스가 FK를 받치는 유일한 인덱스가 되면 DROP INDEX가 거부되므로 (1553),
+    지운 뒤 남는 인덱스로 받칠 수 없는 FK 컬럼마다 MySQL이 만들었을 이름 그대로 인덱스를 되살립니다.
+    """
+    bind = op.get_bind()
+    if bind.dialect.name == 'mysql':
+        inspector = sa.inspect(bind)
+        remaining = inspector.get_pk_constraint(table_name)['constrained_columns'][:1] + [
+            index['column_names'][0]
+            for index in inspector.get_indexes(table_name)
+            if index['name'] not in index_names
+        ]
+        for foreign_key in inspector.get_foreign_keys(table_name):
+            column = foreign_key['constrained_columns'][0]
+            if column not in remaining:
+                op.create_index(column, table_name, [column], unique=False)
+                remaining.append(column)
+    for name in index_names:
+        op.drop_index(name, table_name=table_name)
@@ -12,9 +12,20 @@ from asset_management.app.schedule.router import router as schedule_router
 from asset_management.app.rental.router import router as rental_router
 from asset_management.app.statistics.router import router as statistics_router
 from asset_management.app.picture.router import router as pictuer_router
+from asset_management.app.auth.rate_limit import RATE_LIMIT_BACKEND, RateLimitMiddleware, default_rules
+from asset_management.app.auth.settings import AUTH_SETTINGS
 
 app = FastAPI(title="Asset Management API")
 
+# 로그인/가입 rate limit (DB 세션을 잡기 전에 거부). CORS가 429 응답에도 헤더를 붙이도록 CORS보다 먼저 등록
+if AUTH_SETTINGS.RATE_LIMIT_ENABLED:
+    app.add_middleware(
+        RateLimitMiddleware,
+        rules=default_rules(),
+        backend=RATE_LIMIT_BACKEND,
+        trust_forwarded=AUTH_SETTINGS.RATE_LIMIT_TRUST_FORWARDED,
+    )
+
 # CORS 설정
 app.add_middleware(
     CORSMiddleware,
@@ -0,0 +1,61 @@
+"""비밀번호 해시 벤치마크
+
+로그인 한 번에 드는 비밀번호 검증(PasswordHasher.verify)을 동시 요청 수별로 돌려
+초당 로그인 처리량과 코어당 처리량을 측정합니다. 이전 SHA-256 검증과도 비교합니다.
+
+    python -m benchmarks.password_hashing
+    python -m benchmarks.password_hashing --n 32768 --workers 8 --concurrency 1 4 16 64
+
+요청 스레드(FastAPI 스레드풀) 수가 workers보다 많아도 KDF 동시 실행 수는 workers로 묶이므로,
+workers를 코어 수 이상으로 늘려도 처리량은 늘지 않고 메모리만 늘어납니다.
+"""
+import argparse
+import hashlib
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from asset_management.app.auth.passwords import PasswordHasher
+
+PASSWORD = "correct horse battery staple"
+
+
+def throughput(hasher: PasswordHasher, hashed: str, concurrency: int, logins: int) -> float:
+    """초당 검증 수"""
+    with ThreadPoolExecutor(max_workers=concurrency) as requests:
+        started = time.perf_counter()
+        results = list(requests.map(lambda _: hasher.verify(PASSWORD, hashed), range(logins)))
+        elapsed = time.perf_counter() - started
+    assert all(results)
+    return logins / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--n", type=int, default=2 ** 14)
+    parser.add_argument("--r", type=int, default=8)
+    parser.add_argument("--p", type=int, default=1)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16, 64])
+    parser.add_argument("--logins", type=int, default=200)
+    args = parser.parse_args()
+
+    cores = os.cpu_count() or 1
+    hasher = PasswordHasher(args.n, args.r, args.p, args.workers)
+    scrypt_hash = hasher.hash(PASSWORD)
+    legacy_hash = hashlib.sha256(PASSWORD.encode("utf-8")).hexdigest()
+
+    started = time.perf_counter()
+    hasher.verify(PASSWORD, scrypt_hash)
+    print(f"scrypt n={args.n} r={args.r} p={args.p}: {(time.perf_counter() - started) * 1000:.1f} ms/verify, "
+          f"~{128 * args.n * args.r / 1024 / 1024:.0f} MiB/verify, workers={args.workers}, cores={cores}")
+
+    print(f"\n{'hash':<8}{'concurrency':>12}{'logins/s':>12}{'per core':>12}")
+    for label, hashed in (("sha256", legacy_hash), ("scrypt", scrypt_hash)):
+        for concurrency in args.concurrency:
+            rate = throughput(hasher, hashed, concurrency, args.logins if label == "scrypt" else args.logins * 100)
+            print(f"{label:<8}{concurrency:>12}{rate:>12.1f}{rate / min(cores, args.workers, concurrency):>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+"""schedule / schedule_archive 복합 인덱스 벤치마크
+
+시드된 이력(기본 100만 행, 오래된 반납/취소 이력은 schedule_archive에)에 대해 ScheduleRepository /
+AssetRepository / StatisticsService 가 실제로 보내는 쿼리의 실행 계획과 응답 시간을 인덱스 적용 전/후로
+비교합니다. 이력 목록/커서/통계/내보내기는 ScheduleRepository._history 의 UNION ALL 그대로 측정합니다.
+
+    python -m benchmarks.schedule_indexes sqlite+pysqlite:////tmp/bench.db
+    python -m benchmarks.schedule_indexes mysql+pymysql://root:pw@127.0.0.1:3306/bench --rows 1000000
+
+MySQL(InnoDB)에서는 FK 컬럼에 인덱스가 있어야 하므로, "적용 전" 측정 동안에는 FK 컬럼별 단일
+인덱스를 대신 두고 (MySQL이 FK에 자동으로 만드는 것과 같음) 복합 인덱스를 만든 뒤 지웁니다.
+
+주의: 대상 DB의 테이블을 drop 후 다시 만듭니다. 운영 DB에 절대 사용하지 마세요.
+"""
+import argparse
+import random
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import Index, create_engine, func, insert, select, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from asset_management.database import import_models
+from asset_management.database.common import Base
+
+import_models()
+import asset_management.app.auth.models  # noqa: E402,F401
+import asset_management.app.statistics.models  # noqa: E402,F401
+from asset_management.app.assets.models import Asset  # noqa: E402
+from asset_management.app.club.models import Club  # noqa: E402
+from asset_management.app.schedule.models import Schedule, ScheduleArchive, Status  # noqa: E402
+from asset_management.app.schedule.repositories import ScheduleRepository  # noqa: E402
+from asset_management.app.schedule.utils import ACTIVE_STATUSES  # noqa: E402
+from asset_management.app.user.models import User  # noqa: E402
+
+CLUBS = 50
+USERS = 5_000
+ASSETS = 2_000
+BATCH = 20_000
+REPEAT = 5
+# 이 시각 이전에 끝난 반납/취소 이력은 보관 테이블로 (archive_schedules 배치를 돌린 상태)
+ARCHIVED_BEFORE = datetime(2024, 1, 1)
+CLOSED_STATUSES = (Status.RETURNED.value, Status.CANCELLED.value)
+
+
+def seed(engine: Engine, rows: int) -> tuple[int, str, int]:
+    rng = random.Random(42)
+    user_ids = [str(uuid.UUID(int=rng.getrandbits(128))) for _ in range(USERS)]
+    statuses = [s.value for s in Status]
+    # 대부분 반납/취소된 이력, 소수만 진행 중
+    weights = [2, 2, 3, 80, 13]
+    base = datetime(2020, 1, 1)
+
+    with engine.begin() as conn:
+        conn.execute(insert(Club), [{"id": i + 1, "name": f"club{i}", "club_code": f"C{i:05d}"} for i in range(CLUBS)])
+        conn.execute(insert(User), [{"id": uid, "name": f"user{i}", "is_admin": False} for i, uid in enumerate(user_ids)])
+        conn.execute(
+            insert(Asset),
+            [
+                {"id": i + 1, "name": f"asset{i}", "club_id": i % CLUBS + 1, "total_quantity": 3,
+                 "available_quantity": 3, "created_at": base}
+                for i in range(ASSETS)
+            ],
+        )
+        for offset in range(0, rows, BATCH):
+            live, archived = [], []
+            for i in range(min(BATCH, rows - offset)):
+                asset_id = rng.randrange(ASSETS) + 1
+                start = base + timedelta(minutes=rng.randrange(60 * 24 * 365 * 6))
+                end = start + timedelta(hours=rng.randrange(1, 24 * 14))
+                row = {
+                    "id": offset + i + 1,
+                    "start_date": start,
+                    "end_date": end,
+                    "asset_id": asset_id,
+                    "user_id": user_ids[rng.randrange(USERS)],
+                    "club_id": (asset_id - 1) % CLUBS + 1,
+                    "status": rng.choices(statuses, weights)[0],
+                    "updated_at": end,
+                }
+                if row["status"] in CLOSED_STATUSES and end < ARCHIVED_BEFORE:
+                    archived.append({**row, "archived_at": ARCHIVED_BEFORE})
+                else:
+                    live.append(row)
+            if live:
+                conn.execute(insert(Schedule), live)
+            if archived:
+                conn.execute(insert(ScheduleArchive), archived)
+    return 1, user_ids[0], 1
+
+
+def hot_queries(club_id: int, user_id: str, asset_id: int) -> dict:
+    # 쿼리 모양만 ScheduleRepository에서 가져오고 실행은 하지 않음
+    repository = ScheduleRepository(Session())
+
+    def first_page(**filters):
+        # get_schedules_after: 각 테이블에서 size + 1개씩 읽어 합친 뒤 다시 정렬
+        history = repository._history(limit=11, **filters)
+        return select(history).order_by(history.c.start_date, history.c.id).limit(11)
+
+    def total(**filters):
+        # get_schedules / with_total 의 COUNT
+        return select(func.count()).select_from(repository._history(**filters))
+
+    statistics = repository._history(asset_id=asset_id)
+    export = repository._history(club_id=club_id, user_id=user_id)
+    return {
+        # 관리자 이력 목록
+        "club history": first_page(club_id=club_id),
+        # 일반 사용자는 user_id가 항상 강제됨
+        "user history": first_page(club_id=club_id, user_id=user_id),
+        "status filter": first_page(club_id=club_id, status=Status.RETURNED.value),
+        "date range": first_page(
+            club_id=club_id, start_date=datetime(2023, 3, 1), end_date=datetime(2023, 3, 8)
+        ),
+        "club total": total(club_id=club_id),
+        # StatisticsService.update_statistics_for_asset → get_schedules(page=1, size=100, asset_id=...)
+        "statistics": select(statistics).order_by(statistics.c.start_date, statistics.c.id).limit(100),
+        # ScheduleRepository.iter_history_rows (CSV 내보내기)
+        "export": select(export, Asset.name.label("asset_name"), User.name.label("user_name"))
+        .outerjoin(Asset, Asset.id == export.c.asset_id)
+        .outerjoin(User, User.id == export.c.user_id)
+        .order_by(export.c.start_date, export.c.id),
+        # AssetRepository.get_asset_status
+        "asset status": select(Schedule.id)
+        .where(Schedule.asset_id == asset_id, Schedule.status == Status.IN_USE.value)
+        .limit(1),
+        # ScheduleRepository.get_overlapping_intervals (예약 충돌 검사)
+        "asset overlap": select(Schedule.start_date, Schedule.end_date).where(
+            Schedule.asset_id == asset_id,
+            Schedule.status.in_(ACTIVE_STATUSES),
+            Schedule.start_date < datetime(2024, 3, 8),
+            Schedule.end_date > datetime(2024, 3, 1),
+        ),
+    }
+
+
+def explain(engine: Engine, stmt) -> list[str]:
+    sql = str(stmt.compile(engine, compile_kwargs={"literal_binds": True}))
+    prefix = "EXPLAIN QUERY PLAN " if engine.dialect.name == "sqlite" else "EXPLAIN "
+    with engine.connect() as conn:
+        return [" | ".join(str(v) for v in row) for row in conn.execute(text(prefix + sql))]
+
+
+def timed(engine: Engine, stmt) -> float:
+    with engine.connect() as conn:
+        conn.execute(stmt).all()  # warm-up
+        started = time.perf_counter()
+        for _ in range(REPEAT):
+            conn.execute(stmt).all()
+        return (time.perf_counter() - started) / REPEAT * 1000
+
+
+def report(engine: Engine, label: str, queries: dict) -> dict[str, float]:
+    print(f"\n===== {label} =====")
+    timings = {}
+    for name, stmt in queries.items():
+        timings[name] = timed(engine, stmt)
+        print(f"\n-- {name}: {timings[name]:.2f} ms")
+        for line in explain(engine, stmt):
+            print(f"   {line}")
+    return timings
+
+
+def fk_only_indexes(engine: Engine) -> list[Index]:
+    """MySQL에서 복합 인덱스 대신 FK를 받칠 단일 컬럼 인덱스. 다른 DB는 FK 인덱스가 필요 없음."""
+    if engine.dialect.name != "mysql":
+        return []
+    table = Schedule.__table__
+    indexes = [
+        Index(f"ix_bench_schedule_{column.name}", column)
+        for column in sorted({fk.parent for fk in table.foreign_keys}, key=lambda column: column.name)
+    ]
+    # Index(column)는 테이블에 자동으로 붙으므로 create_all이 만들지 않도록 떼어 둠
+    for index in indexes:
+        table.indexes.discard(index)
+    return indexes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("url", help="scratch database URL (tables are dropped!)")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    engine = create_engine(args.url, future=True)
+    indexes = [*Schedule.__table__.indexes, *ScheduleArchive.__table__.indexes]
+    fk_indexes = fk_only_indexes(engine)
+
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    # 복합 인덱스가 FK를 받치고 있으면 MySQL은 DROP INDEX를 거부함 (1553) → FK용 단일 인덱스를 먼저 만듦
+    for index in fk_indexes:
+        index.create(engine)
+    for index in indexes:
+        index.drop(engine)
+
+    started = time.perf_counter()
+    queries = hot_queries(*seed(engine, args.rows))
+    with engine.connect() as conn:
+        archived = conn.scalar(select(func.count()).select_from(ScheduleArchive))
+    print(f"seeded {args.rows:,} schedules ({archived:,} archived) in {time.perf_counter() - started:.1f}s")
+
+    before = report(engine, "before (PK / FK only)", queries)
+
+    started = time.perf_counter()
+    for index in indexes:
+        index.create(engine)
+    for index in fk_indexes:
+        index.drop(engine)
+    if engine.dialect.name == "sqlite":
+        with engine.begin() as conn:
+            conn.execute(text("ANALYZE"))
+    elif engine.dialect.name == "mysql":
+        with engine.begin() as conn:
+            conn.execute(text("ANALYZE TABLE schedule, schedule_archive"))
+    print(f"\ncreated {len(indexes)} indexes in {time.perf_counter() - started:.1f}s")
+
+    after = report(engine, "after (composite indexes)", queries)
+
+    print("\n===== summary (ms) =====")
+    print(f"{'query':<16}{'before':>12}{'after':>12}{'speedup':>10}")
+    for name in queries:
+        print(f"{name:<16}{before[name]:>12.2f}{after[name]:>12.2f}{before[name] / max(after[name], 1e-6):>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,11 @@ from asset_management.database import import_models
 from asset_management.database.common import Base
 from asset_management.main import app
 from asset_management.database.session import get_session
+from asset_management.app.assets.cache import AVAILABILITY_CACHE
+from asset_management.app.auth.cache import PRINCIPAL_CACHE
+from asset_management.app.auth.rate_limit import RATE_LIMIT_BACKEND
+from asset_management.app.picture.cache import PICTURE_CACHE
+from asset_management.app.picture.storage import LocalBlobStore, get_blob_store
 
 import_models()
 
@@ -44,7 +49,13 @@ def test_db():
 
 
 @pytest.fixture(scope="function")
-def client(test_db):
+def blob_store(tmp_path):
+    """테스트마다 임시 디렉터리를 쓰는 사진 저장소"""
+    return LocalBlobStore(tmp_path / "blobs")
+
+
+@pytest.fixture(scope="function")
+def client(test_db, blob_store):
     """Create a test client with database override"""
     TestingSessionLocal = sessionmaker(
         bind=test_db, autocommit=False, autoflush=False, future=True
@@ -58,6 +69,12 @@ def client(test_db):
             db.close()
     
     app.dependency_overrides[get_session] = override_get_session
+    app.dependency_overrides[get_blob_store] = lambda: blob_store
+    # 테스트마다 DB가 새로 만들어지므로 프로세스 내 캐시도 비운다
+    AVAILABILITY_CACHE.clear()
+    PICTURE_CACHE.clear()
+    PRINCIPAL_CACHE.clear()
+    RATE_LIMIT_BACKEND.clear()
     
     with TestClient(app) as test_client:
         yield test_client
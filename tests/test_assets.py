@@ -1,5 +1,6 @@
 # tests/test_assets.py
 import pytest
+from datetime import datetime, timedelta
 from fastapi.testclient import TestClient
 
 
@@ -181,3 +182,56 @@ def test_admin_delete_asset(
     assert res.status_code == 200, res.text
     items = res.json()
     assert all(i.get("id") != asset_id for i in items)
+
+
+def test_asset_availability_timeline(
+    client: TestClient,
+    admin_headers: dict,
+    signed_up_admin: dict,
+    created_asset: dict,
+):
+    """예약 구간마다 남은 수량이 타임라인으로 계산되고, 동아리 전체 조회 캐시는 스케줄 변경 시 갱신"""
+    club_id = signed_up_admin["club_id"]
+    asset_id = created_asset["id"]
+    base = (datetime.now() + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+    params = {"from": base.isoformat(), "to": (base + timedelta(days=1)).isoformat()}
+
+    res = client.get(f"/api/assets/club/{club_id}/availability", params=params)
+    assert res.status_code == 200, res.text
+    [asset] = res.json()["assets"]
+    assert [s["available_quantity"] for s in asset["slots"]] == [3]
+
+    for start_h, end_h in [(2, 6), (4, 8)]:
+        res = client.post(
+            f"/api/schedules/{club_id}",
+            json={
+                "start_date": (base + timedelta(hours=start_h)).isoformat(),
+                "end_date": (base + timedelta(hours=end_h)).isoformat(),
+                "asset_id": asset_id,
+                "user_id": signed_up_admin["id"],
+                "status": "approved",
+            },
+            headers=admin_headers,
+        )
+        assert res.status_code == 201, res.text
+
+    res = client.get(f"/api/assets/{asset_id}/availability", params=params)
+    assert res.status_code == 200, res.text
+    slots = res.json()["slots"]
+    assert [s["available_quantity"] for s in slots] == [3, 2, 1, 2, 3]
+    assert slots[2]["start"] == (base + timedelta(hours=4)).isoformat()
+    assert slots[2]["end"] == (base + timedelta(hours=6)).isoformat()
+
+    res = client.get(f"/api/assets/club/{club_id}/availability", params=params)
+    assert res.status_code == 200, res.text
+    [asset] = res.json()["assets"]
+    assert asset["slots"] == slots
+
+
+def test_asset_availability_invalid_period(client: TestClient, created_asset: dict):
+    now = datetime.now()
+    res = client.get(
+        f"/api/assets/{created_asset['id']}/availability",
+        params={"from": now.isoformat(), "to": (now - timedelta(hours=1)).isoformat()},
+    )
+    assert res.status_code == 400, res.text
@@ -181,3 +181,300 @@ def test_google_login_denied_for_admin(client: TestClient, monkeypatch):
   _mock_google_token(monkeypatch, admin_payload["email"], name="Admin")
   response = client.post("/api/auth/google", json={"id_token": "fake"})
   assert response.status_code == 403
+
+def test_current_user_is_cached_until_membership_changes(client: TestClient, user_data, auth_token, test_db, db_session):
+  """두 번째 요청부터는 사용자 조회 없이 캐시를 쓰고, 동아리 권한이 바뀌면 캐시가 비워짐"""
+  from sqlalchemy import event
+  from asset_management.app.auth.cache import PRINCIPAL_CACHE
+  from asset_management.app.club.models import Club
+  from asset_management.app.user.models import UserClublist
+
+  headers = {"Authorization": f"Bearer {auth_token['access_token']}"}
+  assert client.get("/api/clubs/me", headers=headers).status_code == 200
+  assert PRINCIPAL_CACHE.get(user_data["id"]).memberships == {}
+
+  statements = []
+  def _record(conn, cursor, statement, *args):
+    statements.append(statement)
+  event.listen(test_db, "before_cursor_execute", _record)
+  try:
+    assert client.get("/api/clubs/me", headers=headers).status_code == 200
+  finally:
+    event.remove(test_db, "before_cursor_execute", _record)
+  assert not any('FROM "user"' in s or "FROM user " in s for s in statements)
+
+  with db_session() as session:
+    club = Club(name="cacheclub", club_code="CACHE1")
+    session.add(club)
+    session.flush()
+    session.add(UserClublist(user_id=user_data["id"], club_id=club.id, permission=0))
+    session.commit()
+    club_id = club.id
+
+  assert PRINCIPAL_CACHE.get(user_data["id"]) is None
+  res = client.get("/api/clubs/me", headers=headers)
+  assert [c["id"] for c in res.json()] == [club_id]
+  assert PRINCIPAL_CACHE.get(user_data["id"]).memberships == {club_id: 0}
+
+def test_access_token_carries_membership_claims(client: TestClient, user_data, auth_token, db_session):
+  """access token에 권한 claim이 들어가고, 권한이 바뀌면 같은 토큰이라도 DB 값으로 다시 확인함"""
+  from asset_management.app.club.models import Club
+  from asset_management.app.user.models import UserClublist
+
+  claims = jwt.decode(auth_token["access_token"], AUTH_SETTINGS.ACCESS_TOKEN_SECRET)
+  assert claims["adm"] == 0
+  assert claims["clb"] == {}
+  assert claims["mv"] == 0
+
+  with db_session() as session:
+    club = Club(name="claimclub", club_code="CLAIM1")
+    session.add(club)
+    session.flush()
+    session.add(UserClublist(user_id=user_data["id"], club_id=club.id, permission=1))
+    session.commit()
+    club_id = club.id
+    assert session.get(User, user_data["id"]).membership_version == 1
+
+  # 토큰의 clb는 비어 있지만 membership_version이 올라갔으므로 관리자 권한이 반영됨
+  headers = {"Authorization": f"Bearer {auth_token['access_token']}"}
+  res = client.get(f"/api/club-members/?club_id={club_id}", headers=headers)
+  assert res.status_code == 200
+  assert res.json()["total"] == 1
+
+  tokens = client.get(
+    "/api/auth/refresh", headers={"Authorization": f"Bearer {auth_token['refresh_token']}"}
+  ).json()
+  claims = jwt.decode(tokens["access_token"], AUTH_SETTINGS.ACCESS_TOKEN_SECRET)
+  assert claims["clb"] == {str(club_id): 1}
+  assert claims["mv"] == 1
+
+def test_membership_change_from_another_worker_applies_immediately(client: TestClient, user_data, db_session):
+  """다른 워커가 권한을 바꿔도(이 프로세스의 훅/캐시를 거치지 않음) 이전 토큰의 claim을 믿지 않음"""
+  from sqlalchemy import delete, update
+  from asset_management.app.club.models import Club
+  from asset_management.app.user.models import UserClublist
+
+  with db_session() as session:
+    club = Club(name="workerclub", club_code="WORKR1")
+    session.add(club)
+    session.flush()
+    session.add(UserClublist(user_id=user_data["id"], club_id=club.id, permission=1))
+    session.commit()
+    club_id = club.id
+
+  tokens = client.post(
+    "/api/auth/login", json={"email": user_data["email"], "password": user_data["password"]}
+  ).json()["tokens"]
+  headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+  assert client.get(f"/api/club-members/?club_id={club_id}", headers=headers).status_code == 200
+
+  # 다른 프로세스에서 실행된 것처럼 ORM 이벤트 없이 SQL로 관리자 권한을 회수
+  with db_session() as session:
+    session.execute(delete(UserClublist).where(UserClublist.user_id == user_data["id"]))
+    session.execute(
+      update(User).where(User.id == user_data["id"]).values(membership_version=User.membership_version + 1)
+    )
+    session.commit()
+
+  assert client.get(f"/api/club-members/?club_id={club_id}", headers=headers).status_code == 403
+
+def test_login_rehashes_legacy_password(client: TestClient, user_data, db_session):
+  """이전 SHA-256 해시로도 로그인되고, 로그인 성공 시 scrypt로 다시 해시됨"""
+  import hashlib
+  from asset_management.app.auth.passwords import PASSWORD_HASHER
+
+  with db_session() as session:
+    user = session.get(User, user_data["id"])
+    user.hashed_password = hashlib.sha256(user_data["password"].encode("utf-8")).hexdigest()
+    session.commit()
+
+  wrong = client.post("/api/auth/login", json={"email": user_data["email"], "password": "wrongpassword"})
+  assert wrong.status_code == 401
+
+  response = client.post(
+    "/api/auth/login",
+    json={"email": user_data["email"], "password": user_data["password"]})
+  assert response.status_code == 200
+
+  with db_session() as session:
+    hashed = session.get(User, user_data["id"]).hashed_password
+  assert hashed.startswith("scrypt$")
+  assert PASSWORD_HASHER.verify(user_data["password"], hashed)
+  assert not PASSWORD_HASHER.needs_rehash(hashed)
+
+def test_refresh_tokens_are_hashed_capped_and_purged(client: TestClient, user_data, auth_token, db_session, monkeypatch):
+  """refresh token은 해시로만 저장되고, 사용자당 개수가 제한되며, 만료된 토큰은 purge로 지워짐"""
+  import hashlib
+  from asset_management.app.auth.models import RefreshToken
+  from asset_management.app.auth.purge_tokens import purge_expired_refresh_tokens
+  from asset_management.app.auth.settings import AUTH_SETTINGS as APP_AUTH_SETTINGS
+
+  with db_session() as session:
+    stored = session.query(RefreshToken.token_hash).scalar()
+  assert stored == hashlib.sha256(auth_token["refresh_token"].encode("utf-8")).hexdigest()
+
+  monkeypatch.setattr(APP_AUTH_SETTINGS, "REFRESH_TOKENS_PER_USER", 2)
+  logins = [
+    client.post("/api/auth/login", json={"email": user_data["email"], "password": user_data["password"]}).json()["tokens"]
+    for _ in range(3)
+  ]
+  with db_session() as session:
+    assert session.query(RefreshToken).count() == 2
+
+  # 가장 먼저 발급된 토큰은 밀려나 더 이상 쓸 수 없음
+  evicted = client.get("/api/auth/refresh", headers={"Authorization": f"Bearer {auth_token['refresh_token']}"})
+  assert evicted.status_code == 401
+  assert client.get(
+    "/api/auth/refresh", headers={"Authorization": f"Bearer {logins[-1]['refresh_token']}"}
+  ).status_code == 200
+
+  with db_session() as session:
+    for token in session.query(RefreshToken):
+      token.expires_at = datetime.now() - timedelta(minutes=1)
+    session.add(RefreshToken(token_hash="0" * 64, user_id=user_data["id"], expires_at=datetime.now() + timedelta(days=1)))
+    session.commit()
+
+    assert purge_expired_refresh_tokens(session, batch_size=1) == 2
+    assert [t.token_hash for t in session.query(RefreshToken)] == ["0" * 64]
+
+def test_google_id_token_verified_locally(client: TestClient, monkeypatch):
+  """Google ID token을 캐시된 JWKS로 로컬 검증하고, 모르는 kid가 오면 키를 다시 받음"""
+  import time
+  from authlib.jose import JsonWebKey
+  from asset_management.app.auth.google import GoogleKeyCache, StaticKeySource, get_google_keys
+  from asset_management.app.auth.settings import AUTH_SETTINGS as APP_AUTH_SETTINGS
+  from asset_management.main import app
+
+  monkeypatch.setattr(APP_AUTH_SETTINGS, "GOOGLE_CLIENT_ID", "client-123")
+  old_key = JsonWebKey.generate_key("RSA", 2048, is_private=True, options={"kid": "old"})
+  new_key = JsonWebKey.generate_key("RSA", 2048, is_private=True, options={"kid": "new"})
+  source = StaticKeySource({"keys": [old_key.as_dict(is_private=False)]})
+  fetches = []
+  fetch = source.fetch
+  source.fetch = lambda: fetches.append(1) or fetch()
+  keys = GoogleKeyCache(source, min_refresh_seconds=0)
+  app.dependency_overrides[get_google_keys] = lambda: keys
+
+  def _id_token(key, **overrides):
+    now = int(time.time())
+    payload = {
+      "iss": "https://accounts.google.com",
+      "aud": "client-123",
+      "iat": now,
+      "exp": now + 600,
+      "email": "jwks_user@example.com",
+      "email_verified": True,
+      "name": "JWKS User",
+      **overrides,
+    }
+    return jwt.encode({"alg": "RS256", "kid": key.kid}, payload, key).decode("utf-8")
+
+  assert client.post("/api/auth/google", json={"id_token": _id_token(old_key)}).status_code == 200
+  assert client.post("/api/auth/google", json={"id_token": _id_token(old_key)}).status_code == 200
+  assert len(fetches) == 1
+
+  assert client.post("/api/auth/google", json={"id_token": _id_token(old_key, aud="other")}).status_code == 401
+  assert client.post("/api/auth/google", json={"id_token": _id_token(old_key, exp=int(time.time()) - 3600)}).status_code == 401
+
+  # 키 교체: 새 kid로 서명된 토큰이 오면 JWKS를 다시 받음
+  source.jwks = {"keys": [new_key.as_dict(is_private=False)]}
+  assert client.post("/api/auth/google", json={"id_token": _id_token(new_key)}).status_code == 200
+  assert len(fetches) == 2
+
+def test_google_id_token_rejects_forged_tokens(client: TestClient, monkeypatch, db_session):
+  """서명 없는(alg=none) 토큰, 다른 키로 서명한 토큰, aud/iss가 다른 토큰, kid 없는 토큰은 모두 401"""
+  import base64
+  import json
+  import time
+  from authlib.jose import JsonWebKey
+  from asset_management.app.auth.google import GoogleKeyCache, StaticKeySource, get_google_keys
+  from asset_management.app.auth.settings import AUTH_SETTINGS as APP_AUTH_SETTINGS
+  from asset_management.main import app
+
+  monkeypatch.setattr(APP_AUTH_SETTINGS, "GOOGLE_CLIENT_ID", "client-123")
+  google_key = JsonWebKey.generate_key("RSA", 2048, is_private=True, options={"kid": "google"})
+  attacker_key = JsonWebKey.generate_key("RSA", 2048, is_private=True, options={"kid": "google"})
+  # authlib은 키에 kid가 있으면 헤더의 kid를 덮어쓰므로 kid 없는 사본으로 서명
+  unnamed_key = JsonWebKey.import_key({k: v for k, v in google_key.as_dict(is_private=True).items() if k != "kid"})
+  keys = GoogleKeyCache(StaticKeySource({"keys": [google_key.as_dict(is_private=False)]}))
+  app.dependency_overrides[get_google_keys] = lambda: keys
+
+  # 이미 가입된 계정을 노리는 토큰
+  victim = {"name": "victim", "email": "victim@example.com", "password": "victimpassword"}
+  assert client.post("/api/users/signup", json=victim).status_code == 201
+
+  now = int(time.time())
+  payload = {
+    "iss": "https://accounts.google.com",
+    "aud": "client-123",
+    "iat": now,
+    "exp": now + 600,
+    "email": victim["email"],
+    "email_verified": True,
+  }
+
+  def _b64(data: dict) -> str:
+    return base64.urlsafe_b64encode(json.dumps(data).encode("utf-8")).decode("ascii").rstrip("=")
+
+  def _signed(key, header=None, **overrides):
+    return jwt.encode(header or {"alg": "RS256", "kid": "google"}, {**payload, **overrides}, key).decode("utf-8")
+
+  forged = [
+    f"{_b64({'alg': 'none', 'kid': 'google'})}.{_b64(payload)}.",
+    f"{_b64({'alg': 'none'})}.{_b64(payload)}.",
+    _signed(attacker_key),
+    _signed(google_key, aud="other-client"),
+    _signed(google_key, iss="https://evil.example.com"),
+    # 같은 키로 서명했지만 kid가 없거나 모르는 값
+    _signed(unnamed_key, header={"alg": "RS256"}),
+    _signed(unnamed_key, header={"alg": "RS256", "kid": "unknown"}),
+  ]
+  for id_token in forged:
+    assert client.post("/api/auth/google", json={"id_token": id_token}).status_code == 401
+
+  with db_session() as session:
+    assert session.query(User).filter(User.email == victim["email"]).one().social_email is None
+
+  assert client.post("/api/auth/google", json={"id_token": _signed(google_key)}).status_code == 200
+
+def test_login_rate_limited_per_account(client: TestClient, user_data):
+  """같은 계정으로 연속 로그인 시도가 한도를 넘으면 429, 다른 계정은 영향 없음"""
+  from asset_management.app.auth.settings import AUTH_SETTINGS as APP_AUTH_SETTINGS
+
+  for _ in range(APP_AUTH_SETTINGS.RATE_LIMIT_ACCOUNT_BURST):
+    response = client.post("/api/auth/login", json={"email": user_data["email"].upper(), "password": "wrongpassword"})
+    assert response.status_code == 401
+
+  response = client.post("/api/auth/login", json={"email": user_data["email"], "password": user_data["password"]})
+  assert response.status_code == 429
+  assert int(response.headers["retry-after"]) >= 1
+
+  response = client.post("/api/auth/login", json={"email": "other@example.com", "password": "wrongpassword"})
+  assert response.status_code == 401
+
+def test_login_rate_limit_not_bypassed_by_padded_body(client: TestClient, user_data):
+  """본문을 부풀리거나 계정을 알 수 없게 보내도 계정 한도를 피할 수 없음"""
+  from asset_management.app.auth.settings import AUTH_SETTINGS as APP_AUTH_SETTINGS
+
+  padded = '{"email": "%s", "password": "wrongpassword"%s}' % (user_data["email"], " " * 5000)
+  response = client.post("/api/auth/login", content=padded, headers={"Content-Type": "application/json"})
+  assert response.status_code == 413
+
+  for _ in range(APP_AUTH_SETTINGS.RATE_LIMIT_ACCOUNT_BURST):
+    response = client.post("/api/auth/login", content="not json", headers={"Content-Type": "application/json"})
+    assert response.status_code == 422
+  response = client.post("/api/auth/login", json={"password": "wrongpassword"})
+  assert response.status_code == 429
+
+def test_login_unknown_email_verifies_dummy_hash(client: TestClient, user_data, monkeypatch):
+  """없는 계정도 실제 계정과 같은 비용의 scrypt 검증을 거쳐 401"""
+  from asset_management.app.auth.passwords import PASSWORD_HASHER
+
+  verified = []
+  verify = PASSWORD_HASHER.verify
+  monkeypatch.setattr(PASSWORD_HASHER, "verify", lambda password, hashed: verified.append(hashed) or verify(password, hashed))
+
+  response = client.post("/api/auth/login", json={"email": "nobody@example.com", "password": "wrongpassword"})
+  assert response.status_code == 401
+  assert verified == [PASSWORD_HASHER.dummy_hash]
+  assert not PASSWORD_HASHER.needs_rehash(PASSWORD_HASHER.dummy_hash)
@@ -101,6 +101,34 @@ def test_admin_signup_duplicate_club_code_conflict(client):
     assert second_response.status_code == 409
 
 
+def test_admin_signup_retries_colliding_club_code(client, monkeypatch):
+    """생성한 club_code가 이미 있으면 unique 제약 충돌 후 새 코드로 다시 시도"""
+    from asset_management.app.admin import routes as admin_routes
+
+    first = client.post("/api/admin/signup", json={
+        "name": "Admin One",
+        "email": "collide_one@example.com",
+        "password": "strongpassword",
+        "club_name": "Collide One",
+        "club_code": "TAKEN1",
+    })
+    assert first.status_code == 201
+
+    candidates = iter(["TAKEN1", "TAKEN1", "FRESH1"])
+    monkeypatch.setattr(admin_routes, "generate_club_code", lambda: next(candidates))
+    second = client.post("/api/admin/signup", json={
+        "name": "Admin Two",
+        "email": "collide_two@example.com",
+        "password": "strongpassword",
+        "club_name": "Collide Two",
+    })
+    assert second.status_code == 201
+    assert second.json()["club_code"] == "FRESH1"
+
+    login = client.post("/api/auth/login", json={"email": "collide_two@example.com", "password": "strongpassword"})
+    assert login.status_code == 200
+
+
 def test_admin_update_club_code(client):
     admin_payload = {
         "name": "Admin Update",
@@ -164,6 +192,38 @@ def test_admin_get_my_club(client):
     assert my_club_data["club_code"] == admin_data["club_code"]
 
 
+def test_admin_my_club_resolved_from_cached_principal(client, test_db):
+    """두 번째 요청부터는 관리자 동아리를 캐시된 principal에서 찾고 club 한 건만 조회"""
+    from sqlalchemy import event
+
+    admin_payload = {
+        "name": "Admin Context",
+        "email": "context_admin@example.com",
+        "password": "strongpassword",
+        "club_name": "Context Club",
+    }
+    assert client.post("/api/admin/signup", json=admin_payload).status_code == 201
+    token = client.post(
+        "/api/auth/login",
+        json={"email": admin_payload["email"], "password": admin_payload["password"]},
+    ).json()["tokens"]["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    assert client.get("/api/admin/my-club", headers=headers).status_code == 200
+
+    statements = []
+    def _record(conn, cursor, statement, *args):
+        statements.append(statement)
+    event.listen(test_db, "before_cursor_execute", _record)
+    try:
+        response = client.get("/api/admin/my-club", headers=headers)
+    finally:
+        event.remove(test_db, "before_cursor_execute", _record)
+    assert response.status_code == 200
+    assert response.json()["club_name"] == "Context Club"
+    assert len(statements) == 1
+    assert "FROM club" in statements[0]
+
+
 def test_get_my_clubs_unauthorized(client):
     """인증 없이 /clubs/me 엔드포인트 호출 시 401 에러"""
     response = client.get("/api/clubs/me")
@@ -281,3 +341,116 @@ def test_get_my_clubs_multiple_clubs(client):
     club_ids = [club["id"] for club in clubs]
     assert club1_data["club_id"] in club_ids
     assert club2_data["club_id"] in club_ids
+
+
+def test_admin_bulk_approve_and_reject_applicants(client):
+    """가입 신청 일괄 승인/거절: 대기 중인 신청만 반영되고 나머지는 skipped"""
+    admin_payload = {
+        "name": "Bulk Admin",
+        "email": "bulk_admin@example.com",
+        "password": "strongpassword",
+        "club_name": "Bulk Club",
+    }
+    signup = client.post("/api/admin/signup", json=admin_payload)
+    assert signup.status_code == 201
+    club_code = signup.json()["club_code"]
+    admin_token = client.post(
+        "/api/auth/login",
+        json={"email": admin_payload["email"], "password": admin_payload["password"]},
+    ).json()["tokens"]["access_token"]
+    admin_headers = {"Authorization": f"Bearer {admin_token}"}
+
+    applicants = {}
+    for name in ["alpha", "beta", "gamma"]:
+        user = client.post(
+            "/api/users/signup",
+            json={"name": name, "email": f"{name}@example.com", "password": "password123"},
+        ).json()
+        token = client.post(
+            "/api/auth/login", json={"email": f"{name}@example.com", "password": "password123"}
+        ).json()["tokens"]["access_token"]
+        assert client.post(
+            "/api/club/apply", json={"club_code": club_code}, headers={"Authorization": f"Bearer {token}"}
+        ).status_code == 200
+        applicants[name] = (user["id"], token)
+
+    response = client.patch(
+        "/api/admin/users/approve",
+        json={
+            "approved_user_ids": [applicants["alpha"][0], applicants["beta"][0], "missing-user"],
+            "rejected_user_ids": [applicants["gamma"][0]],
+        },
+        headers=admin_headers,
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["approved"] == [applicants["alpha"][0], applicants["beta"][0]]
+    assert data["rejected"] == [applicants["gamma"][0]]
+    assert data["skipped"] == [{"id": "missing-user", "reason": "not_found"}]
+
+    pending = client.get("/api/admin/applylist", headers=admin_headers).json()["users"]
+    assert pending == []
+
+    # 승인된 사용자는 기존 토큰으로도 동아리원 권한이 반영됨
+    alpha_headers = {"Authorization": f"Bearer {applicants['alpha'][1]}"}
+    club_id = signup.json()["club_id"]
+    members = client.get(f"/api/club-members/?club_id={club_id}", headers=alpha_headers).json()
+    assert members["total"] == 3
+
+    again = client.patch(
+        "/api/admin/users/approve",
+        json={"approved_user_ids": [applicants["alpha"][0]]},
+        headers=admin_headers,
+    )
+    assert again.json()["skipped"] == [{"id": applicants["alpha"][0], "reason": "not_found"}]
+
+    assert client.patch(
+        "/api/admin/users/approve", json={}, headers=admin_headers
+    ).status_code == 422
+
+
+def test_admin_applylist_paginated_and_searchable(client, db_session):
+    """가입 신청 목록: 커서 페이지네이션, 앞부분 검색, 전체 개수"""
+    from asset_management.app.user.models import User, UserClublist, UserPermission
+
+    admin_payload = {
+        "name": "Inbox Admin",
+        "email": "inbox_admin@example.com",
+        "password": "strongpassword",
+        "club_name": "Inbox Club",
+    }
+    club_id = client.post("/api/admin/signup", json=admin_payload).json()["club_id"]
+    token = client.post(
+        "/api/auth/login",
+        json={"email": admin_payload["email"], "password": admin_payload["password"]},
+    ).json()["tokens"]["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    with db_session() as session:
+        for i in range(5):
+            user = User(name=f"kim{i}", email=f"kim{i}@example.com", student_id=f"2024{i:05d}")
+            session.add(user)
+            session.flush()
+            session.add(UserClublist(user_id=user.id, club_id=club_id, permission=UserPermission.APPLICANT.value))
+        other = User(name="lee", email="lee_%@example.com", student_id="202300001")
+        session.add(other)
+        session.flush()
+        session.add(UserClublist(user_id=other.id, club_id=club_id, permission=UserPermission.APPLICANT.value))
+        session.commit()
+
+    first = client.get("/api/admin/applylist?size=4", headers=headers).json()
+    assert first["total"] == 6
+    assert [u["name"] for u in first["users"]] == ["kim0", "kim1", "kim2", "kim3"]
+    second = client.get(f"/api/admin/applylist?size=4&cursor={first['next_cursor']}", headers=headers).json()
+    assert [u["name"] for u in second["users"]] == ["kim4", "lee"]
+    assert second["next_cursor"] is None
+
+    by_name = client.get("/api/admin/applylist?q=kim", headers=headers).json()
+    assert by_name["total"] == 5
+    by_student_id = client.get("/api/admin/applylist?q=2023", headers=headers).json()
+    assert [u["name"] for u in by_student_id["users"]] == ["lee"]
+    # LIKE 특수문자는 글자 그대로 검색
+    assert client.get("/api/admin/applylist?q=lee_%25", headers=headers).json()["total"] == 1
+    assert client.get("/api/admin/applylist?q=%25", headers=headers).json()["total"] == 0
+
+    assert client.get("/api/admin/applylist?cursor=garbage", headers=headers).status_code == 400
@@ -264,3 +264,390 @@ def test_delete_picture_without_auth(client: TestClient, admin_token: str, test_
         f"/api/admin/assets/{test_asset['id']}/pictures/{picture_id}",
     )
     assert response.status_code == 401
+
+
+def test_upload_picture_dedupes_blobs(client: TestClient, admin_token: str, test_asset: dict, blob_store, db_session):
+    """같은 내용의 사진은 저장소에 한 번만 저장되고, 마지막 참조가 지워질 때 원본도 지워짐"""
+    from asset_management.app.picture.models import Picture
+    from asset_management.app.picture.storage import content_hash
+
+    ids = []
+    for name in ("a.jpg", "b.jpg"):
+        files = {"file": (name, BytesIO(_fake_jpeg_bytes()), "image/jpeg")}
+        res = client.post(
+            f"/api/admin/assets/{test_asset['id']}/pictures",
+            files=files,
+            headers={"Authorization": f"Bearer {admin_token}"},
+        )
+        assert res.status_code in [201, 200], res.text
+        ids.append(res.json()["id"])
+
+    digest = content_hash(_fake_jpeg_bytes())
+    assert len(list(blob_store.root.rglob(digest))) == 1
+    with db_session() as session:
+        rows = session.query(Picture.content_hash, Picture.data).filter(Picture.id.in_(ids)).all()
+        assert all(row.content_hash == digest and row.data is None for row in rows)
+
+    client.delete(
+        f"/api/admin/assets/{test_asset['id']}/pictures/{ids[0]}",
+        headers={"Authorization": f"Bearer {admin_token}"},
+    )
+    assert blob_store.exists(digest)
+    assert client.get(f"/api/pictures/{ids[1]}").content == _fake_jpeg_bytes()
+
+    client.delete(
+        f"/api/admin/assets/{test_asset['id']}/pictures/{ids[1]}",
+        headers={"Authorization": f"Bearer {admin_token}"},
+    )
+    assert not blob_store.exists(digest)
+
+
+def test_delete_picture_keeps_blob_uploaded_concurrently(
+    client: TestClient, admin_token: str, admin_club: dict, test_asset: dict, uploaded_picture: dict, blob_store,
+    db_session, monkeypatch,
+):
+    """원본을 지우는 사이에 같은 내용이 업로드되어도 새 사진의 원본은 남음"""
+    from asset_management.app.picture.models import Picture
+    from asset_management.app.picture.storage import content_hash
+
+    digest = content_hash(_fake_jpeg_bytes())
+    delete = blob_store.delete
+
+    def delete_during_upload(target: str) -> None:
+        delete(target)
+        # put을 건너뛴 동시 업로드가 이 시점에 커밋됨
+        with db_session() as session:
+            session.add(Picture(
+                asset_id=test_asset["id"], user_id=admin_club["admin_user_id"], content_hash=target,
+                content_type="image/jpeg", filename="race.jpg", size=len(_fake_jpeg_bytes()),
+            ))
+            session.commit()
+
+    monkeypatch.setattr(blob_store, "delete", delete_during_upload)
+    res = client.delete(
+        f"/api/admin/assets/{test_asset['id']}/pictures/{uploaded_picture['id']}",
+        headers={"Authorization": f"Bearer {admin_token}"},
+    )
+    assert res.status_code in [204, 200], res.text
+    assert blob_store.get(digest) == _fake_jpeg_bytes()
+
+
+def test_upload_picture_restores_blob_deleted_concurrently(
+    client: TestClient, admin_token: str, test_asset: dict, blob_store, monkeypatch
+):
+    """put이 건너뛴 원본이 커밋 전에 지워졌으면 업로드가 다시 씀"""
+    from asset_management.app.picture.storage import content_hash
+
+    put = blob_store.put
+    calls = []
+
+    def put_skipped_then_deleted(data: bytes, digest: str | None = None) -> str:
+        # 첫 put은 이미 있던 원본을 보고 건너뛰었고, 그 원본이 바로 지워진 상황
+        calls.append(digest)
+        return digest if len(calls) == 1 else put(data, digest=digest)
+
+    monkeypatch.setattr(blob_store, "put", put_skipped_then_deleted)
+    res = client.post(
+        f"/api/admin/assets/{test_asset['id']}/pictures",
+        files={"file": ("a.jpg", BytesIO(_fake_jpeg_bytes()), "image/jpeg")},
+        headers={"Authorization": f"Bearer {admin_token}"},
+    )
+    assert res.status_code in [201, 200], res.text
+    assert len(calls) == 2
+    assert blob_store.get(content_hash(_fake_jpeg_bytes())) == _fake_jpeg_bytes()
+
+
+def test_migrate_legacy_picture_blobs(client: TestClient, admin_club: dict, test_asset: dict, blob_store, db_session):
+    """DB에 원본이 있는 기존 사진을 배치로 저장소에 옮김"""
+    from asset_management.app.picture.migrate_blobs import migrate_blobs
+    from asset_management.app.picture.models import Picture
+
+    legacy = [_fake_jpeg_bytes() + bytes([i]) for i in range(3)]
+    with db_session() as session:
+        session.add_all(
+            Picture(
+                asset_id=test_asset["id"],
+                user_id=admin_club["admin_user_id"],
+                data=data,
+                content_type="image/jpeg",
+                filename=f"legacy{i}.jpg",
+                size=len(data),
+            )
+            for i, data in enumerate(legacy)
+        )
+        session.commit()
+        ids = [p.id for p in session.query(Picture).order_by(Picture.id)]
+
+    # 옮기기 전에도 DB의 data로 조회 가능
+    assert client.get(f"/api/pictures/{ids[0]}").content == legacy[0]
+
+    with db_session() as session:
+        assert migrate_blobs(session, blob_store, batch_size=2) == 3
+        assert migrate_blobs(session, blob_store, batch_size=2) == 0
+        assert session.query(Picture).filter(Picture.data.is_not(None)).count() == 0
+
+    for picture_id, data in zip(ids, legacy):
+        assert client.get(f"/api/pictures/{picture_id}").content == data
+
+
+def test_picture_metadata_queries_defer_data(admin_club: dict, test_asset: dict, db_session):
+    """메타데이터 조회는 원본 컬럼을 읽지 않고, 원본은 별도 경로로만 읽음"""
+    from sqlalchemy import inspect
+    from sqlalchemy.exc import InvalidRequestError
+    from asset_management.app.picture.models import Picture
+    from asset_management.app.picture.repositories import PictureRepository
+
+    with db_session() as session:
+        session.add(Picture(
+            asset_id=test_asset["id"],
+            user_id=admin_club["admin_user_id"],
+            data=_fake_jpeg_bytes(),
+            content_type="image/jpeg",
+            filename="legacy.jpg",
+            size=len(_fake_jpeg_bytes()),
+        ))
+        session.commit()
+
+    with db_session() as session:
+        repository = PictureRepository(session)
+        pictures = repository.get_pictures_by_asset(test_asset["id"])
+        assert len(pictures) == 1
+        assert "data" in inspect(pictures[0]).unloaded
+        with pytest.raises(InvalidRequestError):
+            pictures[0].data
+        assert repository.get_picture_data(pictures[0].id) == _fake_jpeg_bytes()
+
+
+def test_get_picture_conditional_and_range(client: TestClient, uploaded_picture: dict):
+    """ETag/Last-Modified 재검증은 304, Range 요청은 206/416"""
+    from asset_management.app.picture.storage import content_hash
+
+    data = _fake_jpeg_bytes()
+    url = f"/api/pictures/{uploaded_picture['id']}"
+
+    res = client.get(url)
+    assert res.status_code == 200, res.text
+    etag = res.headers["etag"]
+    assert etag == f'"{content_hash(data)}"'
+    assert res.headers["accept-ranges"] == "bytes"
+    assert "last-modified" in res.headers
+
+    res = client.get(url, headers={"If-None-Match": etag})
+    assert res.status_code == 304
+    assert res.content == b""
+
+    res = client.get(url, headers={"If-Modified-Since": "Sun, 01 Jan 2090 00:00:00 GMT"})
+    assert res.status_code == 304
+
+    res = client.get(url, headers={"Range": "bytes=0-3"})
+    assert res.status_code == 206
+    assert res.content == data[:4]
+    assert res.headers["content-range"] == f"bytes 0-3/{len(data)}"
+
+    res = client.get(url, headers={"Range": "bytes=-2"})
+    assert res.status_code == 206
+    assert res.content == data[-2:]
+
+    res = client.get(url, headers={"Range": f"bytes={len(data)}-"})
+    assert res.status_code == 416
+    assert res.headers["content-range"] == f"bytes */{len(data)}"
+
+    # If-Range가 맞지 않으면 전체 응답
+    res = client.get(url, headers={"Range": "bytes=0-3", "If-Range": '"stale"'})
+    assert res.status_code == 200
+    assert res.content == data
+
+
+def _real_png_bytes(width: int = 1200, height: int = 800) -> bytes:
+    from PIL import Image
+
+    out = BytesIO()
+    Image.new("RGB", (width, height), (200, 30, 30)).save(out, "PNG")
+    return out.getvalue()
+
+
+def test_get_picture_renditions(client: TestClient, admin_token: str, test_asset: dict, blob_store):
+    """업로드한 사진의 축소본을 size 파라미터로 조회"""
+    from PIL import Image
+    from asset_management.app.picture.storage import content_hash
+    from asset_management.app.picture.thumbnails import RENDITIONS, create_renditions
+
+    data = _real_png_bytes()
+    files = {"file": ("big.png", BytesIO(data), "image/png")}
+    res = client.post(
+        f"/api/admin/assets/{test_asset['id']}/pictures",
+        files=files,
+        headers={"Authorization": f"Bearer {admin_token}"},
+    )
+    assert res.status_code in [201, 200], res.text
+    picture_id = res.json()["id"]
+
+    # 워커 풀 작업과 무관하게 동일한 결과여야 함
+    create_renditions(blob_store, content_hash(data))
+
+    for size, max_side in RENDITIONS.items():
+        res = client.get(f"/api/pictures/{picture_id}", params={"size": size})
+        assert res.status_code == 200, res.text
+        assert res.headers["content-type"] in ("image/webp", "image/jpeg")
+        assert res.headers["etag"].endswith(f'-{size}"')
+        with Image.open(BytesIO(res.content)) as image:
+            assert max(image.size) == max_side
+        assert len(res.content) < len(data)
+
+    res = client.get(f"/api/pictures/{picture_id}", params={"size": "huge"})
+    assert res.status_code == 422
+
+
+def test_delete_legacy_picture_removes_renditions(
+    client: TestClient, admin_token: str, admin_club: dict, test_asset: dict, blob_store, db_session
+):
+    """저장소로 옮기기 전의 사진을 지우면 조회 때 만든 축소본도 지워짐"""
+    from asset_management.app.picture.models import Picture
+    from asset_management.app.picture.storage import content_hash
+
+    data = _real_png_bytes()
+    with db_session() as session:
+        picture = Picture(
+            asset_id=test_asset["id"], user_id=admin_club["admin_user_id"], data=data,
+            content_type="image/png", filename="legacy.png", size=len(data),
+        )
+        session.add(picture)
+        session.commit()
+        picture_id = picture.id
+
+    assert client.get(f"/api/pictures/{picture_id}", params={"size": "thumb"}).status_code == 200
+    assert blob_store.rendition_exists(content_hash(data), "thumb")
+
+    res = client.delete(
+        f"/api/admin/assets/{test_asset['id']}/pictures/{picture_id}",
+        headers={"Authorization": f"Bearer {admin_token}"},
+    )
+    assert res.status_code in [204, 200], res.text
+    assert not blob_store.rendition_exists(content_hash(data), "thumb")
+
+
+def test_rendition_pipeline_skips_when_queue_full(blob_store, monkeypatch):
+    """대기 작업이 가득 차면 새 썸네일 작업은 건너뛰고, 끝난 뒤에는 다시 받음"""
+    import threading
+    from asset_management.app.picture import thumbnails
+
+    release = threading.Event()
+    monkeypatch.setattr(thumbnails, "create_renditions", lambda store, digest: release.wait(5))
+    pipeline = thumbnails.RenditionPipeline(max_workers=1, max_pending=1)
+
+    futures = [pipeline.submit(blob_store, "a" * 64), pipeline.submit(blob_store, "b" * 64)]
+    assert None not in futures
+    assert pipeline.submit(blob_store, "c" * 64) is None
+
+    release.set()
+    pipeline._executor.shutdown(wait=True)
+    assert all(future.done() for future in futures)
+    assert pipeline._slots.acquire(blocking=False) and pipeline._slots.acquire(blocking=False)
+
+
+def test_get_picture_rendition_of_undecodable_image(client: TestClient, uploaded_picture: dict):
+    """이미지로 해석할 수 없는 파일은 축소본 대신 원본을 반환"""
+    res = client.get(f"/api/pictures/{uploaded_picture['id']}", params={"size": "thumb"})
+    assert res.status_code == 200, res.text
+    assert res.content == _fake_jpeg_bytes()
+
+
+def test_picture_cache_byte_budget():
+    """바이트 예산을 넘으면 가장 오래 안 쓴 항목부터 밀어냄"""
+    from asset_management.app.picture.cache import PictureCache, PicturePayload
+
+    cache = PictureCache(max_bytes=100, max_entry_bytes=60)
+
+    def payload(n: int) -> PicturePayload:
+        return PicturePayload(asset_id=1, digest="d", content_type="image/jpeg", last_modified=None, data=b"x" * n)
+
+    cache.set(1, None, payload(40))
+    cache.set(2, None, payload(40))
+    assert cache.get(1) is not None  # 1을 최근 사용으로
+    cache.set(3, None, payload(40))
+    cache.set(4, None, payload(61))  # 항목 제한 초과는 보관하지 않음
+
+    assert cache.get(2) is None
+    assert cache.get(1) is not None and cache.get(3) is not None
+    assert cache.get(4) is None
+    stats = cache.stats()
+    assert stats["resident_bytes"] == 80
+    assert stats["hits"] == 3 and stats["misses"] == 2
+
+
+def test_get_picture_served_from_cache(
+    client: TestClient, admin_token: str, test_asset: dict, uploaded_picture: dict, blob_store
+):
+    """두 번째 조회부터는 저장소를 읽지 않고, 삭제 시 캐시도 비워짐"""
+    from asset_management.app.picture.storage import content_hash
+
+    url = f"/api/pictures/{uploaded_picture['id']}"
+    assert client.get(url).content == _fake_jpeg_bytes()
+
+    # 저장소에서 지워도 캐시에서 응답
+    blob_store.delete(content_hash(_fake_jpeg_bytes()))
+    assert client.get(url).content == _fake_jpeg_bytes()
+
+    res = client.get("/api/admin/pictures/cache-stats", headers={"Authorization": f"Bearer {admin_token}"})
+    assert res.status_code == 200, res.text
+    stats = res.json()
+    assert stats["hits"] >= 1
+    assert stats["resident_bytes"] == len(_fake_jpeg_bytes())
+
+    res = client.delete(
+        f"/api/admin/assets/{test_asset['id']}/pictures/{uploaded_picture['id']}",
+        headers={"Authorization": f"Bearer {admin_token}"},
+    )
+    assert res.status_code in [204, 200], res.text
+    assert client.get(url).status_code == 404
+
+
+def test_upload_picture_sniffs_content_type(client: TestClient, admin_token: str, test_asset: dict):
+    """content type은 클라이언트 헤더가 아니라 파일 내용으로 판별"""
+    png = _real_png_bytes(16, 16)
+    res = client.post(
+        f"/api/admin/assets/{test_asset['id']}/pictures",
+        files={"file": ("photo.jpg", BytesIO(png), "image/jpeg")},
+        headers={"Authorization": f"Bearer {admin_token}"},
+    )
+    assert res.status_code in [201, 200], res.text
+    assert res.json()["content_type"] == "image/png"
+    assert res.json()["size"] == len(png)
+
+    res = client.post(
+        f"/api/admin/assets/{test_asset['id']}/pictures",
+        files={"file": ("fake.jpg", BytesIO(b"<html>not an image</html>"), "image/jpeg")},
+        headers={"Authorization": f"Bearer {admin_token}"},
+    )
+    assert res.status_code == 400
+    assert "Unsupported" in res.json()["detail"]
+
+
+def test_list_assets_includes_main_picture(
+    client: TestClient, admin_token: str, admin_club: dict, test_asset: dict, uploaded_picture: dict
+):
+    """물품 목록에 대표 사진 id와 사진 수가 포함됨"""
+    files = {"file": ("extra.jpg", BytesIO(_fake_jpeg_bytes()), "image/jpeg")}
+    res = client.post(
+        f"/api/admin/assets/{test_asset['id']}/pictures",
+        files=files,
+        params={"is_main": "false"},
+        headers={"Authorization": f"Bearer {admin_token}"},
+    )
+    assert res.status_code in [201, 200], res.text
+
+    res = client.post(
+        "/api/admin/assets",
+        json={"name": "No Picture", "quantity": 1, "club_id": admin_club["club_id"]},
+        headers={"Authorization": f"Bearer {admin_token}"},
+    )
+    assert res.status_code == 201, res.text
+    bare_id = res.json()["id"]
+
+    res = client.get(f"/api/assets/{admin_club['club_id']}", headers={"Authorization": f"Bearer {admin_token}"})
+    assert res.status_code == 200, res.text
+    assets = {a["id"]: a for a in res.json()}
+    assert assets[test_asset["id"]]["main_picture_id"] == uploaded_picture["id"]
+    assert assets[test_asset["id"]]["picture_count"] == 2
+    assert assets[bare_id]["main_picture_id"] is None
+    assert assets[bare_id]["picture_count"] == 0
@@ -590,3 +590,497 @@ def test_create_multiple_schedules(
     schedule_ids_in_response = [s["id"] for s in data["schedules"]]
     for created_id in created_ids:
         assert created_id in schedule_ids_in_response
+
+
+# ---------------- Tests: 커서 페이지네이션 ----------------
+
+def test_get_schedules_cursor_pagination(
+    client: TestClient,
+    admin_headers: dict,
+    signed_up_admin: dict,
+    created_asset: dict,
+):
+    """커서 모드로 전체 스케줄을 (start_date, id) 순서대로 빠짐없이 순회"""
+    club_id = signed_up_admin["club_id"]
+    base = datetime.now() + timedelta(days=1)
+
+    created_ids = []
+    # 같은 start_date를 가진 스케줄도 id로 순서가 정해지는지 확인
+    for i in range(5):
+        payload = {
+            "start_date": (base + timedelta(days=i // 2)).isoformat(),
+            "end_date": (base + timedelta(days=i // 2, hours=1)).isoformat(),
+            "asset_id": created_asset["id"],
+            "user_id": signed_up_admin["id"],
+            "status": "pending",
+        }
+        res = client.post(f"/api/schedules/{club_id}", json=payload, headers=admin_headers)
+        assert res.status_code == 201, res.text
+        created_ids.append(res.json()["id"])
+
+    seen = []
+    cursor = ""
+    while True:
+        res = client.get(
+            f"/api/schedules/{club_id}",
+            params={"cursor": cursor, "size": 2, "with_total": "true"},
+            headers=admin_headers,
+        )
+        assert res.status_code == 200, res.text
+        data = res.json()
+        assert data["total"] == 5
+        assert len(data["schedules"]) <= 2
+        seen += [s["id"] for s in data["schedules"]]
+        if data["next_cursor"] is None:
+            break
+        cursor = data["next_cursor"]
+
+    assert seen == created_ids
+
+
+def test_get_schedules_invalid_cursor(
+    client: TestClient,
+    admin_headers: dict,
+    signed_up_admin: dict,
+):
+    """잘못된 커서는 400"""
+    club_id = signed_up_admin["club_id"]
+
+    res = client.get(
+        f"/api/schedules/{club_id}",
+        params={"cursor": "not-a-cursor"},
+        headers=admin_headers,
+    )
+    assert res.status_code == 400, res.text
+
+
+# ---------------- Tests: 예약 충돌 검사 ----------------
+
+def test_create_schedule_rejects_overbooking(
+    client: TestClient,
+    admin_headers: dict,
+    signed_up_admin: dict,
+    created_asset: dict,
+):
+    """겹치는 예약이 총 수량(5)을 넘으면 409"""
+    club_id = signed_up_admin["club_id"]
+    base = datetime.now() + timedelta(days=10)
+
+    def _payload(start_offset_h: int, end_offset_h: int, status: str = "pending") -> dict:
+        return {
+            "start_date": (base + timedelta(hours=start_offset_h)).isoformat(),
+            "end_date": (base + timedelta(hours=end_offset_h)).isoformat(),
+            "asset_id": created_asset["id"],
+            "user_id": signed_up_admin["id"],
+            "status": status,
+        }
+
+    # 서로 다른 구간이지만 [4h, 5h) 에서 5개가 모두 겹침
+    for i in range(5):
+        res = client.post(f"/api/schedules/{club_id}", json=_payload(i, 5 + i), headers=admin_headers)
+        assert res.status_code == 201, res.text
+
+    res = client.post(f"/api/schedules/{club_id}", json=_payload(4, 6), headers=admin_headers)
+    assert res.status_code == 409, res.text
+
+    # 첫 예약이 끝나는 시점부터는 수량이 남음 (반열린 구간)
+    res = client.post(f"/api/schedules/{club_id}", json=_payload(-3, 0), headers=admin_headers)
+    assert res.status_code == 201, res.text
+
+    # 취소 상태 이력은 수량을 점유하지 않음
+    res = client.post(f"/api/schedules/{club_id}", json=_payload(4, 6, "cancelled"), headers=admin_headers)
+    assert res.status_code == 201, res.text
+
+
+def test_update_schedule_rejects_overbooking(
+    client: TestClient,
+    admin_headers: dict,
+    signed_up_admin: dict,
+    created_asset: dict,
+):
+    """겹치지 않게 만든 예약을 PUT으로 옮기거나 취소를 되살려도 총 수량(5)을 넘으면 409"""
+    club_id = signed_up_admin["club_id"]
+    base = datetime.now() + timedelta(days=10)
+
+    def _payload(start_offset_h: int, end_offset_h: int, status: str = "pending") -> dict:
+        return {
+            "start_date": (base + timedelta(hours=start_offset_h)).isoformat(),
+            "end_date": (base + timedelta(hours=end_offset_h)).isoformat(),
+            "asset_id": created_asset["id"],
+            "user_id": signed_up_admin["id"],
+            "status": status,
+        }
+
+    for _ in range(5):
+        res = client.post(f"/api/schedules/{club_id}", json=_payload(0, 5), headers=admin_headers)
+        assert res.status_code == 201, res.text
+    later = client.post(f"/api/schedules/{club_id}", json=_payload(10, 12), headers=admin_headers).json()
+    cancelled = client.post(f"/api/schedules/{club_id}", json=_payload(0, 5, "cancelled"), headers=admin_headers).json()
+
+    moved = {k: v for k, v in _payload(2, 4).items() if k in ("start_date", "end_date")}
+    res = client.put(f"/api/schedules/{later['id']}", json=moved, headers=admin_headers)
+    assert res.status_code == 409, res.text
+    res = client.put(f"/api/schedules/{cancelled['id']}", json={"status": "pending"}, headers=admin_headers)
+    assert res.status_code == 409, res.text
+
+    # 자기 자신과는 겹치는 것으로 세지 않음
+    res = client.put(f"/api/schedules/{later['id']}", json=_payload(11, 13), headers=admin_headers)
+    assert res.status_code == 200, res.text
+
+
+def test_create_schedule_invalid_period(
+    client: TestClient,
+    admin_headers: dict,
+    signed_up_admin: dict,
+    created_asset: dict,
+):
+    """종료일이 시작일보다 빠르면 400"""
+    club_id = signed_up_admin["club_id"]
+    start_date = datetime.now() + timedelta(days=3)
+
+    res = client.post(
+        f"/api/schedules/{club_id}",
+        json={
+            "start_date": start_date.isoformat(),
+            "end_date": (start_date - timedelta(days=1)).isoformat(),
+            "asset_id": created_asset["id"],
+            "user_id": signed_up_admin["id"],
+            "status": "pending",
+        },
+        headers=admin_headers,
+    )
+    assert res.status_code == 400, res.text
+
+
+# ---------------- Tests: 캘린더 피드 ----------------
+
+def test_calendar_feed_conditional_get(
+    client: TestClient,
+    admin_headers: dict,
+    signed_up_admin: dict,
+    created_schedule: dict,
+):
+    """피드는 .ics로 스트리밍되고, 변경이 없으면 304, 스케줄이 바뀌면 새 ETag"""
+    club_id = signed_up_admin["club_id"]
+
+    res = client.get("/api/schedules/calendar/token", headers=admin_headers)
+    assert res.status_code == 200, res.text
+    token = res.json()["token"]
+
+    res = client.get(f"/api/schedules/calendar/club/{club_id}.ics", params={"token": token})
+    assert res.status_code == 200, res.text
+    assert res.headers["content-type"].startswith("text/calendar")
+    body = res.text
+    assert body.startswith("BEGIN:VCALENDAR\r\n")
+    assert body.endswith("END:VCALENDAR\r\n")
+    assert f"UID:schedule-{created_schedule['id']}@asset-management" in body
+    assert "STATUS:TENTATIVE" in body
+    etag = res.headers["etag"]
+    assert "last-modified" not in res.headers
+
+    res = client.get(
+        f"/api/schedules/calendar/club/{club_id}.ics",
+        params={"token": token},
+        headers={"If-None-Match": etag},
+    )
+    assert res.status_code == 304, res.text
+    assert res.content == b""
+
+    res = client.put(
+        f"/api/schedules/{created_schedule['id']}",
+        json={"status": "approved"},
+        headers=admin_headers,
+    )
+    assert res.status_code == 200, res.text
+
+    res = client.get(
+        "/api/schedules/calendar/me.ics",
+        params={"token": token},
+        headers={"If-None-Match": etag},
+    )
+    assert res.status_code == 200, res.text
+    assert res.headers["etag"] != etag
+    assert "STATUS:CONFIRMED" in res.text
+
+
+def test_calendar_feed_ignores_if_modified_since_after_delete(
+    client: TestClient,
+    admin_headers: dict,
+    signed_up_admin: dict,
+    created_schedule: dict,
+):
+    """삭제는 updated_at을 바꾸지 않으므로, If-Modified-Since만 보내는 클라이언트도 항상 새 피드를 받음"""
+    club_id = signed_up_admin["club_id"]
+    token = client.get("/api/schedules/calendar/token", headers=admin_headers).json()["token"]
+    url = f"/api/schedules/calendar/club/{club_id}.ics"
+    since = {"If-Modified-Since": "Sun, 01 Jan 2090 00:00:00 GMT"}
+
+    res = client.get(url, params={"token": token})
+    assert f"UID:schedule-{created_schedule['id']}@asset-management" in res.text
+
+    res = client.delete(f"/api/schedules/{created_schedule['id']}", headers=admin_headers)
+    assert res.status_code in [200, 204], res.text
+
+    res = client.get(url, params={"token": token}, headers=since)
+    assert res.status_code == 200, res.text
+    assert f"UID:schedule-{created_schedule['id']}@asset-management" not in res.text
+
+
+def test_calendar_feed_rejects_access_token(
+    client: TestClient,
+    admin_access_token: str,
+):
+    """피드 엔드포인트는 feed 타입 토큰만 허용"""
+    res = client.get("/api/schedules/calendar/me.ics", params={"token": admin_access_token})
+    assert res.status_code == 401, res.text
+
+
+# ---------------- Tests: 상태 일괄 변경 ----------------
+
+def test_bulk_update_schedule_status(
+    client: TestClient,
+    admin_headers: dict,
+    signed_up_admin: dict,
+    schedule_payload: dict,
+    created_asset: dict,
+):
+    """허용된 전이만 일괄 반영되고, available_quantity가 물품별로 합산 조정됨"""
+    club_id = signed_up_admin["club_id"]
+
+    ids = []
+    for _ in range(3):
+        res = client.post(f"/api/schedules/{club_id}", json=schedule_payload, headers=admin_headers)
+        assert res.status_code == 201, res.text
+        ids.append(res.json()["id"])
+
+    def _available() -> int:
+        res = client.get(f"/api/assets/{club_id}")
+        assert res.status_code == 200, res.text
+        [asset] = [a for a in res.json() if a["id"] == created_asset["id"]]
+        return asset["available_quantity"]
+
+    res = client.patch(
+        f"/api/schedules/{club_id}/status",
+        json={"schedule_ids": ids + [99999], "status": "approved"},
+        headers=admin_headers,
+    )
+    assert res.status_code == 200, res.text
+    data = res.json()
+    assert data["updated"] == ids
+    assert data["skipped"] == [{"id": 99999, "reason": "not_found"}]
+
+    res = client.patch(
+        f"/api/schedules/{club_id}/status",
+        json={"schedule_ids": ids, "status": "in_use"},
+        headers=admin_headers,
+    )
+    assert res.status_code == 200, res.text
+    assert res.json()["updated"] == ids
+    assert _available() == 5 - 3
+
+    res = client.patch(
+        f"/api/schedules/{club_id}/status",
+        json={"schedule_ids": ids[:2], "status": "returned"},
+        headers=admin_headers,
+    )
+    assert res.status_code == 200, res.text
+    assert res.json()["updated"] == ids[:2]
+    assert _available() == 5 - 1
+
+    # 반납된 스케줄은 다시 승인할 수 없음
+    res = client.patch(
+        f"/api/schedules/{club_id}/status",
+        json={"schedule_ids": ids, "status": "cancelled"},
+        headers=admin_headers,
+    )
+    assert res.status_code == 200, res.text
+    data = res.json()
+    assert data["updated"] == []
+    assert {s["id"] for s in data["skipped"]} == set(ids)
+    assert all(s["reason"] == "invalid_transition" for s in data["skipped"])
+
+    res = client.get(f"/api/schedules/{club_id}?status=returned", headers=admin_headers)
+    assert {s["id"] for s in res.json()["schedules"]} == set(ids[:2])
+
+
+def test_bulk_update_schedule_status_partial_quantity(
+    client: TestClient,
+    admin_headers: dict,
+    signed_up_admin: dict,
+    schedule_payload: dict,
+    created_asset: dict,
+    db_session,
+):
+    """남은 수량보다 많이 사용 처리하면 요청 순서대로 남은 수량만큼만 반영"""
+    from asset_management.app.assets.models import Asset
+
+    club_id = signed_up_admin["club_id"]
+    ids = []
+    for _ in range(3):
+        res = client.post(
+            f"/api/schedules/{club_id}", json={**schedule_payload, "status": "approved"}, headers=admin_headers
+        )
+        assert res.status_code == 201, res.text
+        ids.append(res.json()["id"])
+
+    with db_session() as session:
+        session.get(Asset, created_asset["id"]).available_quantity = 2
+        session.commit()
+
+    res = client.patch(
+        f"/api/schedules/{club_id}/status",
+        json={"schedule_ids": ids[::-1], "status": "in_use"},
+        headers=admin_headers,
+    )
+    assert res.status_code == 200, res.text
+    data = res.json()
+    assert data["updated"] == [ids[2], ids[1]]
+    assert data["skipped"] == [{"id": ids[0], "reason": "insufficient_quantity"}]
+
+    with db_session() as session:
+        assert session.get(Asset, created_asset["id"]).available_quantity == 0
+
+
+def test_bulk_update_schedule_status_requires_admin(
+    client: TestClient,
+    signed_up_admin: dict,
+    created_schedule: dict,
+):
+    """동아리 관리자가 아니면 403"""
+    user = {"name": "bulk_user", "email": "bulk_user@example.com", "password": "userpassword"}
+    res = client.post("/api/users/signup", json=user)
+    assert res.status_code == 201, res.text
+    res = client.post("/api/auth/login", json={"email": user["email"], "password": user["password"]})
+    headers = {"Authorization": f"Bearer {_extract_access_token(res.json())}"}
+
+    res = client.patch(
+        f"/api/schedules/{signed_up_admin['club_id']}/status",
+        json={"schedule_ids": [created_schedule["id"]], "status": "approved"},
+        headers=headers,
+    )
+    assert res.status_code == 403, res.text
+
+
+# ---------------- Tests: 이력 보관 ----------------
+
+def test_archived_schedules_remain_in_history(
+    client: TestClient,
+    admin_headers: dict,
+    signed_up_admin: dict,
+    created_asset: dict,
+    db_session,
+):
+    """보관 테이블로 옮긴 스케줄도 대여이력 조회에 그대로 나타남"""
+    from asset_management.app.schedule.archive import archive_closed_schedules
+    from asset_management.app.schedule.models import Schedule, ScheduleArchive
+
+    club_id = signed_up_admin["club_id"]
+    now = datetime.now()
+    created_ids = []
+    for start, status in (
+        (now - timedelta(days=400), "returned"),
+        (now - timedelta(days=300), "cancelled"),
+        (now - timedelta(days=200), "returned"),
+        (now + timedelta(days=1), "pending"),
+    ):
+        payload = {
+            "start_date": start.isoformat(),
+            "end_date": (start + timedelta(hours=2)).isoformat(),
+            "asset_id": created_asset["id"],
+            "user_id": signed_up_admin["id"],
+            "status": status,
+        }
+        res = client.post(f"/api/schedules/{club_id}", json=payload, headers=admin_headers)
+        assert res.status_code == 201, res.text
+        created_ids.append(res.json()["id"])
+
+    with db_session() as session:
+        assert archive_closed_schedules(session, retention_days=250, batch_size=1) == 2
+        assert session.query(Schedule).count() == 2
+        assert session.query(ScheduleArchive).count() == 2
+
+    res = client.get(f"/api/schedules/{club_id}", params={"size": 10}, headers=admin_headers)
+    assert res.status_code == 200, res.text
+    assert [s["id"] for s in res.json()["schedules"]] == created_ids
+
+    res = client.get(
+        f"/api/schedules/{club_id}",
+        params={"cursor": "", "size": 3, "with_total": "true"},
+        headers=admin_headers,
+    )
+    assert res.status_code == 200, res.text
+    data = res.json()
+    assert data["total"] == 4
+    assert [s["id"] for s in data["schedules"]] == created_ids[:3]
+
+    res = client.get(
+        f"/api/schedules/{club_id}",
+        params={"cursor": data["next_cursor"], "size": 3},
+        headers=admin_headers,
+    )
+    assert [s["id"] for s in res.json()["schedules"]] == created_ids[3:]
+
+
+# ---------------- Tests: CSV 내보내기 ----------------
+
+def test_export_schedules_csv(
+    client: TestClient,
+    admin_headers: dict,
+    signed_up_admin: dict,
+    created_asset: dict,
+):
+    """필터에 맞는 이력 전체를 CSV로 스트리밍"""
+    import csv
+    import io
+
+    club_id = signed_up_admin["club_id"]
+    base = datetime.now() + timedelta(days=1)
+    for i, status in enumerate(("pending", "cancelled", "pending")):
+        payload = {
+            "start_date": (base + timedelta(days=i)).isoformat(),
+            "end_date": (base + timedelta(days=i, hours=1)).isoformat(),
+            "asset_id": created_asset["id"],
+            "user_id": signed_up_admin["id"],
+            "status": status,
+        }
+        res = client.post(f"/api/schedules/{club_id}", json=payload, headers=admin_headers)
+        assert res.status_code == 201, res.text
+
+    res = client.get(
+        f"/api/schedules/{club_id}/export",
+        params={"status": "pending"},
+        headers=admin_headers,
+    )
+    assert res.status_code == 200, res.text
+    assert res.headers["content-type"].startswith("text/csv")
+    assert "attachment" in res.headers["content-disposition"]
+
+    rows = list(csv.reader(io.StringIO(res.content.decode("utf-8-sig"))))
+    assert rows[0][:3] == ["id", "asset_id", "asset_name"]
+    assert len(rows) == 3
+    assert all(row[7] == "pending" for row in rows[1:])
+    assert rows[1][2] == created_asset["name"]
+
+
+def test_export_csv_escapes_formulas():
+    """수식으로 시작하는 사용자 입력은 ' 를 붙여 내보냄"""
+    import csv
+    import io
+    from types import SimpleNamespace
+    from asset_management.app.schedule.export import iter_csv
+
+    row = SimpleNamespace(
+        id=1, asset_id=2, asset_name="=HYPERLINK(\"http://evil\")", user_id="u1", user_name="@SUM(A1)",
+        start_date=None, end_date=None, status="pending", updated_at=None,
+    )
+    content = b"".join(iter_csv([row])).decode("utf-8-sig")
+    [_, cells] = list(csv.reader(io.StringIO(content)))
+    assert cells[2] == "'=HYPERLINK(\"http://evil\")"
+    assert cells[3] == "u1"
+    assert cells[4] == "'@SUM(A1)"
+
+
+def test_export_schedules_without_auth(client: TestClient, signed_up_admin: dict):
+    """인증 없이 내보내기 불가"""
+    res = client.get(f"/api/schedules/{signed_up_admin['club_id']}/export")
+    assert res.status_code in [401, 403], res.text
@@ -78,7 +78,7 @@ def test_signup_success(client, db_session):
     with db_session() as session:
         user = session.query(User).filter(User.email == payload["email"]).one()
         assert user.hashed_password != payload["password"]
-        assert len(user.hashed_password) == 64
+        assert user.hashed_password.startswith("scrypt$")
 
 
 def test_signup_conflict_email(client):